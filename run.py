@@ -8,6 +8,7 @@ so imports work correctly regardless of where it's run from.
 
 import sys
 import os
+import importlib.util
 from pathlib import Path
 
 # Add project root to Python path
@@ -36,27 +37,38 @@ if not in_venv and venv_path.exists():
         print()
         sys.exit(1)
 
-# Run system checks and import main
-try:
-    from src.main import main
-except ImportError as e:
-    if 'venv' in str(e).lower() or 'EXTERNALLY-MANAGED' in str(e):
-        print("❌ Error: Python environment is externally managed.")
-        print()
-        print("You need to use a virtual environment. Options:")
-        print()
-        print("1. Run the setup helper:")
-        print(f"   python3 setup_venv.py")
-        print()
-        print("2. Or create manually:")
-        print(f"   python3 -m venv {venv_path}")
-        print(f"   source {venv_path}/bin/activate")
-        print(f"   python run.py")
+if __name__ == '__main__':
+    # Import main only once the venv check has passed. Locate it first so a
+    # missing package is not reported as an environment problem; find_spec
+    # raises rather than returning None when the parent package is missing.
+    try:
+        main_spec = sys.modules.get('src.main') or importlib.util.find_spec('src.main')
+    except ModuleNotFoundError:
+        main_spec = None
+    if main_spec is None:
+        print(f"❌ Error: Could not find the application package in {project_root}.")
         print()
+        print("Make sure run.py is in the project root next to the src/ directory.")
         sys.exit(1)
-    else:
-        raise
-
-if __name__ == '__main__':
+    
+    try:
+        from src.main import main
+    except ImportError as e:
+        if 'venv' in str(e).lower() or 'EXTERNALLY-MANAGED' in str(e):
+            print("❌ Error: Python environment is externally managed.")
+            print()
+            print("You need to use a virtual environment. Options:")
+            print()
+            print("1. Run the setup helper:")
+            print(f"   python3 setup_venv.py")
+            print()
+            print("2. Or create manually:")
+            print(f"   python3 -m venv {venv_path}")
+            print(f"   source {venv_path}/bin/activate")
+            print(f"   python run.py")
+            print()
+            sys.exit(1)
+        else:
+            raise
+    
     main()
-
@@ -10,16 +10,11 @@ import subprocess
 import os
 from pathlib import Path
 
-from src.utils.system_check import (
-    find_python_executable,
-    check_python_version,
-    check_venv_module,
-    check_virtual_environment
-)
-
 
 def create_venv(project_root: Path) -> bool:
     """Create virtual environment."""
+    from src.utils.system_check import find_python_executable
+    
     venv_path = project_root / 'venv'
     
     if venv_path.exists():
@@ -63,6 +58,12 @@ def main():
     print("🔍 Checking system configuration...")
     print()
     
+    from src.utils.system_check import (
+        check_python_version,
+        check_venv_module,
+        check_virtual_environment
+    )
+    
     # Check Python version
     ok, error = check_python_version()
     if not ok:
@@ -5,12 +5,21 @@ asusctl Interface Module
 Handles communication with asusctl for fan control operations.
 """
 
+import bisect
 import subprocess
 import json
 import re
+import time
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+
+
+# Line classifiers for `asusctl fan-curve` output
+_FAN_HEADER_RE = re.compile(r'fan|cpu|gpu', re.IGNORECASE)
+_DATA_LINE_RE = re.compile(r'\s*\d+(?:\s+\d+)+\s*$')
+
 
 class Profile(Enum):
     """ASUS power profiles."""
@@ -22,6 +31,8 @@ class Profile(Enum):
 class FanCurvePoint:
     """Represents a single point in a fan curve."""
     
+    __slots__ = ('temperature', 'fan_speed')
+    
     def __init__(self, temperature: int, fan_speed: int):
         """
         Initialize a fan curve point.
@@ -50,7 +61,14 @@ class FanCurvePoint:
 
 
 class FanCurve:
-    """Represents a complete fan curve."""
+    """
+    Represents a complete fan curve.
+    
+    Temperatures and fan speeds are stored as two parallel lists sorted by
+    temperature, so lookups can bisect plain ints without touching point objects.
+    """
+    
+    __slots__ = ('_temps', '_speeds', '_fmt_cache', '_arrays')
     
     def __init__(self, points: List[FanCurvePoint] = None):
         """
@@ -59,55 +77,102 @@ class FanCurve:
         Args:
             points: List of FanCurvePoint objects (sorted by temperature)
         """
-        self.points = sorted(points or [], key=lambda p: p.temperature)
+        ordered = sorted(points or [], key=lambda p: p.temperature)
+        self._temps = [p.temperature for p in ordered]
+        self._speeds = [p.fan_speed for p in ordered]
+        self._fmt_cache: Optional[str] = None
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
         self._validate()
     
+    @property
+    def points(self) -> List[FanCurvePoint]:
+        """Curve points sorted by temperature (built on demand)."""
+        return [FanCurvePoint(t, s) for t, s in zip(self._temps, self._speeds)]
+    
+    @property
+    def temperatures(self) -> Tuple[int, ...]:
+        """Point temperatures in ascending order."""
+        return tuple(self._temps)
+    
+    @property
+    def speeds(self) -> Tuple[int, ...]:
+        """Point fan speeds, in the same order as temperatures."""
+        return tuple(self._speeds)
+    
+    def copy(self) -> 'FanCurve':
+        """Return an independent copy of this (already validated) curve."""
+        curve = type(self).__new__(type(self))
+        curve._temps = list(self._temps)
+        curve._speeds = list(self._speeds)
+        curve._fmt_cache = self._fmt_cache
+        curve._arrays = self._arrays
+        return curve
+    
     def _validate(self):
         """Validate the fan curve."""
-        if not self.points:
+        if not self._temps:
             raise ValueError("Fan curve must have at least one point")
         
-        if len(self.points) < 2:
+        if len(self._temps) < 2:
             raise ValueError("Fan curve must have at least 2 points")
         
-        # Check for duplicate temperatures
-        temps = [p.temperature for p in self.points]
-        if len(temps) != len(set(temps)):
-            raise ValueError("Fan curve cannot have duplicate temperatures")
-        
-        # Ensure monotonic (non-decreasing fan speed with temperature)
-        speeds = [p.fan_speed for p in self.points]
-        for i in range(1, len(speeds)):
-            if speeds[i] < speeds[i-1]:
+        # Temperatures are sorted, so duplicates are adjacent; check them and
+        # monotonic (non-decreasing) fan speed in one pass
+        # (point values are clamped non-negative, so -1 is a safe sentinel)
+        prev_t = prev_s = -1
+        for t, s in zip(self._temps, self._speeds):
+            if t == prev_t:
+                raise ValueError("Fan curve cannot have duplicate temperatures")
+            if s < prev_s:
                 raise ValueError("Fan speed must not decrease as temperature increases")
+            prev_t, prev_s = t, s
     
     def add_point(self, temperature: int, fan_speed: int):
         """Add a point to the curve (maintains sorting)."""
-        # Remove existing point at this temperature if any
-        self.points = [p for p in self.points if p.temperature != temperature]
+        point = FanCurvePoint(temperature, fan_speed)
+        self._fmt_cache = None
+        self._arrays = None
         
-        # Add new point and sort
-        self.points.append(FanCurvePoint(temperature, fan_speed))
-        self.points = sorted(self.points, key=lambda p: p.temperature)
+        # Replace existing point at this temperature, or insert in sorted position
+        i = bisect.bisect_left(self._temps, point.temperature)
+        replaced = None
+        if i < len(self._temps) and self._temps[i] == point.temperature:
+            replaced = self._speeds[i]
+            self._speeds[i] = point.fan_speed
+        else:
+            self._temps.insert(i, point.temperature)
+            self._speeds.insert(i, point.fan_speed)
         
         # Validate
         try:
             self._validate()
-        except ValueError as e:
-            # Remove the problematic point
-            self.points = [p for p in self.points if p.temperature != temperature]
-            raise e
+        except ValueError:
+            # Undo the change
+            if replaced is not None:
+                self._speeds[i] = replaced
+            else:
+                del self._temps[i]
+                del self._speeds[i]
+            raise
     
     def remove_point(self, temperature: int):
         """Remove a point from the curve."""
-        if len(self.points) <= 2:
+        if len(self._temps) <= 2:
             raise ValueError("Cannot remove point: fan curve must have at least 2 points")
         
-        self.points = [p for p in self.points if p.temperature != temperature]
+        i = bisect.bisect_left(self._temps, temperature)
+        if i < len(self._temps) and self._temps[i] == temperature:
+            del self._temps[i]
+            del self._speeds[i]
+            self._fmt_cache = None
+            self._arrays = None
     
     def to_asusctl_format(self) -> str:
         """Convert to asusctl format: space-separated '<temp> <speed>' pairs"""
-        return " ".join(p.to_asusctl_format() for p in self.points)
+        # Cached until the curve is modified
+        if self._fmt_cache is None:
+            self._fmt_cache = " ".join(f"{t} {s}" for t, s in zip(self._temps, self._speeds))
+        return self._fmt_cache
     
     @classmethod
     def from_asusctl_format(cls, data: str) -> 'FanCurve':
@@ -116,18 +181,18 @@ class FanCurve:
         if len(parts) % 2 != 0:
             raise ValueError("Invalid fan curve format: must have pairs of temperature and speed")
         
-        points = []
-        for i in range(0, len(parts), 2):
-            temp = int(parts[i])
-            speed = int(parts[i + 1])
-            points.append(FanCurvePoint(temp, speed))
+        values = list(map(int, parts))
+        points = [FanCurvePoint(t, s) for t, s in zip(values[0::2], values[1::2])]
         
         return cls(points)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
         return {
-            'points': [{'temperature': p.temperature, 'fan_speed': p.fan_speed} for p in self.points]
+            'points': [
+                {'temperature': t, 'fan_speed': s}
+                for t, s in zip(self._temps, self._speeds)
+            ]
         }
     
     @classmethod
@@ -136,67 +201,177 @@ class FanCurve:
         points = [FanCurvePoint(p['temperature'], p['fan_speed']) for p in data['points']]
         return cls(points)
     
+    @classmethod
+    def _unchecked(cls, temps: List[int], speeds: List[int]) -> 'FanCurve':
+        """
+        Build a curve from parallel lists without sorting, clamping or validation.
+        
+        Only for data this application wrote itself (e.g. saved profiles).
+        """
+        curve = cls.__new__(cls)
+        curve._temps = temps
+        curve._speeds = speeds
+        curve._fmt_cache = None
+        curve._arrays = None
+        return curve
+    
+    @classmethod
+    def _from_dict_unchecked(cls, data: Dict) -> 'FanCurve':
+        """Create from a trusted dictionary produced by to_dict()."""
+        points = data['points']
+        return cls._unchecked(
+            [p['temperature'] for p in points],
+            [p['fan_speed'] for p in points]
+        )
+    
     def get_fan_speed_at_temp(self, temperature: int) -> int:
         """Get fan speed for a given temperature (linear interpolation)."""
-        if not self.points:
+        temps, speeds = self._temps, self._speeds
+        if not temps:
             return 0
         
-        # Find surrounding points
-        if temperature <= self.points[0].temperature:
-            return self.points[0].fan_speed
+        # Clamp outside the curve
+        if temperature <= temps[0]:
+            return speeds[0]
         
-        if temperature >= self.points[-1].temperature:
-            return self.points[-1].fan_speed
+        if temperature >= temps[-1]:
+            return speeds[-1]
         
-        # Linear interpolation
-        for i in range(len(self.points) - 1):
-            if self.points[i].temperature <= temperature <= self.points[i + 1].temperature:
-                t1, s1 = self.points[i].temperature, self.points[i].fan_speed
-                t2, s2 = self.points[i + 1].temperature, self.points[i + 1].fan_speed
-                
-                if t2 == t1:
-                    return s1
-                
-                # Linear interpolation
-                speed = s1 + (s2 - s1) * (temperature - t1) / (t2 - t1)
-                return int(round(speed))
+        # Binary search for the surrounding segment, then linearly interpolate
+        i = bisect.bisect_right(temps, temperature)
+        t1, s1 = temps[i - 1], speeds[i - 1]
+        t2, s2 = temps[i], speeds[i]
+        
+        speed = s1 + (s2 - s1) * (temperature - t1) / (t2 - t1)
+        return int(round(speed))
+    
+    def get_fan_speeds_at_temps(self, temperatures) -> np.ndarray:
+        """
+        Get fan speeds for many temperatures at once.
         
-        return self.points[-1].fan_speed
+        Same interpolation and clamping as get_fan_speed_at_temp, but the
+        speeds are returned as floats without rounding.
+        """
+        # Arrays are cached until the curve is modified; copies may share
+        # them since they are never written to
+        if self._arrays is None:
+            self._arrays = (
+                np.asarray(self._temps, dtype=np.float64),
+                np.asarray(self._speeds, dtype=np.float64),
+            )
+        temps, speeds = self._arrays
+        return np.interp(temperatures, temps, speeds)
+
+
+class _DbusBackend:
+    """
+    Talks to the asusd daemon directly over the system D-Bus.
+    
+    Avoids spawning an asusctl process for profile queries and changes.
+    Fan curve operations still go through the asusctl CLI.
+    """
+    
+    BUS_NAME = 'org.asuslinux.Daemon'
+    PROFILE_PATH = '/org/asuslinux/Profile'
+    
+    # asusd encodes platform profiles as integers in this order
+    PROFILES = (Profile.BALANCED, Profile.PERFORMANCE, Profile.QUIET)
+    
+    def __init__(self, profile_proxy):
+        self._profile_proxy = profile_proxy
+    
+    @classmethod
+    def connect(cls) -> Optional['_DbusBackend']:
+        """Connect to asusd, returning None if pydbus or the daemon is unavailable."""
+        try:
+            from pydbus import SystemBus
+            bus = SystemBus()
+            return cls(bus.get(cls.BUS_NAME, cls.PROFILE_PATH))
+        except Exception:
+            return None
+    
+    def get_profile(self) -> Optional[Profile]:
+        """Get the active platform profile."""
+        index = self._profile_proxy.ActiveProfile()
+        if 0 <= index < len(self.PROFILES):
+            return self.PROFILES[index]
+        return None
+    
+    def set_profile(self, profile: Profile):
+        """Set the active platform profile."""
+        self._profile_proxy.SetActiveProfile(self.PROFILES.index(profile))
 
 
 class AsusctlInterface:
     """Interface for communicating with asusctl."""
     
-    def __init__(self):
-        """Initialize the asusctl interface."""
-        self._check_asusctl_available()
+    # How long a queried profile is reused before asking asusd again (seconds)
+    PROFILE_CACHE_TTL = 1.0
+    
+    def __init__(self, use_dbus: bool = True):
+        """
+        Initialize the asusctl interface.
+        
+        Args:
+            use_dbus: Talk to asusd over D-Bus where possible, falling back
+                to the asusctl CLI when D-Bus is unavailable
+        """
+        self._available = self._check_asusctl_available()
+        self._dbus = _DbusBackend.connect() if use_dbus else None
+        self._profile_cache: Optional[Tuple[Optional[Profile], float]] = None
     
     def _check_asusctl_available(self) -> bool:
         """Check if asusctl is available."""
         try:
-            result = subprocess.run(
-                ['asusctl', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
+            result = self._run(['asusctl', '--version'], timeout=2)
             return result.returncode == 0
         except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
     
+    def _run(self, args: List[str], timeout: int = 5) -> subprocess.CompletedProcess:
+        """
+        Run an asusctl command and capture its text output.
+        
+        close_fds=False lets CPython use the posix_spawn fast path instead of
+        closing every inherited descriptor before exec.
+        """
+        return subprocess.run(
+            args,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            close_fds=False
+        )
+    
     def is_available(self) -> bool:
-        """Check if asusctl is available."""
-        return self._check_asusctl_available()
+        """Check if asusctl is available (cached from the last probe)."""
+        return self._available
+    
+    def refresh(self) -> bool:
+        """Re-probe asusctl availability and update the cached result."""
+        self._available = self._check_asusctl_available()
+        return self._available
     
     def get_current_profile(self) -> Optional[Profile]:
-        """Get the current power profile."""
+        """Get the current power profile (cached for PROFILE_CACHE_TTL seconds)."""
+        now = time.monotonic()
+        if self._profile_cache and now - self._profile_cache[1] < self.PROFILE_CACHE_TTL:
+            return self._profile_cache[0]
+        
+        profile = self._query_current_profile()
+        self._profile_cache = (profile, now)
+        return profile
+    
+    def _query_current_profile(self) -> Optional[Profile]:
+        """Query the current power profile from asusd or asusctl."""
+        if self._dbus:
+            try:
+                return self._dbus.get_profile()
+            except Exception:
+                pass
+        
         try:
-            result = subprocess.run(
-                ['asusctl', 'profile', '-p'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
+            result = self._run(['asusctl', 'profile', '-p'], timeout=2)
             
             if result.returncode == 0:
                 output = result.stdout.strip().lower()
@@ -218,25 +393,25 @@ class AsusctlInterface:
         Returns:
             Tuple of (success: bool, message: str)
         """
+        if self._dbus:
+            try:
+                self._dbus.set_profile(profile)
+                self._profile_cache = (profile, time.monotonic())
+                return True, f"Profile set to {profile.value}"
+            except Exception:
+                pass
+        
         try:
-            profile_map = {
-                Profile.BALANCED: 'Balanced',
-                Profile.QUIET: 'Quiet',
-                Profile.PERFORMANCE: 'Performance'
-            }
-            
-            result = subprocess.run(
-                ['asusctl', 'profile', '-P', profile_map[profile]],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._run(['asusctl', 'profile', '-P', profile.value])
             
             if result.returncode == 0:
+                self._profile_cache = (profile, time.monotonic())
                 return True, f"Profile set to {profile.value}"
             else:
+                self._profile_cache = None
                 return False, result.stderr or result.stdout
         except Exception as e:
+            self._profile_cache = None
             return False, str(e)
     
     def get_fan_curves(self, profile: Profile) -> Dict[str, FanCurve]:
@@ -249,18 +424,7 @@ class AsusctlInterface:
         curves = {}
         
         try:
-            profile_map = {
-                Profile.BALANCED: 'Balanced',
-                Profile.QUIET: 'Quiet',
-                Profile.PERFORMANCE: 'Performance'
-            }
-            
-            result = subprocess.run(
-                ['asusctl', 'fan-curve', '--mod-profile', profile_map[profile]],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._run(['asusctl', 'fan-curve', '--mod-profile', profile.value])
             
             if result.returncode == 0:
                 # Parse output - format varies, need to extract curve data
@@ -271,7 +435,7 @@ class AsusctlInterface:
                 
                 for line in lines:
                     # Look for fan identifiers
-                    if 'fan' in line.lower() or 'cpu' in line.lower() or 'gpu' in line.lower():
+                    if _FAN_HEADER_RE.search(line):
                         if current_fan and current_curve_data:
                             try:
                                 curve_str = ' '.join(current_curve_data)
@@ -284,9 +448,8 @@ class AsusctlInterface:
                         current_curve_data = []
                     else:
                         # Try to parse as curve data
-                        parts = line.strip().split()
-                        if len(parts) >= 2 and all(p.isdigit() for p in parts):
-                            current_curve_data.extend(parts)
+                        if _DATA_LINE_RE.match(line):
+                            current_curve_data.extend(line.split())
                 
                 # Handle last fan
                 if current_fan and current_curve_data:
@@ -318,25 +481,14 @@ class AsusctlInterface:
             Tuple of (success: bool, message: str)
         """
         try:
-            profile_map = {
-                Profile.BALANCED: 'Balanced',
-                Profile.QUIET: 'Quiet',
-                Profile.PERFORMANCE: 'Performance'
-            }
-            
             curve_data = curve.to_asusctl_format()
             
-            result = subprocess.run(
-                [
-                    'asusctl', 'fan-curve',
-                    '--mod-profile', profile_map[profile],
-                    '--fan', fan_name,
-                    '--data', curve_data
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._run([
+                'asusctl', 'fan-curve',
+                '--mod-profile', profile.value,
+                '--fan', fan_name,
+                '--data', curve_data
+            ])
             
             if result.returncode == 0:
                 return True, f"Fan curve set for {fan_name}"
@@ -353,22 +505,11 @@ class AsusctlInterface:
             Tuple of (success: bool, message: str)
         """
         try:
-            profile_map = {
-                Profile.BALANCED: 'Balanced',
-                Profile.QUIET: 'Quiet',
-                Profile.PERFORMANCE: 'Performance'
-            }
-            
-            result = subprocess.run(
-                [
-                    'asusctl', 'fan-curve',
-                    '--mod-profile', profile_map[profile],
-                    '--enable-fan-curves', str(enabled).lower()
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._run([
+                'asusctl', 'fan-curve',
+                '--mod-profile', profile.value,
+                '--enable-fan-curves', str(enabled).lower()
+            ])
             
             if result.returncode == 0:
                 status = "enabled" if enabled else "disabled"
@@ -381,12 +522,7 @@ class AsusctlInterface:
     def get_fan_curve_enabled(self, profile: Profile) -> Optional[bool]:
         """Check if fan curves are enabled for a profile."""
         try:
-            result = subprocess.run(
-                ['asusctl', 'fan-curve', '--get-enabled'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
+            result = self._run(['asusctl', 'fan-curve', '--get-enabled'], timeout=2)
             
             if result.returncode == 0:
                 output = result.stdout.strip().lower()
@@ -425,24 +561,13 @@ class AsusctlInterface:
             
             # Set fan to 100% using a temporary curve
             curve_data = max_curve.to_asusctl_format()
-            profile_map = {
-                Profile.BALANCED: 'Balanced',
-                Profile.QUIET: 'Quiet',
-                Profile.PERFORMANCE: 'Performance'
-            }
-            
             # Apply max curve
-            result = subprocess.run(
-                [
-                    'asusctl', 'fan-curve',
-                    '--mod-profile', profile_map[current_profile],
-                    '--fan', fan_name,
-                    '--data', curve_data
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._run([
+                'asusctl', 'fan-curve',
+                '--mod-profile', current_profile.value,
+                '--fan', fan_name,
+                '--data', curve_data
+            ])
             
             if result.returncode != 0:
                 return False, f"Failed to set fan to 100%: {result.stderr or result.stdout}"
@@ -455,7 +580,47 @@ class AsusctlInterface:
             return False, str(e)
 
 
-# Preset fan curves
+# Preset fan curves, built once at import
+_PRESETS = {
+    'quiet': FanCurve([
+        FanCurvePoint(30, 20),
+        FanCurvePoint(50, 30),
+        FanCurvePoint(70, 50),
+        FanCurvePoint(85, 70),
+    ]),
+    'silent': FanCurve([
+        FanCurvePoint(30, 15),
+        FanCurvePoint(50, 25),
+        FanCurvePoint(70, 45),
+        FanCurvePoint(85, 65),
+    ]),
+    'balanced': FanCurve([
+        FanCurvePoint(30, 30),
+        FanCurvePoint(50, 45),
+        FanCurvePoint(70, 65),
+        FanCurvePoint(85, 85),
+    ]),
+    'performance': FanCurve([
+        FanCurvePoint(30, 40),
+        FanCurvePoint(50, 60),
+        FanCurvePoint(70, 80),
+        FanCurvePoint(85, 100),
+    ]),
+    'conservative': FanCurve([
+        FanCurvePoint(30, 30),
+        FanCurvePoint(50, 60),
+        FanCurvePoint(54, 100),  # 100% at ~60% utilization (54°C)
+        FanCurvePoint(85, 100),
+    ]),
+    'max': FanCurve([
+        FanCurvePoint(30, 100),
+        FanCurvePoint(50, 100),
+        FanCurvePoint(70, 100),
+        FanCurvePoint(85, 100),
+    ]),
+}
+
+
 def get_preset_curve(name: str) -> FanCurve:
     """
     Get a preset fan curve.
@@ -466,46 +631,7 @@ def get_preset_curve(name: str) -> FanCurve:
     - 'performance': Aggressive cooling, higher fan speeds
     - 'conservative': Fan at 100% at 60% utilization (54°C equivalent)
     - 'max': Maximum fan speed at all times
+    
+    Returns a copy, so callers may modify the curve freely.
     """
-    presets = {
-        'quiet': FanCurve([
-            FanCurvePoint(30, 20),
-            FanCurvePoint(50, 30),
-            FanCurvePoint(70, 50),
-            FanCurvePoint(85, 70),
-        ]),
-        'silent': FanCurve([
-            FanCurvePoint(30, 15),
-            FanCurvePoint(50, 25),
-            FanCurvePoint(70, 45),
-            FanCurvePoint(85, 65),
-        ]),
-        'balanced': FanCurve([
-            FanCurvePoint(30, 30),
-            FanCurvePoint(50, 45),
-            FanCurvePoint(70, 65),
-            FanCurvePoint(85, 85),
-        ]),
-        'performance': FanCurve([
-            FanCurvePoint(30, 40),
-            FanCurvePoint(50, 60),
-            FanCurvePoint(70, 80),
-            FanCurvePoint(85, 100),
-        ]),
-        'conservative': FanCurve([
-            FanCurvePoint(30, 30),
-            FanCurvePoint(50, 60),
-            FanCurvePoint(54, 100),  # 100% at ~60% utilization (54°C)
-            FanCurvePoint(85, 100),
-        ]),
-        'max': FanCurve([
-            FanCurvePoint(30, 100),
-            FanCurvePoint(50, 100),
-            FanCurvePoint(70, 100),
-            FanCurvePoint(85, 100),
-        ]),
-    }
-    
-    return presets.get(name.lower(), presets['balanced'])
-
-
+    return _PRESETS.get(name.lower(), _PRESETS['balanced']).copy()
@@ -6,13 +6,33 @@ Manages fan curve profiles with save/load functionality.
 """
 
 import json
-import yaml
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from .asusctl_interface import FanCurve, Profile as AsusProfile
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+# Upper bound on threads used to read profile files in parallel
+_MAX_READ_WORKERS = 4
+
+
+def _read_json_file(path: str):
+    """Read and decode a JSON file."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
 
 class SavedProfile:
     """Represents a saved fan curve profile."""
@@ -52,13 +72,27 @@ class SavedProfile:
     @classmethod
     def from_dict(cls, data: Dict) -> 'SavedProfile':
         """Create from dictionary."""
+        return cls._from_dict(data, FanCurve.from_dict)
+    
+    @classmethod
+    def _from_dict_fast(cls, data: Dict) -> 'SavedProfile':
+        """
+        Create from a dictionary written by save_profile.
+        
+        Skips fan curve clamping and validation; use from_dict for
+        user-supplied data such as imports.
+        """
+        return cls._from_dict(data, FanCurve._from_dict_unchecked)
+    
+    @classmethod
+    def _from_dict(cls, data: Dict, curve_from_dict) -> 'SavedProfile':
         cpu_curve = None
         gpu_curve = None
         
         if 'cpu_fan_curve' in data:
-            cpu_curve = FanCurve.from_dict(data['cpu_fan_curve'])
+            cpu_curve = curve_from_dict(data['cpu_fan_curve'])
         if 'gpu_fan_curve' in data:
-            gpu_curve = FanCurve.from_dict(data['gpu_fan_curve'])
+            gpu_curve = curve_from_dict(data['gpu_fan_curve'])
         
         return cls(
             name=data['name'],
@@ -84,9 +118,14 @@ class ProfileManager:
             profiles_dir = Path.home() / '.config' / 'asus-control' / 'profiles'
         
         self.profiles_dir = Path(profiles_dir)
-        self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        # One stat in the common case, instead of a mkdir walk up the tree
+        if not self.profiles_dir.is_dir():
+            self.profiles_dir.mkdir(parents=True, exist_ok=True)
         
         self.profiles: Dict[str, SavedProfile] = {}
+        self._sorted_names: Optional[List[str]] = None
+        # (path, mtime, size) of each profile file as of the last full load
+        self._files_snapshot: Optional[frozenset] = None
         self.load_all_profiles()
     
     def get_profile_path(self, name: str) -> Path:
@@ -107,10 +146,12 @@ class ProfileManager:
             path = self.get_profile_path(profile.name)
             data = profile.to_dict()
             
-            with open(path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Compact form on disk; export_profile writes the human-readable one
+            with open(path, 'wb') as f:
+                f.write(_json_dumps(data))
             
             self.profiles[profile.name] = profile
+            self._sorted_names = None
             return True
         except Exception as e:
             print(f"Error saving profile: {e}")
@@ -126,26 +167,63 @@ class ProfileManager:
             with open(path, 'r') as f:
                 data = json.load(f)
             
-            profile = SavedProfile.from_dict(data)
+            profile = SavedProfile._from_dict_fast(data)
             self.profiles[name] = profile
+            self._sorted_names = None
             return profile
         except Exception as e:
             print(f"Error loading profile: {e}")
             return None
     
+    def _scan_profile_files(self) -> Dict[str, Tuple[int, int]]:
+        """Map each profile file path to its (mtime_ns, size)."""
+        files = {}
+        try:
+            with os.scandir(self.profiles_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        st = entry.stat()
+                        files[entry.path] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            pass
+        return files
+    
     def load_all_profiles(self):
         """Load all profiles from disk."""
+        self._load_files(self._scan_profile_files())
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Reload all profiles only if a profile file was added, removed or modified
+        since the last full load.
+        
+        Returns:
+            True if profiles were reloaded
+        """
+        files = self._scan_profile_files()
+        if frozenset(files.items()) == self._files_snapshot:
+            return False
+        self._load_files(files)
+        return True
+    
+    def _load_files(self, files: Dict[str, Tuple[int, int]]):
+        """Replace the loaded profiles with the given profile files."""
         self.profiles.clear()
+        self._sorted_names = None
+        self._files_snapshot = frozenset(files.items())
         
-        if not self.profiles_dir.exists():
+        paths = list(files)
+        if not paths:
             return
         
-        for path in self.profiles_dir.glob('*.json'):
+        # Profile files are independent, so read them concurrently; build the
+        # SavedProfile objects here on the calling thread
+        with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(paths))) as ex:
+            futures = [ex.submit(_read_json_file, path) for path in paths]
+        
+        for path, future in zip(paths, futures):
             try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                
-                profile = SavedProfile.from_dict(data)
+                profile = SavedProfile._from_dict_fast(future.result())
                 self.profiles[profile.name] = profile
             except Exception as e:
                 print(f"Error loading profile from {path}: {e}")
@@ -164,6 +242,7 @@ class ProfileManager:
             
             if name in self.profiles:
                 del self.profiles[name]
+                self._sorted_names = None
             
             return True
         except Exception as e:
@@ -171,8 +250,15 @@ class ProfileManager:
             return False
     
     def list_profiles(self) -> List[str]:
-        """Get list of all profile names."""
-        return sorted(self.profiles.keys())
+        """
+        Get list of all profile names.
+        
+        The sorted list is cached until profiles are saved, loaded or deleted;
+        callers must not modify it.
+        """
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self.profiles.keys())
+        return self._sorted_names
     
     def get_profile(self, name: str) -> Optional[SavedProfile]:
         """Get a profile by name."""
@@ -198,7 +284,9 @@ class ProfileManager:
             data = profile.to_dict()
             
             if format.lower() == 'yaml':
-                if not YAML_AVAILABLE:
+                try:
+                    import yaml
+                except ImportError:
                     raise ImportError("PyYAML is required for YAML export")
                 with open(export_path, 'w') as f:
                     yaml.dump(data, f, default_flow_style=False, sort_keys=False)
@@ -221,7 +309,9 @@ class ProfileManager:
         try:
             with open(import_path, 'r') as f:
                 if import_path.suffix.lower() in ['.yaml', '.yml']:
-                    if not YAML_AVAILABLE:
+                    try:
+                        import yaml
+                    except ImportError:
                         raise ImportError("PyYAML is required for YAML import")
                     data = yaml.safe_load(f)
                 else:
@@ -49,6 +49,56 @@ from src.ui.dependency_dialog import DependencyDialog
 from src.ui.main_window import MainWindow
 
 
+# Modern, minimalist application styling
+_APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #fafafa;
+    }
+    QTabWidget::pane {
+        border: none;
+        background: white;
+    }
+    QTabBar::tab {
+        background: #f5f5f5;
+        color: #666;
+        padding: 12px 24px;
+        margin-right: 2px;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+    }
+    QTabBar::tab:selected {
+        background: white;
+        color: #2196F3;
+        font-weight: bold;
+    }
+    QTabBar::tab:hover {
+        background: #eeeeee;
+    }
+    QStatusBar {
+        background-color: #f5f5f5;
+        color: #666;
+        border-top: 1px solid #e0e0e0;
+    }
+"""
+
+
+def _get_application() -> QApplication:
+    """
+    Return the QApplication, creating and configuring it on first use.
+    
+    Creating one is expensive (platform plugin, fonts, display connection),
+    so the dependency dialog and the main window share a single instance.
+    High DPI scaling is enabled by default in PyQt6.
+    """
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+        app.setApplicationName("Daemon Breathalyzer")
+        app.setOrganizationName("Daemon Breathalyzer")
+        app.setStyleSheet(_APP_STYLESHEET)
+    return app
+
+
 def check_dependencies_before_startup():
     """Check dependencies and show dialog if needed."""
     # First, check if PyQt6 is available (needed for the dialog itself)
@@ -66,20 +116,14 @@ def check_dependencies_before_startup():
     results = checker.check_all()
     
     if not results['required_installed']:
-        # Create minimal app for dialog
-        app = QApplication(sys.argv)
-        app.setApplicationName("ASUS Fan Control")
-        app.setOrganizationName("ASUS Control")
-        # High DPI scaling is enabled by default in PyQt6
-    # AA_EnableHighDpiScaling was removed in PyQt6
+        # Created once here and kept for main() to reuse
+        _get_application()
         
         dialog = DependencyDialog()
         dialog.exec()
         
-        # Re-check after dialog closes
-        results = checker.check_all()
-        
-        if not results['required_installed']:
+        # Re-check after dialog closes (re-probed only if something changed)
+        if not dialog.can_continue():
             QMessageBox.critical(
                 None,
                 "Missing Dependencies",
@@ -97,8 +141,6 @@ def check_dependencies_before_startup():
             )
             if response == QMessageBox.StandardButton.No:
                 return False
-        
-        app.quit()
     
     return True
 
@@ -109,46 +151,8 @@ def main():
     if not check_dependencies_before_startup():
         sys.exit(1)
     
-    # Create QApplication
-    app = QApplication(sys.argv)
-    app.setApplicationName("Daemon Breathalyzer")
-    app.setOrganizationName("Daemon Breathalyzer")
-    
-    # Enable high DPI scaling
-    # High DPI scaling is enabled by default in PyQt6
-    # AA_EnableHighDpiScaling was removed in PyQt6
-    
-    # Apply modern, minimalist styling
-    app.setStyleSheet("""
-        QMainWindow {
-            background-color: #fafafa;
-        }
-        QTabWidget::pane {
-            border: none;
-            background: white;
-        }
-        QTabBar::tab {
-            background: #f5f5f5;
-            color: #666;
-            padding: 12px 24px;
-            margin-right: 2px;
-            border-top-left-radius: 8px;
-            border-top-right-radius: 8px;
-        }
-        QTabBar::tab:selected {
-            background: white;
-            color: #2196F3;
-            font-weight: bold;
-        }
-        QTabBar::tab:hover {
-            background: #eeeeee;
-        }
-        QStatusBar {
-            background-color: #f5f5f5;
-            color: #666;
-            border-top: 1px solid #e0e0e0;
-        }
-    """)
+    # Reuse the QApplication if the dependency dialog already created it
+    app = _get_application()
     
     # Create and show main window
     window = MainWindow()
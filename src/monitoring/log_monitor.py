@@ -6,15 +6,26 @@ Monitors system logs via journalctl, providing real-time log streaming
 with filtering and error tracking capabilities.
 """
 
+import os
+import selectors
 import subprocess
 import json
-from typing import Dict, List, Optional, Callable
-from threading import Thread, Event
+import time
+from typing import Dict, List, Optional, Callable, Tuple
+from threading import Thread, Event, Lock
 from queue import Queue, Empty
 from datetime import datetime, timedelta
 from collections import deque
 from enum import Enum
 
+from ..utils.process import run_streaming
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class LogPriority(Enum):
     """Log priority levels matching systemd/journalctl."""
@@ -30,81 +41,164 @@ class LogPriority(Enum):
     @classmethod
     def from_string(cls, priority_str: str) -> 'LogPriority':
         """Convert string priority to enum."""
-        priority_map = {
-            '0': cls.EMERG,
-            '1': cls.ALERT,
-            '2': cls.CRIT,
-            '3': cls.ERR,
-            '4': cls.WARNING,
-            '5': cls.NOTICE,
-            '6': cls.INFO,
-            '7': cls.DEBUG,
-            'emerg': cls.EMERG,
-            'alert': cls.ALERT,
-            'crit': cls.CRIT,
-            'err': cls.ERR,
-            'error': cls.ERR,
-            'warning': cls.WARNING,
-            'warn': cls.WARNING,
-            'notice': cls.NOTICE,
-            'info': cls.INFO,
-            'debug': cls.DEBUG,
-        }
-        return priority_map.get(priority_str.lower(), cls.INFO)
+        # journald sends a single digit; names are accepted for convenience
+        if len(priority_str) == 1 and '0' <= priority_str <= '7':
+            return _PRIORITY_BY_DIGIT[ord(priority_str) - 48]
+        return _PRIORITY_BY_NAME.get(priority_str.lower(), cls.INFO)
     
     def color_code(self) -> str:
         """Get color code for this priority level."""
-        color_map = {
-            LogPriority.EMERG: '#FFFFFF',      # White text
-            LogPriority.ALERT: '#FFFFFF',      # White text
-            LogPriority.CRIT: '#FFFFFF',       # White text
-            LogPriority.ERR: '#F44336',        # Red
-            LogPriority.WARNING: '#FF9800',    # Orange
-            LogPriority.NOTICE: '#2196F3',     # Blue
-            LogPriority.INFO: '#2196F3',       # Blue
-            LogPriority.DEBUG: '#9E9E9E',      # Gray
-        }
-        return color_map.get(self, '#212121')
+        return _PRIORITY_COLORS[self.value]
     
     def bg_color_code(self) -> Optional[str]:
         """Get background color for critical priorities."""
-        if self in [LogPriority.EMERG, LogPriority.ALERT, LogPriority.CRIT]:
-            return '#F44336'  # Red background
-        return None
+        return _PRIORITY_BG_COLORS[self.value]
+
+
+# Lookup tables for LogPriority, indexed by priority value
+_PRIORITY_BY_DIGIT = tuple(LogPriority)
+
+_PRIORITY_BY_NAME = {
+    'emerg': LogPriority.EMERG,
+    'alert': LogPriority.ALERT,
+    'crit': LogPriority.CRIT,
+    'err': LogPriority.ERR,
+    'error': LogPriority.ERR,
+    'warning': LogPriority.WARNING,
+    'warn': LogPriority.WARNING,
+    'notice': LogPriority.NOTICE,
+    'info': LogPriority.INFO,
+    'debug': LogPriority.DEBUG,
+}
+
+_PRIORITY_COLORS = (
+    '#FFFFFF',  # EMERG: white text
+    '#FFFFFF',  # ALERT: white text
+    '#FFFFFF',  # CRIT: white text
+    '#F44336',  # ERR: red
+    '#FF9800',  # WARNING: orange
+    '#2196F3',  # NOTICE: blue
+    '#2196F3',  # INFO: blue
+    '#9E9E9E',  # DEBUG: gray
+)
+
+_PRIORITY_BG_COLORS = (
+    '#F44336',  # EMERG: red background
+    '#F44336',  # ALERT: red background
+    '#F44336',  # CRIT: red background
+    None, None, None, None, None,
+)
+
+
+def _as_text(value) -> str:
+    """
+    Coerce a journal field to str.
+    
+    journalctl -o json emits null for fields over its size limit and an
+    array of byte values for non-UTF-8 fields.
+    """
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        try:
+            return bytes(value).decode('utf-8', 'replace')
+        except (TypeError, ValueError):
+            pass
+    return str(value)
+
+
+# Only the journal fields LogEntry reads; journalctl then skips serialising
+# the rest (cgroup, capabilities, command line, ...) for every record
+_JOURNAL_FIELDS = '--output-fields=' + ','.join((
+    '__REALTIME_TIMESTAMP', '__CURSOR', 'PRIORITY', 'MESSAGE',
+    '_SYSTEMD_UNIT', 'SYSLOG_IDENTIFIER', '_PID', '_HOSTNAME', '_BOOT_ID',
+))
+
+# Raw source name -> (cleaned name, lowercased name). Unit names repeat across
+# thousands of entries, so each distinct one is cleaned once; the cap only
+# guards against an unbounded stream of distinct syslog identifiers.
+_SOURCE_CACHE: Dict[str, Tuple[str, str]] = {}
+_SOURCE_CACHE_MAX = 4096
+
+
+def _clean_source(raw: str) -> Tuple[str, str]:
+    """Strip a .service suffix and return (source, lowercased source)."""
+    cached = _SOURCE_CACHE.get(raw)
+    if cached is None:
+        source = raw[:-8] if raw.endswith('.service') else raw
+        if len(_SOURCE_CACHE) >= _SOURCE_CACHE_MAX:
+            _SOURCE_CACHE.clear()
+        cached = _SOURCE_CACHE[raw] = (source, source.lower())
+    return cached
+
+
+def _to_us(dt: datetime) -> int:
+    """Convert a datetime to microseconds since epoch."""
+    return round(dt.timestamp() * 1000000)
 
 
 class LogEntry:
     """Represents a single log entry."""
     
-    def __init__(self, raw_data: Dict):
-        """Initialize from journalctl JSON output."""
-        self.raw_data = raw_data
-        self.timestamp = self._parse_timestamp(raw_data.get('__REALTIME_TIMESTAMP', ''))
-        self.priority = self._parse_priority(raw_data.get('PRIORITY', '6'))
-        self.message = raw_data.get('MESSAGE', '')
-        self.source = raw_data.get('_SYSTEMD_UNIT', raw_data.get('SYSLOG_IDENTIFIER', 'system'))
+    # The decoded journal record is not kept; only the fields used here are
+    __slots__ = (
+        'timestamp_us', 'priority', 'message', 'source', 'pid', 'hostname',
+        'boot_id', 'cursor', '_msg_lc', '_src_lc'
+    )
+    
+    def __init__(self, raw_data: Dict, strings: Optional[Dict[str, str]] = None):
+        """
+        Initialize from journalctl JSON output.
+        
+        Args:
+            raw_data: Decoded journal record
+            strings: Optional intern table shared across entries; repeated
+                hostnames and boot IDs then share one object (source names
+                are always shared through the module-level source cache)
+        """
+        self.timestamp_us = self._parse_timestamp(raw_data.get('__REALTIME_TIMESTAMP', ''))
+        self.priority = self._parse_priority(_as_text(raw_data.get('PRIORITY', '6')))
+        self.message = _as_text(raw_data.get('MESSAGE', ''))
+        source, src_lc = _clean_source(_as_text(
+            raw_data.get('_SYSTEMD_UNIT', raw_data.get('SYSLOG_IDENTIFIER', 'system'))
+        ))
         self.pid = raw_data.get('_PID', '')
-        self.hostname = raw_data.get('_HOSTNAME', '')
-        self.boot_id = raw_data.get('_BOOT_ID', '')
+        self.cursor = raw_data.get('__CURSOR', '')
+        hostname = _as_text(raw_data.get('_HOSTNAME', ''))
+        boot_id = _as_text(raw_data.get('_BOOT_ID', ''))
+        
+        # Source names already come shared from _clean_source
+        if strings is not None:
+            hostname = strings.setdefault(hostname, hostname)
+            boot_id = strings.setdefault(boot_id, boot_id)
         
-        # Clean up source name
-        if self.source.endswith('.service'):
-            self.source = self.source[:-8]
+        self.source = source
+        self.hostname = hostname
+        self.boot_id = boot_id
         
-    def _parse_timestamp(self, timestamp_str: str) -> datetime:
-        """Parse journalctl timestamp."""
+        # Lowercased copies for text filtering
+        self._msg_lc = self.message.lower()
+        self._src_lc = src_lc
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Entry time as a local datetime (built on demand)."""
+        return datetime.fromtimestamp(self.timestamp_us / 1000000)
+    
+    def _parse_timestamp(self, timestamp_str: str) -> int:
+        """Parse journalctl timestamp (microseconds since epoch)."""
         try:
-            # Journal timestamps are in microseconds since epoch
             if timestamp_str:
-                microsec = int(timestamp_str) / 1000000
-                return datetime.fromtimestamp(microsec)
+                return int(timestamp_str)
         except (ValueError, TypeError):
             pass
-        return datetime.now()
+        return time.time_ns() // 1000
     
     def _parse_priority(self, priority: str) -> LogPriority:
-        """Parse priority from journalctl output."""
-        return LogPriority.from_string(str(priority))
+        """Parse priority from journalctl output (always a string field)."""
+        return LogPriority.from_string(priority)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -129,9 +223,16 @@ class LogEntry:
 class LogMonitor:
     """Monitors system logs via journalctl."""
     
+    # New entries are reported in batches of up to BATCH_SIZE, collected
+    # for at most BATCH_INTERVAL seconds after the first one arrives
+    BATCH_SIZE = 64
+    BATCH_INTERVAL = 0.05
+    
+    # Seconds the initial journalctl load may take before it is killed
+    INITIAL_LOAD_TIMEOUT = 10
+    
     def __init__(
         self,
-        update_interval: float = 1.0,
         max_entries: int = 1000,
         initial_time_range: str = "1 hour ago"
     ):
@@ -139,22 +240,36 @@ class LogMonitor:
         Initialize the log monitor.
         
         Args:
-            update_interval: How often to check for new logs (seconds)
             max_entries: Maximum number of entries to keep in memory
             initial_time_range: Initial time range to load logs from
         """
-        self.update_interval = update_interval
         self.max_entries = max_entries
         self.initial_time_range = initial_time_range
         
         # Log entries storage
         self.entries = deque(maxlen=max_entries)
-        self.filtered_entries = []
+        
+        # How many current entries come from each source, and the sorted
+        # source list built from it (None when it needs rebuilding)
+        self._source_counts: Dict[str, int] = {}
+        self._sources_sorted: Optional[List[str]] = None
+        self.filtered_entries = deque(maxlen=max_entries)
+        
+        # Held while entries or the filtered view change: the reader thread
+        # appends while the UI thread rebuilds the view after filter changes
+        self._entries_lock = Lock()
+        
+        # Intern table for metadata strings repeated across entries
+        self._strings: Dict[str, str] = {}
         
         # Threading
         self.thread = None
+        self.dispatch_thread = None
         self.stop_event = Event()
         self.entry_queue = Queue()
+        self.proc: Optional[subprocess.Popen] = None
+        self._wake_r: Optional[int] = None  # Wake pipe used by stop()
+        self._wake_w: Optional[int] = None
         
         # Filters
         self.priority_filter = set()  # Set of LogPriority values
@@ -163,13 +278,14 @@ class LogMonitor:
         self.time_range_filter = None  # datetime range
         
         # Callbacks
-        self.on_new_entry: Optional[Callable[[LogEntry], None]] = None
+        self.on_new_entries: Optional[Callable[[List[LogEntry]], None]] = None
         self.on_error: Optional[Callable[[str], None]] = None
         
         # State
         self.is_running = False
         self.is_paused = False
-        self.last_timestamp = datetime.now()
+        self.last_timestamp_us = time.time_ns() // 1000
+        self.last_cursor = ""  # Journal cursor of the newest entry seen
         
         # Error tracking
         self.error_counts = {
@@ -179,6 +295,20 @@ class LogMonitor:
             'warnings': 0,
         }
         
+        # Per-minute (critical, error) counts over the last hour, as a ring
+        # indexed by minute % 60; _bucket_minutes holds each slot's minute
+        self._minute_buckets = [[0, 0] for _ in range(60)]
+        self._bucket_minutes = [-1] * 60
+        
+    @property
+    def last_timestamp(self) -> datetime:
+        """Time of the newest entry seen (or of monitor creation)."""
+        return datetime.fromtimestamp(self.last_timestamp_us / 1000000)
+    
+    @last_timestamp.setter
+    def last_timestamp(self, value: datetime):
+        self.last_timestamp_us = _to_us(value)
+    
     def start(self):
         """Start monitoring logs."""
         if self.is_running:
@@ -186,18 +316,44 @@ class LogMonitor:
         
         self.is_running = True
         self.stop_event.clear()
-        self.thread = Thread(target=self._monitor_loop, daemon=True)
-        self.thread.start()
         
-        # Load initial logs
+        # Load initial logs, then follow the journal from where they left off
         self._load_initial_logs()
+        self._start_follow()
+        
+        self._wake_r, self._wake_w = os.pipe()
+        self.entry_queue = Queue()
+        self.thread = Thread(target=self._monitor_loop, daemon=True)
+        self.thread.start()
+        self.dispatch_thread = Thread(target=self._dispatch_loop, daemon=True)
+        self.dispatch_thread.start()
     
     def stop(self):
         """Stop monitoring logs."""
         self.is_running = False
         self.stop_event.set()
+        if self._wake_w is not None:
+            # Wakes the monitor thread out of select() straight away
+            os.write(self._wake_w, b'x')
         if self.thread:
             self.thread.join(timeout=2.0)
+        if self.dispatch_thread:
+            self.entry_queue.put(None)  # Stop sentinel for the dispatcher
+            self.dispatch_thread.join(timeout=2.0)
+        if self._wake_w is not None and not (
+            self.thread and self.thread.is_alive()
+        ):
+            # Only safe once the monitor thread is no longer selecting on it
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = None
+        if self.proc:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+            self.proc = None
     
     def pause(self):
         """Pause log streaming."""
@@ -219,8 +375,21 @@ class LogMonitor:
     
     def set_text_filter(self, text: str):
         """Set text search filter."""
-        self.text_filter = text.lower()
-        self._apply_filters()
+        previous = self.text_filter
+        text = text.lower()
+        self.text_filter = text
+        
+        if previous and previous in text:
+            # The new search refines the old one (e.g. the user typed another
+            # character), so only entries that already matched can match now
+            with self._entries_lock:
+                self.filtered_entries = deque(
+                    (e for e in self.filtered_entries
+                     if text in e._msg_lc or text in e._src_lc),
+                    maxlen=self.max_entries
+                )
+        else:
+            self._apply_filters()
     
     def set_time_range_filter(self, start: Optional[datetime], end: Optional[datetime]):
         """Set time range filter."""
@@ -243,31 +412,25 @@ class LogMonitor:
                 '--since', self.initial_time_range,
                 '--no-pager',
                 '-o', 'json',
+                _JOURNAL_FIELDS,
                 '-n', str(self.max_entries)
             ]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            def _on_line(line: bytes):
+                if not line.strip():
+                    return
+                try:
+                    entry = LogEntry(_json_loads(line), self._strings)
+                except ValueError:
+                    return
+                self._add_entry(entry)
             
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if line.strip():
-                        try:
-                            data = json.loads(line)
-                            entry = LogEntry(data)
-                            self.entries.append(entry)
-                            self._update_error_counts(entry)
-                            if entry.timestamp > self.last_timestamp:
-                                self.last_timestamp = entry.timestamp
-                        except json.JSONDecodeError:
-                            continue
-                
-                self._apply_filters()
+            # Stream raw byte lines straight into the JSON decoder rather
+            # than buffering the whole output and splitting it
+            run_streaming(
+                cmd, self.INITIAL_LOAD_TIMEOUT, _on_line,
+                stderr=subprocess.DEVNULL
+            )
         except subprocess.TimeoutExpired:
             if self.on_error:
                 self.on_error("Timeout loading initial logs")
@@ -278,82 +441,151 @@ class LogMonitor:
             if self.on_error:
                 self.on_error(f"Error loading logs: {str(e)}")
     
-    def _monitor_loop(self):
-        """Main monitoring loop running in background thread."""
-        while self.is_running and not self.stop_event.is_set():
-            if not self.is_paused:
-                self._fetch_new_logs()
-            
-            self.stop_event.wait(self.update_interval)
-    
-    def _fetch_new_logs(self):
-        """Fetch new log entries since last check."""
+    def _start_follow(self):
+        """Spawn a long-lived `journalctl --follow` process streaming JSON."""
+        # Resume right after the last entry seen, so nothing is read twice
+        if self.last_cursor:
+            position = ['--after-cursor', self.last_cursor]
+        else:
+            position = ['--since', self.initial_time_range]
+        
+        cmd = [
+            'journalctl',
+            '--follow',
+            *position,
+            '--no-pager',
+            '-o', 'json',
+            _JOURNAL_FIELDS
+        ]
+        
         try:
-            # Use --since with last timestamp
-            since_str = self.last_timestamp.strftime('%Y-%m-%d %H:%M:%S')
-            
-            cmd = [
-                'journalctl',
-                '--since', since_str,
-                '--no-pager',
-                '-o', 'json',
-                '-n', '100'  # Limit batch size
-            ]
-            
-            result = subprocess.run(
+            self.proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=5
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
             )
-            
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                new_entries = []
-                
-                for line in lines:
-                    if line.strip():
-                        try:
-                            data = json.loads(line)
-                            entry = LogEntry(data)
-                            
-                            # Only process new entries
-                            if entry.timestamp > self.last_timestamp:
-                                self.entries.append(entry)
-                                self._update_error_counts(entry)
-                                new_entries.append(entry)
-                                if entry.timestamp > self.last_timestamp:
-                                    self.last_timestamp = entry.timestamp
-                        except json.JSONDecodeError:
-                            continue
-                
-                # Notify of new entries
-                if new_entries and self.on_new_entry:
-                    for entry in new_entries:
-                        if self._matches_filters(entry):
-                            self.on_new_entry(entry)
-                
-                # Update filtered view
-                if new_entries:
-                    self._apply_filters()
-                    
-        except subprocess.TimeoutExpired:
-            pass  # Timeout is acceptable, just skip this update
+        except FileNotFoundError:
+            self.proc = None
+            if self.on_error:
+                self.on_error("journalctl not found. Install systemd to use log monitoring.")
         except Exception as e:
+            self.proc = None
             if self.on_error:
-                self.on_error(f"Error fetching logs: {str(e)}")
+                self.on_error(f"Error following logs: {str(e)}")
+    
+    def _monitor_loop(self):
+        """
+        Main monitoring loop running in background thread.
+        
+        Waits on the follow stream and the wake pipe together, so it only
+        wakes when journald has new entries or stop() is called.
+        """
+        proc = self.proc
+        if proc is None or proc.stdout is None:
+            return
+        
+        try:
+            fd = proc.stdout.fileno()
+            with selectors.DefaultSelector() as sel:
+                sel.register(fd, selectors.EVENT_READ)
+                if self._wake_r is not None:
+                    sel.register(self._wake_r, selectors.EVENT_READ)
+                
+                partial = b''
+                while not self.stop_event.is_set():
+                    for key, _ in sel.select():
+                        if key.fd != fd:
+                            return
+                        chunk = os.read(fd, 1 << 16)
+                        if not chunk:
+                            return
+                        lines = (partial + chunk).split(b'\n')
+                        partial = lines.pop()
+                        for raw in lines:
+                            if raw.strip():
+                                self._process_line(raw)
+        except Exception as e:
+            if self.is_running and self.on_error:
+                self.on_error(f"Error reading logs: {str(e)}")
+    
+    def _process_line(self, raw: bytes):
+        """Parse one JSON line from the follow stream and record it."""
+        try:
+            entry = LogEntry(_json_loads(raw), self._strings)
+        except ValueError:
+            return
+        
+        if self._add_entry(entry) and not self.is_paused:
+            self.entry_queue.put(entry)
+    
+    def _drain_batch(self, timeout: Optional[float] = None) -> List[LogEntry]:
+        """
+        Collect queued entries into one batch.
+        
+        Waits for the first entry (blocking unless `timeout` is given), then
+        keeps draining until the batch is full or BATCH_INTERVAL has passed.
+        A None sentinel queued by stop() ends the batch as its last item.
+        """
+        queue = self.entry_queue
+        try:
+            batch = [queue.get(timeout=timeout)]
+        except Empty:
+            return []
+        
+        deadline = time.monotonic() + self.BATCH_INTERVAL
+        while batch[-1] is not None and len(batch) < self.BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(queue.get(timeout=remaining))
+            except Empty:
+                break
+        return batch
+    
+    def _dispatch_loop(self):
+        """Deliver queued entries to on_new_entries in batches until stopped."""
+        while True:
+            batch = self._drain_batch()
+            stopping = batch[-1] is None
+            if stopping:
+                batch.pop()
+            if batch and self.on_new_entries:
+                try:
+                    self.on_new_entries(batch)
+                except Exception as e:
+                    if self.on_error:
+                        self.on_error(f"Error delivering logs: {str(e)}")
+            if stopping:
+                return
     
     def _update_error_counts(self, entry: LogEntry):
         """Update error tracking counts."""
         if entry.priority == LogPriority.CRIT or entry.priority == LogPriority.ALERT:
             self.error_counts['critical'] += 1
             self.error_counts['total_errors'] += 1
+            self._count_recent(entry, 0)
         elif entry.priority == LogPriority.ERR:
             self.error_counts['errors'] += 1
             self.error_counts['total_errors'] += 1
+            self._count_recent(entry, 1)
         elif entry.priority == LogPriority.WARNING:
             self.error_counts['warnings'] += 1
     
+    def _count_recent(self, entry: LogEntry, kind: int):
+        """Add an entry to its minute bucket (kind 0 = critical, 1 = error)."""
+        minute = entry.timestamp_us // 60000000
+        slot = minute % 60
+        held = self._bucket_minutes[slot]
+        if held != minute:
+            if held > minute:
+                # Slot already holds a minute an hour or more newer
+                return
+            self._bucket_minutes[slot] = minute
+            self._minute_buckets[slot] = [0, 0]
+        self._minute_buckets[slot][kind] += 1
+    
     def _matches_filters(self, entry: LogEntry) -> bool:
         """Check if entry matches current filters."""
         # Priority filter
@@ -366,48 +598,120 @@ class LogMonitor:
         
         # Text filter
         if self.text_filter:
-            if self.text_filter not in entry.message.lower():
-                if self.text_filter not in entry.source.lower():
+            if self.text_filter not in entry._msg_lc:
+                if self.text_filter not in entry._src_lc:
                     return False
         
         # Time range filter
         if self.time_range_filter:
             start, end = self.time_range_filter
-            if start and entry.timestamp < start:
+            if start and entry.timestamp_us < _to_us(start):
                 return False
-            if end and entry.timestamp > end:
+            if end and entry.timestamp_us > _to_us(end):
                 return False
         
         return True
     
+    def _add_entry(self, entry: LogEntry) -> bool:
+        """
+        Record a new entry and return whether it is in the filtered view.
+        
+        The filtered view is kept an ordered subsequence of entries, so an
+        entry about to be evicted from entries can only be at its head.
+        """
+        with self._entries_lock:
+            entries = self.entries
+            counts = self._source_counts
+            if len(entries) == entries.maxlen:
+                evicted = entries[0]
+                filtered = self.filtered_entries
+                if filtered and filtered[0] is evicted:
+                    filtered.popleft()
+                if evicted.source:
+                    remaining = counts[evicted.source] - 1
+                    if remaining:
+                        counts[evicted.source] = remaining
+                    else:
+                        del counts[evicted.source]
+                        self._sources_sorted = None
+            entries.append(entry)
+            
+            source = entry.source
+            if source:
+                if source in counts:
+                    counts[source] += 1
+                else:
+                    counts[source] = 1
+                    self._sources_sorted = None
+            
+            self._update_error_counts(entry)
+            if entry.timestamp_us > self.last_timestamp_us:
+                self.last_timestamp_us = entry.timestamp_us
+            if entry.cursor:
+                self.last_cursor = entry.cursor
+            return self._append_filtered(entry)
+    
+    def _append_filtered(self, entry: LogEntry) -> bool:
+        """Add a newly recorded entry to the filtered view if it matches."""
+        if self._matches_filters(entry):
+            self.filtered_entries.append(entry)
+            return True
+        return False
+    
     def _apply_filters(self):
-        """Apply filters to all entries."""
-        self.filtered_entries = [
-            entry for entry in self.entries
-            if self._matches_filters(entry)
-        ]
+        """
+        Rebuild the filtered view from all entries after a filter change.
+        
+        Runs one pass per active filter, cheapest first, so each pass only
+        sees entries that survived the previous ones and inactive filters
+        cost nothing. Must select the same entries as _matches_filters.
+        """
+        with self._entries_lock:
+            entries = self.entries
+            
+            if self.priority_filter:
+                priorities = self.priority_filter
+                entries = [e for e in entries if e.priority in priorities]
+            
+            if self.source_filter:
+                sources = self.source_filter
+                entries = [e for e in entries if e.source in sources]
+            
+            if self.time_range_filter:
+                start, end = self.time_range_filter
+                if start:
+                    start_us = _to_us(start)
+                    entries = [e for e in entries if e.timestamp_us >= start_us]
+                if end:
+                    end_us = _to_us(end)
+                    entries = [e for e in entries if e.timestamp_us <= end_us]
+            
+            if self.text_filter:
+                text = self.text_filter
+                entries = [
+                    e for e in entries
+                    if text in e._msg_lc or text in e._src_lc
+                ]
+            
+            self.filtered_entries = deque(entries, maxlen=self.max_entries)
     
     def get_filtered_entries(self) -> List[LogEntry]:
         """Get filtered log entries."""
-        return self.filtered_entries
+        return list(self.filtered_entries)
     
     def get_all_entries(self) -> List[LogEntry]:
         """Get all log entries."""
         return list(self.entries)
     
     def get_error_summary(self) -> Dict:
-        """Get error summary statistics."""
-        recent_critical = sum(
-            1 for e in self.entries
-            if e.priority in [LogPriority.CRIT, LogPriority.ALERT]
-            and (datetime.now() - e.timestamp).total_seconds() < 3600
-        )
-        
-        recent_errors = sum(
-            1 for e in self.entries
-            if e.priority == LogPriority.ERR
-            and (datetime.now() - e.timestamp).total_seconds() < 3600
-        )
+        """Get error summary statistics (recent counts are to the minute)."""
+        now_minute = int(time.time() // 60)
+        recent_critical = 0
+        recent_errors = 0
+        for minute, (critical, errors) in zip(self._bucket_minutes, self._minute_buckets):
+            if now_minute - minute < 60:
+                recent_critical += critical
+                recent_errors += errors
         
         return {
             **self.error_counts,
@@ -417,9 +721,7 @@ class LogMonitor:
     
     def get_available_sources(self) -> List[str]:
         """Get list of available log sources."""
-        sources = set()
-        for entry in self.entries:
-            if entry.source:
-                sources.add(entry.source)
-        return sorted(sources)
+        if self._sources_sorted is None:
+            self._sources_sorted = sorted(self._source_counts)
+        return list(self._sources_sorted)
 
@@ -6,27 +6,124 @@ Monitors CPU, GPU, memory, temperatures, and fan speeds.
 Provides real-time metrics for the dashboard.
 """
 
+import glob
+import os
+import numpy as np
 import psutil
 import subprocess
 import time
-from typing import Dict, Optional, List
-from threading import Thread, Event
-from collections import deque
+from typing import Callable, Dict, NamedTuple, Optional, List, Tuple
+from threading import Thread, Event, Lock
+
+
+# Sensor labels (thermal zone `type` / hwmon `name`) that identify CPU sensors
+_CPU_SENSOR_LABELS = ('x86_pkg_temp', 'coretemp', 'k10temp', 'zenpower', 'cpu')
+
+# Present only when the NVIDIA kernel driver is loaded
+_NVIDIA_DRIVER_PATHS = ('/proc/driver/nvidia/version', '/dev/nvidia0')
+
+# Fields requested from nvidia-smi, in the order they are parsed
+_NVIDIA_SMI_QUERY = 'temperature.gpu,utilization.gpu,memory.used,memory.total,power.draw'
+
+
+class FanSpeed(NamedTuple):
+    """A fan's current speed, as reported by hwmon."""
+    name: str
+    rpm: int
+
+
+class _HistoryBuffer:
+    """
+    Fixed-size metric history: one preallocated row per sample and one
+    column per series, plus a parallel timestamp array.
+    
+    Readings that were unavailable for a sample are stored as NaN.
+    """
+    
+    __slots__ = ('series', '_values', '_timestamps', '_next', '_count', 'revision')
+    
+    def __init__(self, size: int, series: Tuple[str, ...]):
+        self.series = series
+        self._values = np.full((size, len(series)), np.nan, dtype=np.float32)
+        self._timestamps = np.empty(size, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+        # Bumped on every append so readers can skip unchanged history
+        self.revision = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append(self, timestamp: float, values: Tuple[Optional[float], ...]):
+        """Store one sample (in series order), overwriting the oldest once full."""
+        size = len(self._timestamps)
+        if size == 0:
+            return
+        self._values[self._next] = [np.nan if v is None else v for v in values]
+        self._timestamps[self._next] = timestamp
+        self._next = (self._next + 1) % size
+        if self._count < size:
+            self._count += 1
+        self.revision += 1
+    
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Return each series and 'timestamp' as arrays, oldest first."""
+        if self._count < len(self._timestamps):
+            values = self._values[:self._count].copy()
+            timestamps = self._timestamps[:self._count].copy()
+        else:
+            # One copy for all series; the returned columns are views into it
+            values = np.concatenate((self._values[self._next:], self._values[:self._next]))
+            timestamps = np.concatenate(
+                (self._timestamps[self._next:], self._timestamps[:self._next])
+            )
+        history = {name: values[:, col] for col, name in enumerate(self.series)}
+        history['timestamp'] = timestamps
+        return history
 
 
 class SystemMonitor:
     """Monitors system metrics including CPU, GPU, memory, and temperatures."""
     
-    def __init__(self, update_interval: float = 1.0, history_size: int = 300):
+    # Series kept in the history, in column order
+    HISTORY_SERIES = (
+        'cpu_percent', 'cpu_temp', 'memory_percent', 'gpu_utilization', 'gpu_temp',
+    )
+    
+    # Longest GPU poll interval reached by backing off after failed reads
+    GPU_MAX_POLL_INTERVAL = 600.0
+    
+    # NVML refreshes power roughly every 20-100 ms and averages utilization
+    # over 1/6-1 s, so polling either faster only returns the same value
+    NVML_POWER_MIN_INTERVAL = 0.1
+    NVML_UTIL_MIN_INTERVAL = 1 / 6
+    
+    def __init__(
+        self,
+        update_interval: float = 1.0,
+        history_size: int = 300,
+        gpu_poll_interval: float = 5.0,
+        temp_poll_interval: float = 2.0
+    ):
         """
         Initialize the system monitor.
         
         Args:
             update_interval: How often to update metrics (seconds)
             history_size: Number of historical data points to keep
+            gpu_poll_interval: How often to query the GPU (seconds)
+            temp_poll_interval: How often to read CPU temperature (seconds)
         """
         self.update_interval = update_interval
         self.history_size = history_size
+        self.gpu_poll_interval = gpu_poll_interval
+        self.temp_poll_interval = temp_poll_interval
+        
+        # Slower sources are polled on their own schedule (monotonic time);
+        # their last values are kept in self.metrics between polls
+        self._next_gpu_poll = 0.0
+        self._next_temp_poll = 0.0
+        self._gpu_interval = gpu_poll_interval  # Grows while GPU reads fail
         
         # Current metrics
         self.metrics = {
@@ -46,22 +143,48 @@ class SystemMonitor:
         }
         
         # Historical data (for graphs)
-        self.history = {
-            'cpu_percent': deque(maxlen=history_size),
-            'cpu_temp': deque(maxlen=history_size),
-            'memory_percent': deque(maxlen=history_size),
-            'gpu_utilization': deque(maxlen=history_size),
-            'gpu_temp': deque(maxlen=history_size),
-            'timestamp': deque(maxlen=history_size),
-        }
+        self.history = _HistoryBuffer(history_size, self.HISTORY_SERIES)
         
         # Monitoring thread
         self._stop_event = Event()
         self._monitoring_thread = None
+        
+        # Callback with (metrics, history) snapshots after each update,
+        # called from the monitoring thread
+        self.on_update: Optional[Callable[[Dict, Dict], None]] = None
         self._nvml_module = None
+        self._nvml_handle = None  # GPU 0, looked up once per NVML session
         self._use_nvml = False
+        # Last NVML power/utilization readings as (monotonic time, value)
+        self._last_power = (float('-inf'), None)
+        self._last_util = (float('-inf'), None)
+        
+        # Long-lived `nvidia-smi --loop-ms` process used when NVML is not
+        # available; its reader thread keeps only the latest CSV sample
+        self._smi_proc: Optional[subprocess.Popen] = None
+        self._smi_failed = False
+        self._smi_lock = Lock()
+        self._latest_gpu_csv: Optional[str] = None
+        
+        # Sysfs sensor files as (path, fd) / (fan name, fd), opened on first
+        # use and re-read in place (None until discovered; closed by stop())
+        self._temp_files: Optional[List] = None
+        self._fan_files: Optional[List] = None
+        
+        # CPU temperature sensor paths, probed once on first use
+        self._cpu_temp_paths: Optional[List[str]] = None
+        # CPU temperature reader (sysfs or psutil), chosen once on first use
+        self._temp_source: Optional[Callable[[], Optional[float]]] = None
+        
         self._nvidia_available = self._check_nvidia_available()
         
+        # Prime psutil's CPU counters so the first update has a baseline
+        try:
+            psutil.cpu_percent(interval=None)
+            psutil.cpu_percent(percpu=True, interval=None)
+        except Exception:
+            pass
+        
     def _check_nvidia_available(self) -> bool:
         """Check if NVIDIA GPU monitoring is available."""
         # Try py3nvml first
@@ -71,83 +194,144 @@ class SystemMonitor:
             device_count = nvml.nvmlDeviceGetCount()
             self._nvml_module = nvml
             self._use_nvml = True
+            if device_count > 0:
+                self._nvml_handle = nvml.nvmlDeviceGetHandleByIndex(0)
             return device_count > 0
         except Exception:
             pass
         
-        # Fallback: check if nvidia-smi command is available
-        try:
-            result = subprocess.run(
-                ['nvidia-smi', '--query-gpu=count', '--format=csv,noheader'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            if result.returncode == 0:
-                self._use_nvml = False
-                return True
-        except Exception:
-            pass
+        # Fallback: nvidia-smi is usable when the NVIDIA kernel driver is loaded
+        # (checked via its device files rather than by spawning nvidia-smi)
+        if any(os.path.exists(path) for path in _NVIDIA_DRIVER_PATHS):
+            self._use_nvml = False
+            return True
         
         self._use_nvml = False
         self._nvml_module = None
         return False
     
+    @staticmethod
+    def _open_sensor_files(paths: List[str]) -> List:
+        """Open the readable sensor files among paths, as (path, fd) pairs."""
+        files = []
+        for path in paths:
+            try:
+                files.append((path, os.open(path, os.O_RDONLY)))
+            except OSError:
+                continue
+        return files
+    
+    @staticmethod
+    def _read_sensor(fd: int) -> int:
+        """Re-read an open sysfs attribute; reading from offset 0 refreshes it."""
+        # int() accepts bytes and ignores the trailing newline
+        return int(os.pread(fd, 16, 0))
+    
+    @staticmethod
+    def _read_sensor_label(path: str) -> str:
+        """Read a sensor's type/name attribute, or '' if it has none."""
+        try:
+            with open(path) as f:
+                return f.read().strip().lower()
+        except OSError:
+            return ''
+    
+    def _probe_cpu_temp_sources(self) -> List[str]:
+        """
+        Find the sysfs temperature files worth polling for the CPU.
+        
+        Only sensors with a plausible reading are kept. Those labelled as CPU
+        sensors are preferred; if none are, all plausible sensors are used.
+        """
+        candidates = []
+        for zone in sorted(glob.glob('/sys/class/thermal/thermal_zone*')):
+            candidates.append((f'{zone}/temp', self._read_sensor_label(f'{zone}/type')))
+        for path in sorted(glob.glob('/sys/class/hwmon/hwmon*/temp*_input')):
+            name_path = os.path.join(os.path.dirname(path), 'name')
+            candidates.append((path, self._read_sensor_label(name_path)))
+        
+        plausible = []
+        for path, label in candidates:
+            try:
+                with open(path, 'rb') as f:
+                    temp = int(f.read().strip()) / 1000.0
+            except (OSError, ValueError):
+                continue
+            if 10 <= temp <= 100:
+                plausible.append((path, label))
+        
+        cpu_paths = [
+            path for path, label in plausible
+            if any(cpu_label in label for cpu_label in _CPU_SENSOR_LABELS)
+        ]
+        return cpu_paths or [path for path, _ in plausible]
+    
+    def _close_sensor_files(self):
+        """Close cached sensor files; they are reopened on next use."""
+        for files in (self._temp_files, self._fan_files):
+            for _, fd in files or ():
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._temp_files = None
+        self._fan_files = None
+    
     def _get_cpu_temperature(self) -> Optional[float]:
         """
         Get CPU temperature from thermal sensors.
         Returns average temperature in Celsius, or None if unavailable.
         """
+        if self._temp_source is None:
+            self._temp_source = self._probe_temp_source()
+        return self._temp_source()
+    
+    def _probe_temp_source(self) -> Callable[[], Optional[float]]:
+        """Pick, once, the cheapest CPU temperature source that returns a value."""
+        if self._cpu_temp_paths is None:
+            self._cpu_temp_paths = self._probe_cpu_temp_sources()
+        if self._cpu_temp_paths and self._read_sysfs_temperature() is not None:
+            return self._read_sysfs_temperature
+        if self._read_psutil_temperature() is not None:
+            return self._read_psutil_temperature
+        return lambda: None
+    
+    def _read_sysfs_temperature(self) -> Optional[float]:
+        """Average the probed sysfs CPU sensors, in Celsius."""
         try:
-            # Try /sys/class/thermal
-            temps = []
-            for i in range(10):  # Check first 10 thermal zones
-                try:
-                    path = f'/sys/class/thermal/thermal_zone{i}/temp'
-                    with open(path, 'r') as f:
-                        temp = int(f.read().strip()) / 1000.0  # Convert from millidegrees
-                        # Only include reasonable temperatures (10-100°C)
-                        if 10 <= temp <= 100:
-                            temps.append(temp)
-                except (FileNotFoundError, ValueError):
-                    continue
+            if self._temp_files is None:
+                self._temp_files = self._open_sensor_files(self._cpu_temp_paths or [])
             
-            # Also try hwmon (alternative location)
-            import glob
-            for hwmon_path in glob.glob('/sys/class/hwmon/hwmon*/temp*_input'):
+            # Sum in millidegrees and convert once, without building a list
+            total = 0
+            count = 0
+            for _, fd in self._temp_files:
                 try:
-                    with open(hwmon_path, 'r') as f:
-                        temp = int(f.read().strip()) / 1000.0
-                        if 10 <= temp <= 100:
-                            temps.append(temp)
-                except (FileNotFoundError, ValueError):
+                    millidegrees = self._read_sensor(fd)
+                except (OSError, ValueError):
                     continue
+                # Only include reasonable temperatures (10-100°C)
+                if 10000 <= millidegrees <= 100000:
+                    total += millidegrees
+                    count += 1
             
-            if temps:
-                return sum(temps) / len(temps)
+            if count:
+                return total / count / 1000.0
         except Exception:
             pass
-        
-        # Fallback: try sensors command
+        return None
+    
+    @staticmethod
+    def _read_psutil_temperature() -> Optional[float]:
+        """Average psutil's in-process view of the CPU hwmon sensors."""
         try:
-            result = subprocess.run(
-                ['sensors'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            if result.returncode == 0:
-                # Simple parsing - look for CPU temperature
-                for line in result.stdout.split('\n'):
-                    if 'CPU' in line or 'Package id' in line:
-                        # Extract temperature number
-                        import re
-                        match = re.search(r'\+(\d+\.\d+)°C', line)
-                        if match:
-                            return float(match.group(1))
+            sensors = psutil.sensors_temperatures(fahrenheit=False)
+            for name in ('coretemp', 'k10temp', 'cpu_thermal'):
+                readings = [t.current for t in sensors.get(name, ()) if t.current]
+                if readings:
+                    return sum(readings) / len(readings)
         except Exception:
             pass
-        
         return None
     
     def _get_gpu_metrics(self) -> Dict:
@@ -166,11 +350,19 @@ class SystemMonitor:
         if self._use_nvml and self._nvml_module:
             try:
                 nvml = self._nvml_module
-                handle = nvml.nvmlDeviceGetHandleByIndex(0)
+                handle = self._nvml_handle
+                if handle is None:
+                    # NVML was shut down by stop(); start a new session
+                    nvml.nvmlInit()
+                    handle = self._nvml_handle = nvml.nvmlDeviceGetHandleByIndex(0)
+                
+                now = time.monotonic()
                 
                 # GPU utilization
-                util = nvml.nvmlDeviceGetUtilizationRates(handle)
-                metrics['utilization'] = float(util.gpu)
+                if now - self._last_util[0] >= self.NVML_UTIL_MIN_INTERVAL:
+                    util = nvml.nvmlDeviceGetUtilizationRates(handle)
+                    self._last_util = (now, float(util.gpu))
+                metrics['utilization'] = self._last_util[1]
                 
                 # Temperature
                 temp = nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU)
@@ -185,71 +377,133 @@ class SystemMonitor:
                 metrics['memory_total_gb'] = mem_total
                 
                 # Power (if available)
-                try:
-                    power = nvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # Convert mW to W
-                    metrics['power'] = power
-                except:
-                    pass
+                if now - self._last_power[0] >= self.NVML_POWER_MIN_INTERVAL:
+                    try:
+                        power = nvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # Convert mW to W
+                    except:
+                        power = None
+                    self._last_power = (now, power)
+                metrics['power'] = self._last_power[1]
                 
                 return metrics
             except Exception:
                 # Fall through to nvidia-smi fallback
                 pass
         
-        # Fallback: use nvidia-smi command
+        # Fallback: use nvidia-smi
         try:
-            result = subprocess.run(
+            line = self._read_nvidia_smi()
+            if line:
+                self._parse_nvidia_smi_csv(line, metrics)
+        except Exception:
+            pass
+        
+        return metrics
+    
+    def _start_nvidia_smi_stream(self):
+        """Launch nvidia-smi in loop mode and follow its output in a thread."""
+        interval_ms = max(int(self.gpu_poll_interval * 1000), 100)
+        try:
+            proc = subprocess.Popen(
                 [
                     'nvidia-smi',
-                    '--query-gpu=temperature.gpu,utilization.gpu,memory.used,memory.total,power.draw',
-                    '--format=csv,noheader,nounits'
+                    f'--query-gpu={_NVIDIA_SMI_QUERY}',
+                    '--format=csv,noheader,nounits',
+                    f'--loop-ms={interval_ms}'
                 ],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                timeout=2
+                bufsize=1
             )
-            
-            if result.returncode == 0 and result.stdout.strip():
-                # Parse output: "temp, util, mem_used, mem_total, power"
-                values = result.stdout.strip().split(', ')
-                if len(values) >= 4:
-                    metrics['temperature'] = float(values[0])
-                    metrics['utilization'] = float(values[1])
-                    mem_used_gb = float(values[2])
-                    mem_total_gb = float(values[3])
-                    metrics['memory_percent'] = (mem_used_gb / mem_total_gb) * 100 if mem_total_gb > 0 else 0
-                    metrics['memory_used_gb'] = mem_used_gb
-                    metrics['memory_total_gb'] = mem_total_gb
-                    if len(values) >= 5:
-                        try:
-                            metrics['power'] = float(values[4])
-                        except:
-                            pass
+        except Exception:
+            # Not worth retrying every tick; one-shot queries are used instead
+            self._smi_failed = True
+            return
+        
+        self._smi_proc = proc
+        Thread(target=self._nvidia_smi_reader, args=(proc,), daemon=True).start()
+    
+    def _nvidia_smi_reader(self, proc: subprocess.Popen):
+        """Keep the most recent sample from the nvidia-smi stream."""
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                if line:
+                    with self._smi_lock:
+                        self._latest_gpu_csv = line
         except Exception:
             pass
+    
+    def _read_nvidia_smi(self) -> Optional[str]:
+        """
+        Return the latest nvidia-smi CSV sample.
         
-        return metrics
+        Reads from the streaming process when it is running and has produced
+        a sample; otherwise runs a one-shot query.
+        """
+        if self._smi_proc is None and not self._smi_failed:
+            self._start_nvidia_smi_stream()
+        
+        if self._smi_proc is not None and self._smi_proc.poll() is None:
+            with self._smi_lock:
+                line = self._latest_gpu_csv
+            if line:
+                return line
+        
+        result = subprocess.run(
+            [
+                'nvidia-smi',
+                f'--query-gpu={_NVIDIA_SMI_QUERY}',
+                '--format=csv,noheader,nounits'
+            ],
+            capture_output=True,
+            text=True,
+            timeout=2
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+        return None
     
-    def _get_fan_speeds(self) -> List[Dict]:
+    @staticmethod
+    def _parse_nvidia_smi_csv(line: str, metrics: Dict):
+        """Parse "temp, util, mem_used, mem_total, power" into metrics."""
+        values = line.split(', ')
+        if len(values) >= 4:
+            metrics['temperature'] = float(values[0])
+            metrics['utilization'] = float(values[1])
+            mem_used_gb = float(values[2])
+            mem_total_gb = float(values[3])
+            metrics['memory_percent'] = (mem_used_gb / mem_total_gb) * 100 if mem_total_gb > 0 else 0
+            metrics['memory_used_gb'] = mem_used_gb
+            metrics['memory_total_gb'] = mem_total_gb
+            if len(values) >= 5:
+                try:
+                    metrics['power'] = float(values[4])
+                except:
+                    pass
+    
+    def _get_fan_speeds(self) -> List[FanSpeed]:
         """Get fan speeds from system sensors."""
         fan_speeds = []
         
         try:
-            # Try hwmon for fan speeds
-            import glob
-            for fan_path in glob.glob('/sys/class/hwmon/hwmon*/fan*_input'):
+            # Try hwmon for fan speeds; names are derived once, when opened
+            if self._fan_files is None:
+                self._fan_files = [
+                    (path.rsplit('/', 1)[-1].replace('_input', ''), fd)
+                    for path, fd in self._open_sensor_files(
+                        glob.glob('/sys/class/hwmon/hwmon*/fan*_input')
+                    )
+                ]
+            
+            for fan_name, fd in self._fan_files:
                 try:
-                    with open(fan_path, 'r') as f:
-                        rpm = int(f.read().strip())
-                        if rpm > 0:
-                            # Extract fan name
-                            fan_name = fan_path.split('/')[-1].replace('_input', '')
-                            fan_speeds.append({
-                                'name': fan_name,
-                                'rpm': rpm
-                            })
-                except (FileNotFoundError, ValueError):
+                    rpm = self._read_sensor(fd)
+                except (OSError, ValueError):
                     continue
+                if rpm > 0:
+                    fan_speeds.append(FanSpeed(fan_name, rpm))
         except Exception:
             pass
         
@@ -258,8 +512,10 @@ class SystemMonitor:
     def update_metrics(self):
         """Update all system metrics."""
         # CPU metrics
-        self.metrics['cpu_percent'] = psutil.cpu_percent(interval=0.1)
-        self.metrics['cpu_per_core'] = psutil.cpu_percent(percpu=True, interval=0.1)
+        # Non-blocking: usage since the previous call (primed in __init__),
+        # rather than sleeping 0.1 s per call on the monitor thread
+        self.metrics['cpu_percent'] = psutil.cpu_percent(interval=None)
+        self.metrics['cpu_per_core'] = psutil.cpu_percent(percpu=True, interval=None)
         
         # CPU frequency
         try:
@@ -268,8 +524,12 @@ class SystemMonitor:
         except:
             self.metrics['cpu_freq'] = 0.0
         
+        now = time.monotonic()
+        
         # CPU temperature
-        self.metrics['cpu_temp'] = self._get_cpu_temperature()
+        if now >= self._next_temp_poll:
+            self.metrics['cpu_temp'] = self._get_cpu_temperature()
+            self._next_temp_poll = now + self.temp_poll_interval
         
         # Memory metrics
         mem = psutil.virtual_memory()
@@ -282,32 +542,40 @@ class SystemMonitor:
         self.metrics['swap_percent'] = swap.percent
         
         # GPU metrics
-        gpu_metrics = self._get_gpu_metrics()
-        self.metrics['gpu_utilization'] = gpu_metrics.get('utilization')
-        self.metrics['gpu_temp'] = gpu_metrics.get('temperature')
-        self.metrics['gpu_memory_percent'] = gpu_metrics.get('memory_percent')
-        self.metrics['gpu_power'] = gpu_metrics.get('power')
+        if now >= self._next_gpu_poll:
+            gpu_metrics = self._get_gpu_metrics()
+            self.metrics['gpu_utilization'] = gpu_metrics.get('utilization')
+            self.metrics['gpu_temp'] = gpu_metrics.get('temperature')
+            self.metrics['gpu_memory_percent'] = gpu_metrics.get('memory_percent')
+            self.metrics['gpu_power'] = gpu_metrics.get('power')
+            
+            # Back off exponentially while a detected GPU returns nothing
+            if self._nvidia_available and gpu_metrics.get('utilization') is None:
+                self._gpu_interval = min(self._gpu_interval * 2, self.GPU_MAX_POLL_INTERVAL)
+            else:
+                self._gpu_interval = self.gpu_poll_interval
+            self._next_gpu_poll = now + self._gpu_interval
         
         # Fan speeds
         self.metrics['fan_speeds'] = self._get_fan_speeds()
         
         # Update history
         timestamp = time.time()
-        self.history['timestamp'].append(timestamp)
-        self.history['cpu_percent'].append(self.metrics['cpu_percent'])
-        if self.metrics['cpu_temp']:
-            self.history['cpu_temp'].append(self.metrics['cpu_temp'])
-        self.history['memory_percent'].append(self.metrics['memory_percent'])
-        if self.metrics['gpu_utilization'] is not None:
-            self.history['gpu_utilization'].append(self.metrics['gpu_utilization'])
-        if self.metrics['gpu_temp'] is not None:
-            self.history['gpu_temp'].append(self.metrics['gpu_temp'])
+        self.history.append(timestamp, (
+            self.metrics['cpu_percent'],
+            self.metrics['cpu_temp'] or None,
+            self.metrics['memory_percent'],
+            self.metrics['gpu_utilization'],
+            self.metrics['gpu_temp'],
+        ))
     
     def _monitoring_loop(self):
         """Background thread loop for continuous monitoring."""
         while not self._stop_event.is_set():
             try:
                 self.update_metrics()
+                if self.on_update:
+                    self.on_update(self.get_metrics(), self.get_history())
             except Exception as e:
                 print(f"Error updating metrics: {e}")
             
@@ -326,16 +594,41 @@ class SystemMonitor:
         self._stop_event.set()
         if self._monitoring_thread:
             self._monitoring_thread.join(timeout=2.0)
+        
+        if self._nvml_handle is not None:
+            self._nvml_handle = None
+            try:
+                self._nvml_module.nvmlShutdown()
+            except Exception:
+                pass
+        
+        self._close_sensor_files()
+        
+        # Ends the nvidia-smi stream; it is restarted on the next GPU read
+        proc, self._smi_proc = self._smi_proc, None
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        self._latest_gpu_csv = None
     
     def get_metrics(self) -> Dict:
         """Get current metrics snapshot."""
         return self.metrics.copy()
     
     def get_history(self) -> Dict:
-        """Get historical data for graphs."""
-        return {
-            key: list(values) for key, values in self.history.items()
-        }
+        """
+        Get historical data for graphs as NumPy arrays, oldest first.
+        
+        Unavailable readings are NaN. The '_rev' entry is a counter that
+        changes whenever the history does, so callers can skip redrawing
+        unchanged data.
+        """
+        history = self.history.to_dict()
+        history['_rev'] = self.history.revision
+        return history
 
 
 # Convenience function for testing
@@ -10,8 +10,9 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QColor, QPainter, QPen
+import numpy as np
 import pyqtgraph as pg
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
 
 class MetricCard(QWidget):
@@ -96,6 +97,9 @@ class MetricCard(QWidget):
 class GraphWidget(QWidget):
     """Widget for displaying real-time graphs."""
     
+    # Minimum change in the data's y extent before the view is re-ranged
+    Y_RANGE_EPSILON = 1.0
+    
     def __init__(self):
         super().__init__()
         self.setMinimumHeight(300)
@@ -108,6 +112,10 @@ class GraphWidget(QWidget):
         self.graph.setLabel('bottom', 'Time (seconds)', **{'color': '#666', 'font-size': '11pt'})
         self.graph.showGrid(x=True, y=True, alpha=0.2)
         
+        # Keep paint cost bounded by the widget width, not the history length
+        self.graph.setDownsampling(auto=True, mode='peak')
+        self.graph.setClipToView(True)
+        
         # Modern color palette - softer, more minimalist
         self.graph.getAxis('left').setPen(pg.mkPen(color='#ccc', width=1))
         self.graph.getAxis('bottom').setPen(pg.mkPen(color='#ccc', width=1))
@@ -119,6 +127,20 @@ class GraphWidget(QWidget):
         self.gpu_plot = self.graph.plot(pen=pg.mkPen(color='#00BCD4', width=2.5), name='GPU %')
         self.gpu_temp_plot = self.graph.plot(pen=pg.mkPen(color='#E91E63', width=2.5), name='GPU Temp')
         
+        self._series = (
+            ('cpu_percent', self.cpu_plot),
+            ('cpu_temp', self.cpu_temp_plot),
+            ('memory_percent', self.memory_plot),
+            ('gpu_utilization', self.gpu_plot),
+            ('gpu_temp', self.gpu_temp_plot),
+        )
+        
+        # Last drawn history revision and (min, max) of each series
+        self._last_rev: Optional[int] = None
+        self._series_range: Dict[str, Tuple[float, float]] = {}
+        self._x_range: Optional[Tuple[float, float]] = None
+        self._y_range: Optional[Tuple[float, float]] = None
+        
         # Layout with subtle border
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -144,36 +166,50 @@ class GraphWidget(QWidget):
     
     def update_data(self, history: dict):
         """Update graph with new historical data."""
-        if not history.get('timestamp'):
+        timestamps = history.get('timestamp')
+        if timestamps is None or len(timestamps) == 0:
             return
         
-        timestamps = history['timestamp']
-        if not timestamps:
+        # Nothing to redraw if the history has not changed since the last call
+        revision = history.get('_rev')
+        if revision is not None and revision == self._last_rev:
             return
         
         # Convert timestamps to relative time (seconds from start)
-        if len(timestamps) > 1:
-            base_time = timestamps[0]
-            times = [(t - base_time) for t in timestamps]
-        else:
-            times = [0]
-        
-        # Update plots
-        if history.get('cpu_percent'):
-            self.cpu_plot.setData(times, list(history['cpu_percent']))
-        
-        if history.get('cpu_temp'):
-            self.cpu_temp_plot.setData(times, list(history['cpu_temp']))
-        
-        if history.get('memory_percent'):
-            self.memory_plot.setData(times, list(history['memory_percent']))
-        
-        if history.get('gpu_utilization'):
-            self.gpu_plot.setData(times, list(history['gpu_utilization']))
-        
-        if history.get('gpu_temp'):
-            self.gpu_temp_plot.setData(times, list(history['gpu_temp']))
-        
-        # Auto-range
-        self.graph.enableAutoRange()
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        times = timestamps - timestamps[0]
+        
+        # Update plots; gaps (NaN) in optional series are left unconnected
+        for key, plot in self._series:
+            values = history.get(key)
+            if values is None or len(values) == 0:
+                continue
+            values = np.asarray(values, dtype=np.float64)
+            finite = values[np.isfinite(values)]
+            if finite.size == 0:
+                continue
+            
+            plot.setData(times, values, connect='finite')
+            self._series_range[key] = (float(finite.min()), float(finite.max()))
+        
+        self._last_rev = revision
+        
+        self._update_range(times)
+    
+    def _update_range(self, times: np.ndarray):
+        """Re-range the view only when the visible window actually moves."""
+        x_range = (0.0, float(times[-1]))
+        if x_range != self._x_range and x_range[1] > 0:
+            self.graph.setXRange(*x_range, padding=0)
+            self._x_range = x_range
+        
+        if not self._series_range:
+            return
+        y_min = min(low for low, _ in self._series_range.values())
+        y_max = max(high for _, high in self._series_range.values())
+        if (self._y_range is None
+                or abs(y_min - self._y_range[0]) > self.Y_RANGE_EPSILON
+                or abs(y_max - self._y_range[1]) > self.Y_RANGE_EPSILON):
+            self.graph.setYRange(y_min, y_max)
+            self._y_range = (y_min, y_max)
 
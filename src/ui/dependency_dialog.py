@@ -7,15 +7,125 @@ Modern, minimalist dialog for checking and installing dependencies.
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QScrollArea, QWidget, QProgressBar, QFrame,
+    QScrollArea, QWidget, QProgressBar, QFrame,
     QMessageBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QPalette, QColor
+from PyQt6.QtCore import Qt, QRect, QThread, pyqtSignal, QTimer
+from PyQt6.QtGui import QFont, QPalette, QColor, QGuiApplication, QPainter, QPixmap
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 from ..utils.dependency_checker import DependencyChecker, Dependency
 
 
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False) -> QFont:
+    """Shared font for the given size/weight; setFont() copies it."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+
+@lru_cache(maxsize=None)
+def _status_pixmap(icon: str) -> QPixmap:
+    """Status glyph rendered once into a pixmap shared by every card."""
+    size = 24
+    ratio = QGuiApplication.primaryScreen().devicePixelRatio()
+    pixmap = QPixmap(round(size * ratio), round(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setFont(_font(16))
+    painter.drawText(QRect(0, 0, size, size), Qt.AlignmentFlag.AlignCenter, icon)
+    painter.end()
+    return pixmap
+
+
+# Styles for the dialog and its cards, applied once on the dialog and
+# matched by object name (and the summary's "state" property)
+_DIALOG_QSS = """
+    QWidget#depCard {
+        background-color: white;
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+    }
+    QLabel#optionalBadge {
+        color: #666;
+        background: #f0f0f0;
+        padding: 4px 8px;
+        border-radius: 4px;
+    }
+    QLabel#depDescription {
+        color: #666;
+    }
+    QLabel#dialogDescription {
+        color: #666;
+        padding-bottom: 10px;
+    }
+    QLabel#installInstructions {
+        background-color: #f5f5f5;
+        padding: 12px;
+        border-radius: 6px;
+        border: 1px solid #e0e0e0;
+        color: #333;
+        font-family: 'Monospace', 'Courier New', monospace;
+        font-size: 10pt;
+    }
+    QLabel#statusSummary {
+        padding: 12px;
+        background: #f5f5f5;
+        border-radius: 6px;
+    }
+    QLabel#statusSummary[state="ok"] {
+        background: #e8f5e9;
+        color: #2e7d32;
+    }
+    QLabel#statusSummary[state="warning"] {
+        background: #fff3e0;
+        color: #f57c00;
+    }
+    QLabel#statusSummary[state="error"] {
+        background: #ffebee;
+        color: #c62828;
+    }
+    QScrollArea {
+        border: none;
+    }
+    QPushButton#installButton, QPushButton#primaryButton, QPushButton#secondaryButton {
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-weight: bold;
+    }
+    QPushButton#installButton {
+        background-color: #2196F3;
+        padding: 8px 16px;
+    }
+    QPushButton#installButton:pressed {
+        background-color: #0D47A1;
+    }
+    QPushButton#installButton:disabled {
+        background-color: #ccc;
+    }
+    QPushButton#primaryButton {
+        background-color: #2196F3;
+        padding: 10px 20px;
+    }
+    QPushButton#installButton:hover, QPushButton#primaryButton:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#secondaryButton {
+        background-color: #666;
+        padding: 10px 20px;
+    }
+    QPushButton#secondaryButton:hover {
+        background-color: #555;
+    }
+"""
+
+
 class InstallThread(QThread):
     """Thread for installing dependencies."""
     finished = pyqtSignal(bool, str)
@@ -29,26 +139,55 @@ class InstallThread(QThread):
     def run(self):
         """Run the installation."""
         self.progress.emit(f"Installing {self.dep.name}...")
-        success, message = self.checker.install_via_pip(self.dep)
+        success, message = self.checker.install_via_pip(self.dep, self.progress.emit)
+        self.finished.emit(success, message)
+
+
+class InstallAllThread(QThread):
+    """Thread for installing several dependencies with one pip run."""
+    finished = pyqtSignal(bool, str)
+    progress = pyqtSignal(str)
+    
+    def __init__(self, deps: List[Dependency]):
+        super().__init__()
+        self.deps = deps
+        self.checker = DependencyChecker()
+    
+    def run(self):
+        """Run the installation."""
+        self.progress.emit(f"Installing {', '.join(dep.name for dep in self.deps)}...")
+        success, message = self.checker.install_many_via_pip(self.deps, self.progress.emit)
         self.finished.emit(success, message)
 
 
+class CheckThread(QThread):
+    """Thread for checking dependencies off the GUI thread."""
+    results_ready = pyqtSignal(dict)
+    
+    def __init__(self, checker: DependencyChecker):
+        super().__init__()
+        self.checker = checker
+        self.results: Optional[Dict] = None
+    
+    def run(self):
+        """Run the dependency check."""
+        self.results = self.checker.check_all()
+        self.results_ready.emit(self.results)
+
+
 class DependencyCard(QWidget):
     """A card widget for displaying a dependency."""
     
-    def __init__(self, dep_info: dict, checker: DependencyChecker, parent=None):
+    # Emitted with the dependency name after a successful install
+    installed = pyqtSignal(str)
+    
+    def __init__(self, dep_info: dict, dep: Dependency, checker: DependencyChecker, parent=None):
         super().__init__(parent)
         self.dep_info = dep_info
         self.checker = checker
-        self.dep = None
+        self.dep = dep
         self.install_thread = None
         
-        # Find the actual dependency object
-        for dep in checker.dependencies:
-            if dep.name == dep_info['name']:
-                self.dep = dep
-                break
-        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -61,17 +200,12 @@ class DependencyCard(QWidget):
         header_layout = QHBoxLayout()
         
         # Status icon and name
-        self.status_label = QLabel(self.dep_info['icon'])
-        status_font = QFont()
-        status_font.setPointSize(16)
-        self.status_label.setFont(status_font)
+        self.status_label = QLabel()
+        self.status_label.setPixmap(_status_pixmap(self.dep_info['icon']))
         header_layout.addWidget(self.status_label)
         
         name_label = QLabel(self.dep_info['name'])
-        name_font = QFont()
-        name_font.setPointSize(13)
-        name_font.setBold(True)
-        name_label.setFont(name_font)
+        name_label.setFont(_font(13, bold=True))
         header_layout.addWidget(name_label)
         
         header_layout.addStretch()
@@ -79,89 +213,73 @@ class DependencyCard(QWidget):
         # Optional badge
         if self.dep_info['is_optional']:
             optional_label = QLabel("Optional")
-            optional_font = QFont()
-            optional_font.setPointSize(9)
-            optional_label.setFont(optional_font)
-            optional_label.setStyleSheet("color: #666; background: #f0f0f0; padding: 4px 8px; border-radius: 4px;")
+            optional_label.setFont(_font(9))
+            optional_label.setObjectName("optionalBadge")
             header_layout.addWidget(optional_label)
         
         layout.addLayout(header_layout)
         
         # Description
         desc_label = QLabel(self.dep_info['description'])
-        desc_font = QFont()
-        desc_font.setPointSize(10)
-        desc_label.setFont(desc_font)
-        desc_label.setStyleSheet("color: #666;")
+        desc_label.setFont(_font(10))
+        desc_label.setObjectName("depDescription")
         desc_label.setWordWrap(True)
         layout.addWidget(desc_label)
         
-        # Install button (if not installed and can be installed via pip)
-        if (self.dep_info['status'] == 'not_installed' and 
-            self.checker.can_install_via_pip(self.dep)):
-            button_layout = QHBoxLayout()
-            button_layout.addStretch()
-            
-            self.install_button = QPushButton("Install via pip")
-            self.install_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2196F3;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 6px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #1976D2;
-                }
-                QPushButton:pressed {
-                    background-color: #0D47A1;
-                }
-                QPushButton:disabled {
-                    background-color: #ccc;
-                }
-            """)
-            self.install_button.clicked.connect(self._install_dependency)
-            button_layout.addWidget(self.install_button)
-            
-            self.progress_bar = QProgressBar()
-            self.progress_bar.setRange(0, 0)  # Indeterminate
-            self.progress_bar.setVisible(False)
-            button_layout.addWidget(self.progress_bar)
-            
-            layout.addLayout(button_layout)
+        # Install button (shown while not installed, if installable via pip)
+        self.install_row = QWidget()
+        button_layout = QHBoxLayout(self.install_row)
+        button_layout.setContentsMargins(0, 0, 0, 0)
+        button_layout.addStretch()
         
-        # Instructions (if not installed)
-        if self.dep_info['status'] == 'not_installed':
-            instructions_text = self.checker.get_install_instructions(self.dep)
-            
-            instructions_label = QTextEdit()
-            instructions_label.setReadOnly(True)
-            instructions_label.setPlainText(instructions_text)
-            instructions_label.setStyleSheet("""
-                QTextEdit {
-                    background-color: #f5f5f5;
-                    padding: 12px;
-                    border-radius: 6px;
-                    border: 1px solid #e0e0e0;
-                    color: #333;
-                    font-family: 'Monospace', 'Courier New', monospace;
-                    font-size: 10pt;
-                }
-            """)
-            instructions_label.setMaximumHeight(250)
-            layout.addWidget(instructions_label)
-        
-        # Styling
-        self.setStyleSheet("""
-            QWidget {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-            }
-        """)
+        self.install_button = QPushButton("Install via pip")
+        self.install_button.setObjectName("installButton")
+        self.install_button.clicked.connect(self._install_dependency)
+        button_layout.addWidget(self.install_button)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)  # Indeterminate
+        self.progress_bar.setVisible(False)
+        button_layout.addWidget(self.progress_bar)
+        
+        layout.addWidget(self.install_row)
+        
+        # Instructions (built on first need, shown while not installed)
+        self.instructions_text: Optional[QLabel] = None
+        
+        # Styling (rules live in the dialog's _DIALOG_QSS)
+        self.setObjectName("depCard")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.setMinimumHeight(120)
+        
+        self.apply(self.dep_info)
+    
+    def apply(self, dep_info: dict):
+        """Update the card in place for a new check result."""
+        self.dep_info = dep_info
+        not_installed = dep_info['status'] == 'not_installed'
+        
+        self.status_label.setPixmap(_status_pixmap(dep_info['icon']))
+        self.install_row.setVisible(not_installed and dep_info['pip_installable'])
+        if not_installed and self.instructions_text is None:
+            self._create_instructions()
+        if self.instructions_text is not None:
+            self.instructions_text.setVisible(not_installed)
+    
+    def _create_instructions(self):
+        """Build the instructions box; cards of installed dependencies never need it."""
+        # Instructions depend only on the Dependency, so they are set once
+        self.instructions_text = QLabel(self.checker.get_install_instructions(self.dep))
+        self.instructions_text.setTextFormat(Qt.TextFormat.PlainText)
+        self.instructions_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.instructions_text.setWordWrap(True)
+        self.instructions_text.setObjectName("installInstructions")
+        self.layout().addWidget(self.instructions_text)
+    
+    def wait_for_install(self):
+        """Block until any running installation thread has exited."""
+        if self.install_thread is not None:
+            self.install_thread.wait()
     
     def _install_dependency(self):
         """Install the dependency."""
@@ -182,17 +300,20 @@ class DependencyCard(QWidget):
     
     def _on_install_finished(self, success: bool, message: str):
         """Handle installation completion."""
+        # The signal is emitted just before run() returns; let the thread exit
+        # before dropping the last reference to it
+        self.install_thread.wait()
         self.install_thread = None
         self.progress_bar.setVisible(False)
         self.install_button.setEnabled(True)
         
         if success:
             QMessageBox.information(self, "Success", f"{self.dep_info['name']} installed successfully!\n\nPlease restart the application.")
-            self.status_label.setText("✅")
+            self.status_label.setPixmap(_status_pixmap("✅"))
             self.dep_info['status'] = 'installed'
+            self.installed.emit(self.dep_info['name'])
             # Hide install button
-            if hasattr(self, 'install_button'):
-                self.install_button.setVisible(False)
+            self.install_row.setVisible(False)
         else:
             QMessageBox.warning(self, "Installation Failed", f"Failed to install {self.dep_info['name']}:\n\n{message}")
 
@@ -203,6 +324,13 @@ class DependencyDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.checker = DependencyChecker()
+        # Last check_all() results; None until checked or after invalidation
+        self._results: Optional[Dict] = None
+        # Cards by dependency name, reused across refreshes
+        self._cards: Dict[str, DependencyCard] = {}
+        # In-flight background check / batch install, if any
+        self._check_thread: Optional[CheckThread] = None
+        self._install_all_thread: Optional[InstallAllThread] = None
         self.setWindowTitle("Dependency Check")
         self.setMinimumSize(800, 600)
         
@@ -211,16 +339,15 @@ class DependencyDialog(QDialog):
     
     def _setup_ui(self):
         """Set up the UI."""
+        self.setStyleSheet(_DIALOG_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
         
         # Title
         title_label = QLabel("Dependency Check")
-        title_font = QFont()
-        title_font.setPointSize(20)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_font(20, bold=True))
         layout.addWidget(title_label)
         
         # Description
@@ -229,28 +356,34 @@ class DependencyDialog(QDialog):
             "Some can be installed automatically, while others require manual installation."
         )
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #666; padding-bottom: 10px;")
+        desc_label.setObjectName("dialogDescription")
         layout.addWidget(desc_label)
         
         # Status summary
         self.status_label = QLabel()
-        status_font = QFont()
-        status_font.setPointSize(11)
-        self.status_label.setFont(status_font)
-        self.status_label.setStyleSheet("padding: 12px; background: #f5f5f5; border-radius: 6px;")
+        self.status_label.setFont(_font(11))
+        self.status_label.setObjectName("statusSummary")
         layout.addWidget(self.status_label)
         
+        # Shown while a check runs in the background
+        self.check_progress = QProgressBar()
+        self.check_progress.setRange(0, 0)  # Indeterminate
+        self.check_progress.setTextVisible(False)
+        self.check_progress.setVisible(False)
+        layout.addWidget(self.check_progress)
+        
         # Scroll area for dependency cards
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
         
         scroll_widget = QWidget()
         scroll_layout = QVBoxLayout(scroll_widget)
         scroll_layout.setSpacing(15)
         scroll_layout.setContentsMargins(0, 0, 0, 0)
         
+        scroll_layout.addStretch()
+        
         self.cards_container = scroll_layout
         scroll.setWidget(scroll_widget)
         
@@ -260,90 +393,178 @@ class DependencyDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         
+        self.install_all_button = QPushButton("Install all missing (pip)")
+        self.install_all_button.setObjectName("secondaryButton")
+        self.install_all_button.setVisible(False)
+        self.install_all_button.clicked.connect(self._install_all_missing)
+        button_layout.addWidget(self.install_all_button)
+        
         self.refresh_button = QPushButton("Refresh")
-        self.refresh_button.setStyleSheet("""
-            QPushButton {
-                background-color: #666;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #555;
-            }
-        """)
-        self.refresh_button.clicked.connect(self._check_dependencies)
+        self.refresh_button.setObjectName("secondaryButton")
+        self.refresh_button.clicked.connect(self._refresh)
         button_layout.addWidget(self.refresh_button)
         
         self.close_button = QPushButton("Close")
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
+        self.close_button.setObjectName("primaryButton")
         self.close_button.clicked.connect(self.accept)
         button_layout.addWidget(self.close_button)
         
         layout.addLayout(button_layout)
     
+    def _get_results(self) -> Dict:
+        """Get dependency check results, probing only when not yet cached."""
+        if self._results is None:
+            if self._check_thread is not None:
+                # A background check is running; use its results
+                self._check_thread.wait()
+                self._results = self._check_thread.results
+            else:
+                self._results = self.checker.check_all()
+        return self._results
+    
+    def _refresh(self):
+        """Re-probe all dependencies and update the UI."""
+        self._results = None
+        self._check_dependencies()
+    
+    def _on_dependency_installed(self, name: str):
+        """Invalidate cached results once a dependency has been installed."""
+        self._results = None
+    
     def _check_dependencies(self):
-        """Check all dependencies and update the UI."""
-        results = self.checker.check_all()
+        """Check all dependencies in the background and update the UI."""
+        if self._results is not None:
+            self._apply_results(self._results)
+            return
+        if self._check_thread is not None:
+            return
         
+        self.refresh_button.setEnabled(False)
+        self.check_progress.setVisible(True)
+        self.status_label.setText("Checking dependencies...")
+        
+        self._check_thread = CheckThread(self.checker)
+        self._check_thread.results_ready.connect(self._on_check_finished)
+        self._check_thread.start()
+    
+    def _on_check_finished(self, results: Dict):
+        """Handle results from the background check."""
+        self._check_thread.wait()
+        self._check_thread = None
+        self._results = results
+        self.check_progress.setVisible(False)
+        self.refresh_button.setEnabled(True)
+        self._apply_results(results)
+    
+    def _apply_results(self, results: Dict):
+        """Update the summary and cards for check results."""
         # Update status label
         required_count = len(results['missing_required'])
         optional_count = len(results['missing_optional'])
         
         if required_count == 0 and optional_count == 0:
             self.status_label.setText("✅ All dependencies are installed!")
-            self.status_label.setStyleSheet("padding: 12px; background: #e8f5e9; border-radius: 6px; color: #2e7d32;")
+            state = "ok"
         elif required_count == 0:
             self.status_label.setText(
                 f"✅ All required dependencies are installed. "
                 f"{optional_count} optional dependency(ies) missing."
             )
-            self.status_label.setStyleSheet("padding: 12px; background: #fff3e0; border-radius: 6px; color: #f57c00;")
+            state = "warning"
         else:
             self.status_label.setText(
                 f"❌ {required_count} required dependency(ies) missing. "
                 f"{optional_count} optional dependency(ies) missing."
             )
-            self.status_label.setStyleSheet("padding: 12px; background: #ffebee; border-radius: 6px; color: #c62828;")
-        
-        # Clear existing cards
-        while self.cards_container.count():
-            item = self.cards_container.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add dependency cards
-        # Required dependencies first
-        for dep_info in results['details']:
-            if not dep_info['is_optional']:
-                card = DependencyCard(dep_info, self.checker, self)
-                self.cards_container.addWidget(card)
-        
-        # Then optional dependencies
-        for dep_info in results['details']:
-            if dep_info['is_optional']:
-                card = DependencyCard(dep_info, self.checker, self)
-                self.cards_container.addWidget(card)
-        
-        # Add stretch at the end
-        self.cards_container.addStretch()
+            state = "error"
+        
+        # Re-polish so the stylesheet's [state=...] rule takes effect
+        self.status_label.setProperty("state", state)
+        self.status_label.style().unpolish(self.status_label)
+        self.status_label.style().polish(self.status_label)
+        
+        # Offer a single pip run for everything pip can install
+        self.install_all_button.setVisible(
+            self._install_all_thread is None
+            and bool(self._missing_pip_dependencies(results))
+        )
+        
+        # Required dependencies first, then optional ones
+        details = sorted(results['details'], key=lambda info: info['is_optional'])
+        
+        # Hold repaints until every card is updated, so the list is laid out
+        # and painted once rather than once per card
+        cards_widget = self.cards_container.parentWidget()
+        cards_widget.setUpdatesEnabled(False)
+        try:
+            # Drop cards for dependencies that are no longer listed
+            names = {info['name'] for info in details}
+            for name in list(self._cards):
+                if name not in names:
+                    card = self._cards.pop(name)
+                    self.cards_container.removeWidget(card)
+                    card.deleteLater()
+            
+            # Update existing cards in place; create (before the stretch) only new ones
+            for index, dep_info in enumerate(details):
+                card = self._cards.get(dep_info['name'])
+                if card is not None:
+                    card.apply(dep_info)
+                    continue
+                
+                card = DependencyCard(
+                    dep_info, self.checker.by_name[dep_info['name']], self.checker, self
+                )
+                card.installed.connect(self._on_dependency_installed)
+                self.cards_container.insertWidget(index, card)
+                self._cards[dep_info['name']] = card
+        finally:
+            cards_widget.setUpdatesEnabled(True)
+    
+    def _missing_pip_dependencies(self, results: Dict) -> List[Dependency]:
+        """Missing dependencies (required and optional) installable via pip."""
+        return [
+            dep for dep in results['missing_required'] + results['missing_optional']
+            if self.checker.can_install_via_pip(dep)
+        ]
+    
+    def _install_all_missing(self):
+        """Install every missing pip dependency in one pip run."""
+        deps = self._missing_pip_dependencies(self._get_results())
+        if not deps or self._install_all_thread:
+            return
+        
+        self.install_all_button.setEnabled(False)
+        self.check_progress.setVisible(True)
+        
+        self._install_all_thread = InstallAllThread(deps)
+        self._install_all_thread.progress.connect(self.status_label.setText)
+        self._install_all_thread.finished.connect(self._on_install_all_finished)
+        self._install_all_thread.start()
+    
+    def _on_install_all_finished(self, success: bool, message: str):
+        """Handle batch installation completion."""
+        self._install_all_thread.wait()
+        self._install_all_thread = None
+        self.check_progress.setVisible(False)
+        self.install_all_button.setEnabled(True)
+        
+        if success:
+            QMessageBox.information(self, "Success", f"{message}\n\nPlease restart the application.")
+        else:
+            QMessageBox.warning(self, "Installation Failed", message)
+        self._refresh()
     
     def can_continue(self) -> bool:
         """Check if all required dependencies are installed."""
-        results = self.checker.check_all()
-        return results['required_installed']
+        return self._get_results()['required_installed']
+    
+    def done(self, result: int):
+        """Wait for any background work before the dialog closes."""
+        for thread in (self._check_thread, self._install_all_thread):
+            if thread is not None:
+                thread.wait()
+        for card in self._cards.values():
+            card.wait_for_install()
+        super().done(result)
 
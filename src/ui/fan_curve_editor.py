@@ -5,66 +5,59 @@ Fan Curve Editor Widget
 Interactive fan curve editor with draggable control points.
 """
 
+import time
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QButtonGroup, QMessageBox, QSpinBox, QFormLayout, QGroupBox,
-    QComboBox
+    QComboBox, QGraphicsItem
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QRectF, QTimer
 from PyQt6.QtGui import QFont, QPainter, QPen, QBrush, QColor, QMouseEvent
 import pyqtgraph as pg
 import numpy as np
 
-from ..control.asusctl_interface import FanCurve, FanCurvePoint, Profile, AsusctlInterface
-from ..control.profile_manager import ProfileManager, SavedProfile
+from ..control.asusctl_interface import (
+    FanCurve, FanCurvePoint, Profile, AsusctlInterface, get_preset_curve
+)
 from ..control.profile_manager import ProfileManager, SavedProfile
 
 
-class DraggablePoint(pg.ScatterPlotItem):
-    """A draggable point on the fan curve."""
-    
-    def __init__(self, x, y, parent_editor):
-        super().__init__([x], [y], 
-                        pen=pg.mkPen(color='#2196F3', width=2),
-                        brush=pg.mkBrush(color='white'),
-                        size=12,
-                        hoverable=True,
-                        hoverPen=pg.mkPen(color='#2196F3', width=3))
-        self.parent_editor = parent_editor
-        self.original_temp = x
-        self.original_speed = y
-        self.setAcceptHoverEvents(True)
-    
-    def set_selected(self, selected):
-        """Update selection state."""
-        if selected:
-            self.setBrush(pg.mkBrush(color='#2196F3'))
-            self.setPen(pg.mkPen(color='#2196F3', width=2))
-        else:
-            self.setBrush(pg.mkBrush(color='white'))
-            self.setPen(pg.mkPen(color='#2196F3', width=2))
-
-
 class FanCurveEditor(QWidget):
     """Interactive fan curve editor widget."""
     
     curve_changed = pyqtSignal(FanCurve)
     
+    # How long "Test Fan" holds the fan at 100%
+    TEST_FAN_SECONDS = 5
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_curve = None
         self.original_curve = None
-        self.control_points = []
         self.selected_point_temp = None  # Track by temperature, not index
         self.temp_range = (30, 90)  # Temperature range in Celsius
         self.speed_range = (0, 100)  # Fan speed range in %
         self.asusctl = AsusctlInterface()
         self.profile_manager = ProfileManager()
-        self.test_restore_timer = None
-        self.test_countdown_timer = None
         self.test_seconds_remaining = 0
+        self.test_fan_name = None
+        self._test_profile = None
+        self._test_start = 0.0
         self.original_curve_before_test = None
         
+        # One timer drives both the fan test countdown and the restore; it is
+        # restarted for each test run
+        self.test_countdown_timer = QTimer(self)
+        self.test_countdown_timer.setInterval(1000)  # Update every second
+        self.test_countdown_timer.timeout.connect(self.update_test_countdown)
+        
+        # Coalesces bursts of edits into one redraw per frame (~60 Hz)
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self._do_update_display)
+        
         self.setup_ui()
         self.refresh_profile_dropdown()
         
@@ -167,6 +160,25 @@ class FanCurveEditor(QWidget):
         # Scene for interactive points
         self.plot_item = self.graph_widget.getPlotItem()
         
+        # One scatter item holds every control point; clicks report the
+        # index of the point hit
+        self.points_scatter = pg.ScatterPlotItem(
+            pen=pg.mkPen(color='#2196F3', width=2),
+            brush=pg.mkBrush(color='white'),
+            size=12,
+            symbol='o',
+            hoverable=True,
+            hoverPen=pg.mkPen(color='#2196F3', width=3)
+        )
+        self.points_scatter.sigClicked.connect(self._on_scatter_clicked)
+        self.plot_item.addItem(self.points_scatter)
+        
+        # Keep the rendered curve and points as pixmaps so repaints caused by
+        # other widgets (e.g. the test countdown) don't re-rasterize them;
+        # setData() invalidates the cache when the curve changes
+        self.curve_plot.curve.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.points_scatter.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        
         graph_layout.addWidget(self.graph_widget)
         graph_container.setStyleSheet("""
             QWidget {
@@ -343,7 +355,7 @@ class FanCurveEditor(QWidget):
         layout.addWidget(update_point_btn)
         
         # Test Fan button
-        self.test_fan_btn = QPushButton("Test Fan (100% for 5s)")
+        self.test_fan_btn = QPushButton(self._test_fan_label())
         self.test_fan_btn.setStyleSheet("""
             QPushButton {
                 background-color: #FF5722;
@@ -389,7 +401,7 @@ class FanCurveEditor(QWidget):
     def load_curve(self, curve: FanCurve):
         """Load a fan curve into the editor."""
         self.original_curve = curve
-        self.current_curve = FanCurve([FanCurvePoint(p.temperature, p.fan_speed) for p in curve.points])
+        self.current_curve = curve.copy()
         # Clear profile dropdown selection when loading manually (only if not blocked)
         if hasattr(self, 'profile_dropdown') and not self.profile_dropdown.signalsBlocked():
             self.profile_dropdown.setCurrentIndex(0)
@@ -397,9 +409,7 @@ class FanCurveEditor(QWidget):
     
     def load_preset(self, preset_name: str):
         """Load a preset curve."""
-        from ..control.asusctl_interface import get_preset_curve
-        preset = get_preset_curve(preset_name)
-        self.load_curve(preset)
+        self.load_curve(get_preset_curve(preset_name))
     
     def refresh_profile_dropdown(self):
         """Refresh the profile dropdown with saved profiles."""
@@ -410,8 +420,8 @@ class FanCurveEditor(QWidget):
         self.profile_dropdown.clear()
         self.profile_dropdown.addItem("-- Select Profile --")
         
-        # Load all profiles
-        self.profile_manager.load_all_profiles()
+        # Re-read profiles only if the files changed (another tab may have saved)
+        self.profile_manager.reload_if_changed()
         profiles = self.profile_manager.list_profiles()
         for profile_name in profiles:
             self.profile_dropdown.addItem(profile_name)
@@ -512,58 +522,48 @@ class FanCurveEditor(QWidget):
                 QMessageBox.warning(self, "Error", "Failed to save profile.")
     
     def update_display(self):
+        """Schedule a graph redraw; repeated calls before it runs are merged."""
+        self.selected_point_temp = None
+        self._redraw_timer.start()
+    
+    def _do_update_display(self):
         """Update the graph display."""
-        if not self.current_curve or not self.current_curve.points:
+        if not self.current_curve:
             return
         
-        # Clear existing points
-        for item in self.control_points:
-            if isinstance(item, tuple) and len(item) >= 2:
-                scatter = item[0]
-                self.plot_item.removeItem(scatter)
-        self.control_points.clear()
-        self.selected_point_temp = None
-        
         # Plot the curve
-        temps = [p.temperature for p in self.current_curve.points]
-        speeds = [p.fan_speed for p in self.current_curve.points]
+        temps = self.current_curve.temperatures
+        speeds = self.current_curve.speeds
         
-        # Create smooth curve for display
+        # Create smooth curve for display; the samples include the control
+        # points themselves so the corners of the piecewise-linear curve are kept
         if len(temps) >= 2:
-            smooth_temps = np.linspace(min(temps), max(temps), 200)
-            smooth_speeds = [self.current_curve.get_fan_speed_at_temp(int(t)) for t in smooth_temps]
+            smooth_temps = np.union1d(
+                np.linspace(temps[0], temps[-1], max(50, 2 * len(temps))),
+                temps
+            )
+            smooth_speeds = self.current_curve.get_fan_speeds_at_temps(smooth_temps)
             self.curve_plot.setData(smooth_temps, smooth_speeds)
         else:
             self.curve_plot.setData(temps, speeds)
         
-        # Add control points using scatter plot
-        for i, point in enumerate(self.current_curve.points):
-            scatter = pg.ScatterPlotItem(
-                [point.temperature], [point.fan_speed],
-                pen=pg.mkPen(color='#2196F3', width=2),
-                brush=pg.mkBrush(color='white'),
-                size=12,
-                symbol='o',
-                hoverable=True,
-                hoverPen=pg.mkPen(color='#2196F3', width=3)
-            )
-            # Create a closure to capture the index correctly
-            def make_click_handler(idx):
-                def handler(item, points, ev):
-                    self.on_point_clicked(idx)
-                return handler
-            
-            scatter.sigClicked.connect(make_click_handler(i))
-            self.plot_item.addItem(scatter)
-            self.control_points.append((scatter, point, i))
+        # Update control points
+        self.points_scatter.setData(x=temps, y=speeds)
+    
+    def _on_scatter_clicked(self, item, points, ev=None):
+        """Handle a click on the control point scatter."""
+        if len(points):
+            self.on_point_clicked(points[0].index())
     
     def on_point_clicked(self, index):
         """Handle point click."""
-        if self.control_points and index < len(self.control_points):
-            scatter, point, idx = self.control_points[index]
-            self.temp_input.setValue(point.temperature)
-            self.speed_input.setValue(point.fan_speed)
-            self.selected_point_temp = point.temperature  # Track by temperature
+        # Read the point as drawn, which is what the user clicked on
+        data = self.points_scatter.data
+        if index < len(data):
+            temp = int(data['x'][index])
+            self.temp_input.setValue(temp)
+            self.speed_input.setValue(int(data['y'][index]))
+            self.selected_point_temp = temp  # Track by temperature
     
     def add_point_from_inputs(self):
         """Add or update a point from the input fields."""
@@ -618,8 +618,12 @@ class FanCurveEditor(QWidget):
             return "GPU"
         return "CPU"
     
+    def _test_fan_label(self) -> str:
+        """Idle text for the Test Fan button."""
+        return f"Test Fan (100% for {self.TEST_FAN_SECONDS}s)"
+    
     def test_fan(self):
-        """Test fan by setting it to 100% for 5 seconds with countdown."""
+        """Test fan by setting it to 100% for TEST_FAN_SECONDS with countdown."""
         if not self.asusctl.is_available():
             QMessageBox.warning(
                 self,
@@ -634,7 +638,7 @@ class FanCurveEditor(QWidget):
         reply = QMessageBox.question(
             self,
             "Test Fan",
-            f"This will set the {fan_name} fan to 100% for 5 seconds.\n\n"
+            f"This will set the {fan_name} fan to 100% for {self.TEST_FAN_SECONDS} seconds.\n\n"
             "The fan will be very loud. Continue?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
@@ -643,22 +647,16 @@ class FanCurveEditor(QWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
         
-        # Stop any existing timers
-        if self.test_restore_timer:
-            self.test_restore_timer.stop()
-        if self.test_countdown_timer:
-            self.test_countdown_timer.stop()
+        # Stop any existing test
+        self.test_countdown_timer.stop()
         
         # Disable button during test
         self.test_fan_btn.setEnabled(False)
-        self.test_seconds_remaining = 5
+        self.test_seconds_remaining = self.TEST_FAN_SECONDS
         
         # Save original curve
         if self.current_curve:
-            self.original_curve_before_test = FanCurve([
-                FanCurvePoint(p.temperature, p.fan_speed) 
-                for p in self.current_curve.points
-            ])
+            self.original_curve_before_test = self.current_curve.copy()
         
         # Create max curve for testing
         max_curve = FanCurve([
@@ -677,7 +675,7 @@ class FanCurveEditor(QWidget):
         if not success:
             QMessageBox.warning(self, "Test Failed", f"Failed to test fan:\n{message}")
             self.test_fan_btn.setEnabled(True)
-            self.test_fan_btn.setText("Test Fan (100% for 5s)")
+            self.test_fan_btn.setText(self._test_fan_label())
             return
         
         # Update button text to show starting
@@ -687,16 +685,12 @@ class FanCurveEditor(QWidget):
         from PyQt6.QtCore import QCoreApplication
         QCoreApplication.processEvents()
         
-        # Start countdown timer (updates every second) - must be singleShot=False for repeating
-        self.test_countdown_timer = QTimer(self)
-        self.test_countdown_timer.timeout.connect(self.update_test_countdown)
-        self.test_countdown_timer.start(1000)  # Update every second
-        
-        # Set timer to restore after 5 seconds
-        self.test_restore_timer = QTimer(self)
-        self.test_restore_timer.setSingleShot(True)
-        self.test_restore_timer.timeout.connect(lambda: self.restore_after_test(fan_name, current_profile))
-        self.test_restore_timer.start(5000)  # 5 seconds
+        # Remaining time comes from a monotonic start so timer jitter cannot
+        # drift the countdown and the restore apart
+        self.test_fan_name = fan_name
+        self._test_profile = current_profile
+        self._test_start = time.monotonic()
+        self.test_countdown_timer.start()
         
         # Initial countdown update - show immediately
         self.update_test_countdown()
@@ -711,26 +705,24 @@ class FanCurveEditor(QWidget):
         QTimer.singleShot(2000, msg_box.close)
     
     def update_test_countdown(self):
-        """Update the countdown display during fan test."""
-        if not hasattr(self, 'test_seconds_remaining') or not hasattr(self, 'test_fan_name'):
+        """Update the countdown display during fan test, restoring when it ends."""
+        if self.test_fan_name is None:
             return
         
+        elapsed = time.monotonic() - self._test_start
+        self.test_seconds_remaining = max(0, round(self.TEST_FAN_SECONDS - elapsed))
+        
         if self.test_seconds_remaining > 0:
             self.test_fan_btn.setText(
                 f"⏱️ Testing {self.test_fan_name} Fan: {self.test_seconds_remaining}s remaining (100% speed)"
             )
-            self.test_seconds_remaining -= 1
-        elif self.test_seconds_remaining == 0:
-            self.test_fan_btn.setText(f"⏳ Restoring {self.test_fan_name} Fan to previous settings...")
-            # Stop countdown timer
-            if self.test_countdown_timer:
-                self.test_countdown_timer.stop()
+        else:
+            self.restore_after_test(self.test_fan_name, self._test_profile)
     
     def restore_after_test(self, fan_name: str, profile: Profile):
         """Restore fan curve after test."""
         # Stop countdown timer
-        if self.test_countdown_timer:
-            self.test_countdown_timer.stop()
+        self.test_countdown_timer.stop()
         
         # Update button to show restoring
         self.test_fan_btn.setText(f"Restoring {fan_name} Fan to previous settings...")
@@ -766,8 +758,7 @@ class FanCurveEditor(QWidget):
         
         # Re-enable button and reset text
         self.test_fan_btn.setEnabled(True)
-        self.test_fan_btn.setText("Test Fan (100% for 5s)")
-        self.test_restore_timer = None
-        self.test_countdown_timer = None
+        self.test_fan_btn.setText(self._test_fan_label())
         self.test_seconds_remaining = 0
+        self.test_fan_name = None
 
@@ -19,11 +19,22 @@ from ..monitoring.log_monitor import LogMonitor, LogEntry, LogPriority
 class LogViewerTab(QWidget):
     """Tab for viewing and filtering system logs."""
     
+    # Carry batches of entries and error messages from the monitor's
+    # threads to the GUI thread
+    entries_received = pyqtSignal(list)
+    error_received = pyqtSignal(str)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.log_monitor = LogMonitor(update_interval=1.0, max_entries=2000)
-        self.log_monitor.on_new_entry = self._on_new_entry
-        self.log_monitor.on_error = self._on_error
+        self.entries_received.connect(
+            self._on_new_entries, Qt.ConnectionType.QueuedConnection
+        )
+        self.error_received.connect(
+            self._on_error, Qt.ConnectionType.QueuedConnection
+        )
+        self.log_monitor = LogMonitor(max_entries=2000)
+        self.log_monitor.on_new_entries = self.entries_received.emit
+        self.log_monitor.on_error = self.error_received.emit
         
         self.setup_ui()
         self.log_monitor.start()
@@ -232,10 +243,11 @@ class LogViewerTab(QWidget):
         
         return panel
     
-    def _on_new_entry(self, entry: LogEntry):
-        """Handle new log entry."""
+    def _on_new_entries(self, entries: list):
+        """Handle a batch of new log entries."""
         if not self.pause_btn.isChecked():
-            self._append_entry(entry)
+            for entry in entries:
+                self._append_entry(entry)
             
             # Auto-scroll if enabled
             if self.autoscroll_btn.isChecked():
@@ -329,6 +341,8 @@ class LogViewerTab(QWidget):
         else:
             self.log_monitor.resume()
             self.pause_btn.setText("⏸ Pause")
+            # Entries recorded while paused are not streamed; show them now
+            self._refresh_display()
     
     def _clear_logs(self):
         """Clear log display."""
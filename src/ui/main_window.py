@@ -9,8 +9,9 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QTabWidget, QPushButton, QStatusBar, QMenuBar, QMenu
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QAction
+from typing import Dict, Optional
 
 from ..monitoring.system_monitor import SystemMonitor
 from .dashboard_widgets import MetricCard, GraphWidget
@@ -25,6 +26,9 @@ from ..control.profile_manager import ProfileManager
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    # Carries (metrics, history) snapshots from the monitor thread
+    metrics_updated = pyqtSignal(dict, dict)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Daemon Breathalyzer")
@@ -37,8 +41,12 @@ class MainWindow(QMainWindow):
             }
         """)
         
-        # Initialize system monitor
+        # Initialize system monitor; it pushes each update to the dashboard
+        self.metrics_updated.connect(
+            self.update_dashboard, Qt.ConnectionType.QueuedConnection
+        )
         self.monitor = SystemMonitor(update_interval=1.0)
+        self.monitor.on_update = self.metrics_updated.emit
         self.monitor.start()
         
         # Create menu bar
@@ -112,11 +120,6 @@ class MainWindow(QMainWindow):
         """)
         self.statusBar().showMessage("Monitoring active")
         
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_dashboard)
-        self.update_timer.start(1000)  # Update every second
-        
         # Initial update
         self.update_dashboard()
     
@@ -319,10 +322,12 @@ class MainWindow(QMainWindow):
         from .log_viewer_tab import LogViewerTab
         return LogViewerTab(self)
     
-    def update_dashboard(self):
-        """Update all dashboard widgets with latest metrics."""
-        metrics = self.monitor.get_metrics()
-        history = self.monitor.get_history()
+    def update_dashboard(self, metrics: Optional[Dict] = None, history: Optional[Dict] = None):
+        """Update all dashboard widgets with the given (or latest) metrics."""
+        if metrics is None:
+            metrics = self.monitor.get_metrics()
+        if history is None:
+            history = self.monitor.get_history()
         
         # Update metric cards
         self.cpu_percent_card.set_value(metrics['cpu_percent'])
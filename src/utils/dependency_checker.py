@@ -9,9 +9,18 @@ import subprocess
 import sys
 import importlib
 import shutil
-from typing import Dict, List, Tuple, Optional
+from functools import cached_property
+from threading import Lock
+from typing import Callable, Dict, List, Tuple, Optional
 from enum import Enum
 
+from .process import run_streaming
+
+
+# pip is not safe to run concurrently against one environment, so installs
+# started from different cards or dialogs take turns
+_PIP_LOCK = Lock()
+
 
 class DependencyStatus(Enum):
     """Status of a dependency."""
@@ -68,6 +77,11 @@ class DependencyChecker:
         self.dependencies = self._initialize_dependencies()
         self.installable_via_pip = []
     
+    @cached_property
+    def by_name(self) -> Dict[str, Dependency]:
+        """Dependencies keyed by name, built on first use."""
+        return {dep.name: dep for dep in self.dependencies}
+    
     def _initialize_dependencies(self) -> List[Dependency]:
         """Initialize the list of required dependencies."""
         deps = [
@@ -221,6 +235,7 @@ class DependencyChecker:
             'description': dep.description,
             'install_instructions': dep.install_instructions,
             'pip_package': dep.pip_package,
+            'pip_installable': self.can_install_via_pip(dep),
             'is_optional': dep.is_optional,
             'system_command': dep.system_command,
             'error': dep.error_message
@@ -230,34 +245,75 @@ class DependencyChecker:
         """Check if a dependency can be installed via pip."""
         return dep.pip_package is not None and dep.system_command is None
     
-    def install_via_pip(self, dep: Dependency) -> Tuple[bool, str]:
+    def install_via_pip(self, dep: Dependency,
+                        on_output: Optional[Callable[[str], None]] = None) -> Tuple[bool, str]:
         """
         Attempt to install a dependency via pip.
         
+        Args:
+            on_output: Optional callback receiving each line pip prints
+        
         Returns:
             Tuple of (success: bool, message: str)
         """
         if not self.can_install_via_pip(dep):
             return False, "Cannot install via pip"
         
+        return self.install_many_via_pip([dep], on_output)
+    
+    def install_many_via_pip(self, deps: List[Dependency],
+                             on_output: Optional[Callable[[str], None]] = None) -> Tuple[bool, str]:
+        """
+        Attempt to install several dependencies with a single pip run.
+        
+        Dependencies that cannot be installed via pip are skipped.
+        
+        Args:
+            on_output: Optional callback receiving each line pip prints
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        deps = [dep for dep in deps if self.can_install_via_pip(dep)]
+        if not deps:
+            return False, "Nothing to install via pip"
+        
+        names = ", ".join(dep.name for dep in deps)
+        cmd = [sys.executable, "-m", "pip", "install"] + [dep.pip_package for dep in deps]
+        timeout = 120 * len(deps)
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", dep.pip_package],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-            
-            if result.returncode == 0:
-                return True, f"Successfully installed {dep.name}"
-            else:
-                error_msg = result.stderr or result.stdout
-                return False, f"Installation failed: {error_msg[:200]}"
+            with _PIP_LOCK:
+                return self._run_pip(cmd, names, timeout, on_output)
         except subprocess.TimeoutExpired:
             return False, "Installation timed out"
         except Exception as e:
             return False, f"Error: {str(e)}"
     
+    def _run_pip(self, cmd: List[str], names: str, timeout: int,
+                 on_output: Optional[Callable[[str], None]]) -> Tuple[bool, str]:
+        """Run one pip command, passing each output line to on_output."""
+        lines = []
+        def _on_line(line: str):
+            line = line.rstrip()
+            if not line:
+                return
+            lines.append(line)
+            if on_output:
+                on_output(line)
+        
+        # Read pip's output as it is printed so callers can show progress
+        returncode = run_streaming(
+            cmd, timeout, _on_line,
+            stderr=subprocess.STDOUT,
+            text=True
+        )
+        
+        if returncode == 0:
+            return True, f"Successfully installed {names}"
+        else:
+            error_msg = "\n".join(lines[-5:])
+            return False, f"Installation failed: {error_msg[-200:]}"
+    
     def get_install_instructions(self, dep: Dependency) -> str:
         """Get formatted installation instructions for a dependency."""
         instructions = []
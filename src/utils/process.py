@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Subprocess Helpers
+
+Runs commands whose output is consumed line by line under a deadline.
+"""
+
+import subprocess
+from threading import Event, Timer
+from typing import Callable, List, Union
+
+
+def run_streaming(
+    cmd: List[str],
+    timeout: float,
+    on_line: Callable[[Union[str, bytes]], None],
+    **popen_kwargs
+) -> int:
+    """
+    Run a command, passing each line of its stdout to on_line as it is read.
+    
+    Killing the child ends the read, so a stalled process cannot block the
+    caller past the deadline.
+    
+    Args:
+        timeout: Seconds before the process is killed
+        popen_kwargs: Extra subprocess.Popen arguments (stderr, text, ...)
+    
+    Returns:
+        The process exit code
+    
+    Raises:
+        subprocess.TimeoutExpired: If the deadline was reached
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, **popen_kwargs)
+    
+    expired = Event()
+    def _expire():
+        expired.set()
+        proc.kill()
+    timer = Timer(timeout, _expire)
+    timer.daemon = True
+    timer.start()
+    try:
+        for line in proc.stdout:
+            on_line(line)
+        returncode = proc.wait(timeout=timeout)
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+    
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return returncode
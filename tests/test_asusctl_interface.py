@@ -11,10 +11,17 @@ from src.control.asusctl_interface import (
     Profile,
     FanCurve,
     FanCurvePoint,
-    get_preset_curve
+    get_preset_curve,
+    _DbusBackend
 )
 
 
+@pytest.fixture(autouse=True)
+def no_dbus(monkeypatch):
+    """Keep interface tests on the asusctl CLI path regardless of host D-Bus."""
+    monkeypatch.setattr(_DbusBackend, 'connect', classmethod(lambda cls: None))
+
+
 class TestFanCurvePoint:
     """Test FanCurvePoint class."""
     
@@ -67,6 +74,13 @@ class TestFanCurve:
         assert curve.points[0].temperature == 30
         assert curve.points[1].temperature == 70
     
+    def test_curve_temperatures_and_speeds(self):
+        """Test the column accessors match the points."""
+        curve = FanCurve([FanCurvePoint(70, 80), FanCurvePoint(30, 20)])
+        
+        assert curve.temperatures == (30, 70)
+        assert curve.speeds == (20, 80)
+    
     def test_curve_auto_sorting(self):
         """Test that points are automatically sorted by temperature."""
         points = [
@@ -129,6 +143,23 @@ class TestFanCurve:
         point = next(p for p in curve.points if p.temperature == 50)
         assert point.fan_speed == 60
     
+    def test_curve_add_point_invalid_restores_curve(self):
+        """Test a rejected point leaves the curve unchanged."""
+        curve = FanCurve([
+            FanCurvePoint(30, 20),
+            FanCurvePoint(50, 50),
+            FanCurvePoint(70, 80)
+        ])
+        
+        with pytest.raises(ValueError):
+            curve.add_point(50, 90)  # Replacement breaks monotonicity
+        with pytest.raises(ValueError):
+            curve.add_point(60, 10)  # Insertion breaks monotonicity
+        
+        assert [(p.temperature, p.fan_speed) for p in curve.points] == [
+            (30, 20), (50, 50), (70, 80)
+        ]
+    
     def test_curve_remove_point(self):
         """Test removing a point from curve."""
         curve = FanCurve([
@@ -163,6 +194,20 @@ class TestFanCurve:
         assert "30 20" in result
         assert "70 80" in result
     
+    def test_curve_to_asusctl_format_tracks_changes(self):
+        """Test cached asusctl format is refreshed after edits."""
+        curve = FanCurve([
+            FanCurvePoint(30, 20),
+            FanCurvePoint(70, 80)
+        ])
+        assert curve.to_asusctl_format() == "30 20 70 80"
+        
+        curve.add_point(50, 50)
+        assert curve.to_asusctl_format() == "30 20 50 50 70 80"
+        
+        curve.remove_point(50)
+        assert curve.to_asusctl_format() == "30 20 70 80"
+    
     def test_curve_from_asusctl_format(self):
         """Test parsing curve from asusctl format."""
         curve = FanCurve.from_asusctl_format("30 20 70 80")
@@ -186,6 +231,45 @@ class TestFanCurve:
         speed = curve.get_fan_speed_at_temp(50)
         assert 20 <= speed <= 80  # Should be between the two points
     
+    def test_curve_get_fan_speeds_at_temps(self):
+        """Test batch lookup matches the scalar lookup and follows edits."""
+        curve = FanCurve([
+            FanCurvePoint(30, 20),
+            FanCurvePoint(50, 40),
+            FanCurvePoint(70, 80)
+        ])
+        temps = [20, 30, 40, 50, 65, 70, 90]
+        
+        speeds = curve.get_fan_speeds_at_temps(temps)
+        assert [round(s) for s in speeds] == [curve.get_fan_speed_at_temp(t) for t in temps]
+        
+        curve.add_point(60, 50)
+        assert curve.get_fan_speeds_at_temps([60])[0] == 50
+        
+        curve.remove_point(60)
+        assert curve.get_fan_speeds_at_temps([60])[0] == 60
+    
+    def test_curve_get_fan_speed_multi_segment(self):
+        """Test interpolation picks the correct segment on multi-point curves."""
+        curve = FanCurve([
+            FanCurvePoint(30, 20),
+            FanCurvePoint(50, 40),
+            FanCurvePoint(70, 80),
+            FanCurvePoint(85, 100)
+        ])
+        
+        assert curve.get_fan_speed_at_temp(20) == 20
+        assert curve.get_fan_speed_at_temp(40) == 30
+        assert curve.get_fan_speed_at_temp(50) == 40
+        assert curve.get_fan_speed_at_temp(60) == 60
+        assert curve.get_fan_speed_at_temp(95) == 100
+        
+        curve.add_point(60, 50)
+        assert curve.get_fan_speed_at_temp(60) == 50
+        
+        curve.remove_point(60)
+        assert curve.get_fan_speed_at_temp(60) == 60
+    
     def test_curve_to_dict(self):
         """Test converting curve to dictionary."""
         curve = FanCurve([
@@ -245,6 +329,13 @@ class TestPresetCurves:
         assert isinstance(curve, FanCurve)
         # Should default to balanced
         assert len(curve.points) > 0
+    
+    def test_get_preset_returns_independent_copy(self):
+        """Test modifying a returned preset does not affect later calls."""
+        curve = get_preset_curve('balanced')
+        curve.add_point(60, 55)
+        
+        assert len(get_preset_curve('balanced').points) == 4
 
 
 class TestAsusctlInterface:
@@ -266,6 +357,20 @@ class TestAsusctlInterface:
         interface = AsusctlInterface()
         assert interface.is_available() == False
     
+    @patch('subprocess.run')
+    def test_is_available_cached(self, mock_run):
+        """Test availability is probed once and re-probed only on refresh."""
+        mock_run.return_value = Mock(returncode=0)
+        
+        interface = AsusctlInterface()
+        interface.is_available()
+        interface.is_available()
+        assert mock_run.call_count == 1
+        
+        mock_run.side_effect = FileNotFoundError()
+        assert interface.refresh() == False
+        assert interface.is_available() == False
+    
     @patch('subprocess.run')
     def test_get_current_profile(self, mock_run):
         """Test getting current power profile."""
@@ -279,6 +384,28 @@ class TestAsusctlInterface:
         
         assert profile == Profile.BALANCED
     
+    @patch('subprocess.run')
+    def test_get_current_profile_cached(self, mock_run):
+        """Test profile queries within the TTL reuse the last result."""
+        mock_run.return_value = Mock(returncode=0, stdout="Quiet")
+        
+        interface = AsusctlInterface()
+        mock_run.reset_mock()
+        
+        assert interface.get_current_profile() == Profile.QUIET
+        assert interface.get_current_profile() == Profile.QUIET
+        assert mock_run.call_count == 1
+        
+        # A successful set updates the cache without another query
+        interface.set_profile(Profile.PERFORMANCE)
+        assert interface.get_current_profile() == Profile.PERFORMANCE
+        assert mock_run.call_count == 2
+        
+        # Expired entries are re-queried
+        interface._profile_cache = (Profile.PERFORMANCE, 0.0)
+        assert interface.get_current_profile() == Profile.QUIET
+        assert mock_run.call_count == 3
+    
     @patch('subprocess.run')
     def test_set_profile(self, mock_run):
         """Test setting power profile."""
@@ -313,6 +440,20 @@ class TestAsusctlInterface:
         
         assert isinstance(curves, dict)
     
+    @patch('subprocess.run')
+    def test_get_fan_curves_parses_multiple_fans(self, mock_run):
+        """Test parsing curve data for several fans."""
+        mock_run.return_value = Mock(
+            returncode=0,
+            stdout="CPU fan\n30 20 70 80\nGPU_fan:\n  30 10\n  85 90\nnot data 1 2"
+        )
+        
+        interface = AsusctlInterface()
+        curves = interface.get_fan_curves(Profile.BALANCED)
+        
+        assert curves['CPU'].to_asusctl_format() == "30 20 70 80"
+        assert curves['GPU_fan:'].to_asusctl_format() == "30 10 85 90"
+    
     @patch('subprocess.run')
     def test_set_fan_curve(self, mock_run):
         """Test setting fan curve."""
@@ -344,3 +485,63 @@ class TestAsusctlInterface:
         assert "enabled" in message.lower()
 
 
+
+
+class TestRunHelper:
+    """Test the shared asusctl subprocess helper."""
+    
+    @patch('subprocess.run')
+    def test_run_uses_shared_options(self, mock_run):
+        """Test commands are spawned with capture, timeout and close_fds=False."""
+        mock_run.return_value = Mock(returncode=0)
+        
+        interface = AsusctlInterface()
+        interface.set_profile(Profile.QUIET)
+        
+        args, kwargs = mock_run.call_args
+        assert args[0] == ['asusctl', 'profile', '-P', 'Quiet']
+        assert kwargs['capture_output'] is True
+        assert kwargs['timeout'] == 5
+        assert kwargs['close_fds'] is False
+
+
+class TestDbusBackend:
+    """Test D-Bus routing in AsusctlInterface."""
+    
+    @patch('subprocess.run')
+    def test_profile_via_dbus(self, mock_run):
+        """Test profile get/set use D-Bus without spawning asusctl."""
+        mock_run.return_value = Mock(returncode=0)
+        proxy = Mock()
+        proxy.ActiveProfile.return_value = 2
+        
+        interface = AsusctlInterface()
+        interface._dbus = _DbusBackend(proxy)
+        mock_run.reset_mock()
+        
+        assert interface.get_current_profile() == Profile.QUIET
+        success, message = interface.set_profile(Profile.PERFORMANCE)
+        
+        assert success == True
+        proxy.SetActiveProfile.assert_called_once_with(1)
+        mock_run.assert_not_called()
+    
+    @patch('subprocess.run')
+    def test_dbus_failure_falls_back_to_cli(self, mock_run):
+        """Test D-Bus errors fall back to the asusctl CLI."""
+        mock_run.return_value = Mock(returncode=0, stdout="Quiet")
+        proxy = Mock()
+        proxy.ActiveProfile.side_effect = RuntimeError("daemon gone")
+        
+        interface = AsusctlInterface()
+        interface._dbus = _DbusBackend(proxy)
+        
+        assert interface.get_current_profile() == Profile.QUIET
+    
+    @patch('subprocess.run')
+    def test_dbus_disabled(self, mock_run):
+        """Test use_dbus=False never connects."""
+        mock_run.return_value = Mock(returncode=0)
+        
+        interface = AsusctlInterface(use_dbus=False)
+        assert interface._dbus is None
@@ -14,6 +14,15 @@ from src.utils.dependency_checker import (
 )
 
 
+def _mock_pip(returncode, output=""):
+    """Build a mock pip process printing the given output."""
+    proc = Mock(returncode=returncode)
+    proc.stdout = iter(output.splitlines(keepends=True))
+    proc.wait.return_value = returncode
+    proc.poll.return_value = returncode
+    return proc
+
+
 class TestDependency:
     """Test Dependency class."""
     
@@ -123,6 +132,14 @@ class TestDependencyChecker:
         assert isinstance(results['missing_required'], list)
         assert isinstance(results['missing_optional'], list)
     
+    def test_dependencies_by_name(self):
+        """Test dependencies can be looked up by name."""
+        checker = DependencyChecker()
+        
+        assert checker.by_name['asusctl'].system_command == "asusctl"
+        assert checker.by_name is checker.by_name
+        assert len(checker.by_name) == len(checker.dependencies)
+    
     def test_can_install_via_pip(self):
         """Test checking if dependency can be installed via pip."""
         checker = DependencyChecker()
@@ -139,10 +156,10 @@ class TestDependencyChecker:
         )
         assert checker.can_install_via_pip(dep_system) == False
     
-    @patch('subprocess.run')
-    def test_install_via_pip_success(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_install_via_pip_success(self, mock_popen):
         """Test successful pip installation."""
-        mock_run.return_value = Mock(returncode=0, stdout="Success")
+        mock_popen.return_value = _mock_pip(0, "Success\n")
         
         checker = DependencyChecker()
         dep = Dependency(
@@ -155,10 +172,10 @@ class TestDependencyChecker:
         assert success == True
         assert "Successfully installed" in message
     
-    @patch('subprocess.run')
-    def test_install_via_pip_failure(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_install_via_pip_failure(self, mock_popen):
         """Test failed pip installation."""
-        mock_run.return_value = Mock(returncode=1, stderr="Error occurred")
+        mock_popen.return_value = _mock_pip(1, "Error occurred\n")
         
         checker = DependencyChecker()
         dep = Dependency(
@@ -170,6 +187,87 @@ class TestDependencyChecker:
         
         assert success == False
         assert "failed" in message.lower()
+        assert "Error occurred" in message
+    
+    @patch('subprocess.Popen')
+    def test_install_via_pip_streams_output(self, mock_popen):
+        """Test each line pip prints is passed on as it is read."""
+        mock_popen.return_value = _mock_pip(
+            0, "Collecting test-package\n\nInstalling collected packages\n"
+        )
+        
+        checker = DependencyChecker()
+        dep = Dependency(
+            name="TestPackage",
+            pip_package="test-package"
+        )
+        lines = []
+        
+        success, message = checker.install_via_pip(dep, lines.append)
+        
+        assert success == True
+        assert lines == ["Collecting test-package", "Installing collected packages"]
+    
+    @patch('subprocess.Popen')
+    def test_install_many_via_pip_single_run(self, mock_run):
+        """Test several packages are installed with one pip run."""
+        mock_run.return_value = _mock_pip(0, "Success\n")
+        
+        checker = DependencyChecker()
+        deps = [
+            Dependency(name="First", pip_package="first-package"),
+            Dependency(name="Second", pip_package="second-package"),
+            Dependency(name="Command", system_command="some-command"),
+        ]
+        
+        success, message = checker.install_many_via_pip(deps)
+        
+        assert success == True
+        assert "First, Second" in message
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[-2:] == ["first-package", "second-package"]
+    
+    @patch('subprocess.Popen')
+    def test_install_via_pip_waits_for_running_install(self, mock_popen):
+        """Test a second install does not start pip while one is running."""
+        from threading import Thread
+        from src.utils import dependency_checker
+        
+        mock_popen.return_value = _mock_pip(0, "Success\n")
+        checker = DependencyChecker()
+        dep = Dependency(name="TestPackage", pip_package="test-package")
+        
+        with dependency_checker._PIP_LOCK:
+            thread = Thread(target=checker.install_via_pip, args=(dep,))
+            thread.start()
+            thread.join(timeout=0.2)
+            assert thread.is_alive()
+            mock_popen.assert_not_called()
+        
+        thread.join(timeout=5)
+        mock_popen.assert_called_once()
+    
+    @patch('subprocess.Popen')
+    def test_install_many_via_pip_nothing_installable(self, mock_run):
+        """Test nothing is run when no dependency is pip-installable."""
+        checker = DependencyChecker()
+        deps = [Dependency(name="Command", system_command="some-command")]
+        
+        success, message = checker.install_many_via_pip(deps)
+        
+        assert success == False
+        mock_run.assert_not_called()
+    
+    def test_dep_info_includes_pip_installable(self):
+        """Test check results say whether each dependency pip-installs."""
+        checker = DependencyChecker()
+        
+        results = checker.check_all()
+        details = {info['name']: info for info in results['details']}
+        
+        assert details['PyYAML']['pip_installable'] == True
+        assert details['asusctl']['pip_installable'] == False
     
     def test_get_install_instructions(self):
         """Test getting installation instructions."""
@@ -0,0 +1,164 @@
+"""
+Tests for the dependency dialog.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.ui.dependency_dialog import DependencyCard, DependencyDialog, _status_pixmap
+
+
+def _wait_for_check(qtbot, dialog):
+    """Wait until the dialog's background check has been applied."""
+    qtbot.waitUntil(lambda: dialog._check_thread is None, timeout=10000)
+
+
+@pytest.mark.ui
+class TestDependencyDialog:
+    """Test DependencyDialog."""
+    
+    def test_results_cached_until_refresh(self, qapp, qtbot):
+        """Test dependencies are probed once until Refresh is clicked."""
+        with patch('src.ui.dependency_dialog.DependencyChecker.check_all',
+                   autospec=True) as mock_check_all:
+            mock_check_all.side_effect = lambda checker: {
+                'all_installed': True,
+                'required_installed': True,
+                'missing_required': [],
+                'missing_optional': [],
+                'details': [],
+            }
+            dialog = DependencyDialog()
+            
+            assert dialog.can_continue() is True
+            assert mock_check_all.call_count == 1
+            _wait_for_check(qtbot, dialog)
+            
+            dialog.refresh_button.click()
+            assert dialog.can_continue() is True
+            assert mock_check_all.call_count == 2
+            _wait_for_check(qtbot, dialog)
+    
+    def test_check_runs_in_background(self, qapp, qtbot):
+        """Test the check runs off the GUI thread with Refresh disabled."""
+        dialog = DependencyDialog()
+        
+        assert dialog._check_thread is not None
+        assert not dialog.refresh_button.isEnabled()
+        
+        _wait_for_check(qtbot, dialog)
+        
+        assert dialog.refresh_button.isEnabled()
+        assert dialog.check_progress.isHidden()
+        assert dialog._cards
+    
+    def test_install_invalidates_results(self, qapp, qtbot):
+        """Test a successful install forces the next check to re-probe."""
+        dialog = DependencyDialog()
+        dialog.can_continue()
+        _wait_for_check(qtbot, dialog)
+        
+        with patch.object(dialog.checker, 'check_all',
+                          wraps=dialog.checker.check_all) as mock_check_all:
+            dialog.can_continue()
+            mock_check_all.assert_not_called()
+            
+            dialog._on_dependency_installed("PyYAML")
+            dialog.can_continue()
+            mock_check_all.assert_called_once()
+    
+    def test_refresh_reuses_cards(self, qapp, qtbot):
+        """Test Refresh updates existing cards instead of rebuilding them."""
+        dialog = DependencyDialog()
+        _wait_for_check(qtbot, dialog)
+        cards = dict(dialog._cards)
+        
+        assert set(cards) == {dep.name for dep in dialog.checker.dependencies}
+        
+        dialog.refresh_button.click()
+        _wait_for_check(qtbot, dialog)
+        
+        assert all(dialog._cards[name] is card for name, card in cards.items())
+    
+    def test_card_apply_toggles_install_widgets(self, qapp, qtbot):
+        """Test a card shows install widgets only while not installed."""
+        dialog = DependencyDialog()
+        _wait_for_check(qtbot, dialog)
+        card = dialog._cards['PyYAML']
+        info = dict(card.dep_info)
+        
+        installed = DependencyCard(
+            {**info, 'status': 'installed', 'icon': "✅"}, card.dep, dialog.checker
+        )
+        assert installed.instructions_text is None
+        
+        card.apply({**info, 'status': 'not_installed', 'icon': "❌"})
+        assert not card.install_row.isHidden()
+        assert not card.instructions_text.isHidden()
+        assert "pip install PyYAML" in card.instructions_text.text()
+        
+        card.apply({**info, 'status': 'installed', 'icon': "✅"})
+        assert card.install_row.isHidden()
+        assert card.instructions_text.isHidden()
+        assert card.status_label.pixmap().cacheKey() == _status_pixmap("✅").cacheKey()
+    
+    def test_status_pixmaps_shared(self, qapp):
+        """Test each status glyph is rendered once and reused."""
+        assert _status_pixmap("✅") is _status_pixmap("✅")
+        assert not _status_pixmap("❌").isNull()
+    
+    def test_status_summary_state(self, qapp, qtbot):
+        """Test the summary's style state follows the check results."""
+        with patch('src.ui.dependency_dialog.DependencyChecker.check_all',
+                   autospec=True) as mock_check_all:
+            mock_check_all.side_effect = lambda checker: {
+                'all_installed': False,
+                'required_installed': False,
+                'missing_required': [checker.dependencies[0]],
+                'missing_optional': [],
+                'details': [],
+            }
+            dialog = DependencyDialog()
+            _wait_for_check(qtbot, dialog)
+        
+        assert dialog.status_label.property("state") == "error"
+        assert dialog.styleSheet()
+    
+    def test_install_all_missing_runs_one_install(self, qapp, qtbot):
+        """Test 'Install all missing' installs every pip dependency at once."""
+        dialog = DependencyDialog()
+        _wait_for_check(qtbot, dialog)
+        deps = [dep for dep in dialog.checker.dependencies
+                if dep.name in ("PyYAML", "py3nvml")]
+        dialog._results = {
+            **dialog._results,
+            'missing_required': deps[:1],
+            'missing_optional': deps[1:],
+        }
+        
+        with patch('src.ui.dependency_dialog.DependencyChecker.install_many_via_pip',
+                   return_value=(True, "Successfully installed")) as mock_install, \
+             patch('src.ui.dependency_dialog.QMessageBox.information'):
+            dialog._install_all_missing()
+            qtbot.waitUntil(lambda: dialog._install_all_thread is None, timeout=10000)
+            _wait_for_check(qtbot, dialog)
+        
+        mock_install.assert_called_once()
+        assert [dep.name for dep in mock_install.call_args[0][0]] == \
+            [dep.name for dep in deps]
+    
+    def test_card_install_thread_joined(self, qapp, qtbot):
+        """Test a card's install thread has exited before it is released."""
+        dialog = DependencyDialog()
+        _wait_for_check(qtbot, dialog)
+        card = dialog._cards['PyYAML']
+        
+        with patch('src.ui.dependency_dialog.DependencyChecker.install_via_pip',
+                   return_value=(False, "offline")), \
+             patch('src.ui.dependency_dialog.QMessageBox.warning'):
+            card._install_dependency()
+            thread = card.install_thread
+            qtbot.waitUntil(lambda: card.install_thread is None, timeout=10000)
+        
+        assert thread.isFinished()
+        dialog.done(0)
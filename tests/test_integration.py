@@ -126,40 +126,31 @@ class TestFanCurveWorkflow:
 class TestLogMonitoringIntegration:
     """Integration tests for log monitoring."""
     
-    @patch('subprocess.run')
-    def test_log_monitor_full_workflow(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_log_monitor_full_workflow(self, mock_popen):
         """Test complete log monitoring workflow."""
         import json
         
-        # Mock journalctl responses
-        def mock_journalctl(*args, **kwargs):
-            result = Mock()
-            result.returncode = 0
-            if '--since' in args[0]:
-                # For fetching new logs
-                result.stdout = ""
-            else:
-                # For initial load
-                entries = [
-                    {
-                        '__REALTIME_TIMESTAMP': '1703520000000000',
-                        'PRIORITY': '3',
-                        'MESSAGE': 'Error message',
-                        '_SYSTEMD_UNIT': 'test.service'
-                    },
-                    {
-                        '__REALTIME_TIMESTAMP': '1703520001000000',
-                        'PRIORITY': '6',
-                        'MESSAGE': 'Info message',
-                        '_SYSTEMD_UNIT': 'test.service'
-                    }
-                ]
-                result.stdout = '\n'.join(json.dumps(e) for e in entries) + '\n'
-            return result
-        
-        mock_run.side_effect = mock_journalctl
-        
-        monitor = LogMonitor(update_interval=0.1, max_entries=100)
+        # Mock journalctl output for the initial load
+        entries = [
+            {
+                '__REALTIME_TIMESTAMP': '1703520000000000',
+                'PRIORITY': '3',
+                'MESSAGE': 'Error message',
+                '_SYSTEMD_UNIT': 'test.service'
+            },
+            {
+                '__REALTIME_TIMESTAMP': '1703520001000000',
+                'PRIORITY': '6',
+                'MESSAGE': 'Info message',
+                '_SYSTEMD_UNIT': 'test.service'
+            }
+        ]
+        mock_popen.return_value = Mock(
+            stdout=iter(json.dumps(e).encode() + b'\n' for e in entries)
+        )
+        
+        monitor = LogMonitor(max_entries=100)
         
         # Load initial logs
         monitor._load_initial_logs()
@@ -179,8 +170,8 @@ class TestLogMonitoringIntegration:
         assert 'total_errors' in summary
         assert summary['total_errors'] >= 0
     
-    @patch('subprocess.run')
-    def test_log_filtering_workflow(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_log_filtering_workflow(self, mock_popen):
         """Test complete log filtering workflow."""
         import json
         from datetime import datetime, timedelta
@@ -208,15 +199,11 @@ class TestLogMonitoringIntegration:
             }
         ]
         
-        def mock_journalctl(*args, **kwargs):
-            result = Mock()
-            result.returncode = 0
-            result.stdout = '\n'.join(json.dumps(e) for e in entries_data) + '\n'
-            return result
-        
-        mock_run.side_effect = mock_journalctl
+        mock_popen.return_value = Mock(
+            stdout=iter(json.dumps(e).encode() + b'\n' for e in entries_data)
+        )
         
-        monitor = LogMonitor(update_interval=0.1, max_entries=100)
+        monitor = LogMonitor(max_entries=100)
         monitor._load_initial_logs()
         
         assert len(monitor.entries) == 3
@@ -252,8 +239,8 @@ class TestLogMonitoringIntegration:
         filtered = monitor.get_filtered_entries()
         assert len(filtered) == 1  # Only the most recent entry
     
-    @patch('subprocess.run')
-    def test_log_error_tracking(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_log_error_tracking(self, mock_popen):
         """Test error tracking and statistics."""
         import json
         
@@ -284,15 +271,11 @@ class TestLogMonitoringIntegration:
             }
         ]
         
-        def mock_journalctl(*args, **kwargs):
-            result = Mock()
-            result.returncode = 0
-            result.stdout = '\n'.join(json.dumps(e) for e in entries_data) + '\n'
-            return result
-        
-        mock_run.side_effect = mock_journalctl
+        mock_popen.return_value = Mock(
+            stdout=iter(json.dumps(e).encode() + b'\n' for e in entries_data)
+        )
         
-        monitor = LogMonitor(update_interval=0.1, max_entries=100)
+        monitor = LogMonitor(max_entries=100)
         monitor._load_initial_logs()
         
         # Check error counts
@@ -6,7 +6,9 @@ Tests for log monitoring module.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
+import gc
 import json
+import os
 import subprocess
 
 from src.monitoring.log_monitor import (
@@ -68,6 +70,13 @@ class TestLogEntry:
         assert entry.pid == '1234'
         assert entry.hostname == 'test-host'
     
+    def test_timestamp_parsing(self):
+        """Test journal timestamps are kept as integer microseconds."""
+        entry = LogEntry({'__REALTIME_TIMESTAMP': '1703520000123456'})
+        
+        assert entry.timestamp_us == 1703520000123456
+        assert entry.timestamp == datetime.fromtimestamp(1703520000.123456)
+    
     def test_source_without_service_suffix(self):
         """Test source name handling when no .service suffix."""
         json_data = {
@@ -80,6 +89,52 @@ class TestLogEntry:
         entry = LogEntry(json_data)
         assert entry.source == 'kernel'
     
+    def test_source_cleanup_is_shared(self):
+        """Test the cleaned source is computed once per raw unit name."""
+        first = LogEntry({'_SYSTEMD_UNIT': ''.join(['cache', '.service'])})
+        second = LogEntry({'_SYSTEMD_UNIT': ''.join(['cache', '.service'])})
+        
+        assert first.source == 'cache'
+        assert first.source is second.source
+        assert first._src_lc is second._src_lc
+    
+    def test_raw_record_not_retained(self):
+        """Test the decoded journal record is not kept on the entry."""
+        record = {'MESSAGE': 'Test', '_SYSTEMD_UNIT': 'test.service'}
+        entry = LogEntry(record)
+        
+        assert not hasattr(entry, 'raw_data')
+        assert not hasattr(entry, '__dict__')
+        assert not any(value is record for value in gc.get_referents(entry))
+    
+    def test_non_string_fields(self):
+        """Test null and byte-array journal fields are read as text."""
+        entry = LogEntry({
+            'MESSAGE': None,
+            '_SYSTEMD_UNIT': [116, 101, 115, 116],
+            'PRIORITY': None
+        })
+        
+        assert entry.message == ''
+        assert entry.source == 'test'
+        assert entry.priority == LogPriority.INFO
+    
+    def test_shared_strings_are_interned(self):
+        """Test entries built with a shared table reuse metadata strings."""
+        strings = {}
+        entries = [
+            LogEntry({
+                'MESSAGE': 'Message',
+                '_SYSTEMD_UNIT': ''.join(['test', '.service']),
+                '_HOSTNAME': ''.join(['test', '-host'])
+            }, strings)
+            for _ in range(2)
+        ]
+        
+        assert entries[0].source is entries[1].source
+        assert entries[0].hostname is entries[1].hostname
+        assert entries[0].source == 'test'
+    
     def test_to_dict(self):
         """Test conversion to dictionary."""
         json_data = {
@@ -120,18 +175,17 @@ class TestLogMonitor:
     @pytest.fixture
     def monitor(self):
         """Create a LogMonitor instance for testing."""
-        return LogMonitor(update_interval=0.1, max_entries=100)
+        return LogMonitor(max_entries=100)
     
     def test_initialization(self, monitor):
         """Test monitor initialization."""
-        assert monitor.update_interval == 0.1
         assert monitor.max_entries == 100
         assert len(monitor.entries) == 0
         assert monitor.is_running == False
         assert monitor.is_paused == False
     
-    @patch('subprocess.run')
-    def test_load_initial_logs(self, mock_run, monitor):
+    @patch('subprocess.Popen')
+    def test_load_initial_logs(self, mock_popen, monitor):
         """Test loading initial logs."""
         # Mock journalctl output
         log_json_1 = json.dumps({
@@ -148,10 +202,11 @@ class TestLogMonitor:
             '_SYSTEMD_UNIT': 'test.service'
         })
         
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = log_json_1 + '\n' + log_json_2 + '\n'
-        mock_run.return_value = mock_result
+        mock_popen.return_value = Mock(stdout=iter([
+            log_json_1.encode() + b'\n',
+            b'\n',
+            log_json_2.encode() + b'\n'
+        ]))
         
         monitor._load_initial_logs()
         
@@ -159,10 +214,13 @@ class TestLogMonitor:
         assert monitor.entries[0].message == 'Error 1'
         assert monitor.entries[1].message == 'Info message'
     
-    @patch('subprocess.run')
-    def test_load_initial_logs_timeout(self, mock_run, monitor):
+    @patch('subprocess.Popen')
+    def test_load_initial_logs_timeout(self, mock_popen, monitor):
         """Test handling timeout when loading logs."""
-        mock_run.side_effect = subprocess.TimeoutExpired('journalctl', 10)
+        mock_proc = Mock(stdout=iter([]))
+        mock_proc.wait.side_effect = subprocess.TimeoutExpired('journalctl', 10)
+        mock_proc.poll.return_value = None
+        mock_popen.return_value = mock_proc
         
         error_called = []
         def on_error(msg):
@@ -173,11 +231,30 @@ class TestLogMonitor:
         
         assert len(error_called) > 0
         assert 'Timeout' in error_called[0]
+        mock_proc.kill.assert_called_once()
+    
+    @patch('subprocess.Popen')
+    def test_load_initial_logs_stalled_read(self, mock_popen, monitor):
+        """Test a journalctl that stops writing is killed at the deadline."""
+        read_fd, write_fd = os.pipe()
+        mock_proc = Mock(stdout=os.fdopen(read_fd, 'rb'))
+        mock_proc.kill.side_effect = lambda: os.close(write_fd)
+        mock_proc.poll.return_value = 0
+        mock_popen.return_value = mock_proc
+        
+        error_called = []
+        monitor.on_error = error_called.append
+        monitor.INITIAL_LOAD_TIMEOUT = 0.1
+        monitor._load_initial_logs()
+        mock_proc.stdout.close()
+        
+        mock_proc.kill.assert_called_once()
+        assert 'Timeout' in error_called[0]
     
-    @patch('subprocess.run')
-    def test_load_initial_logs_not_found(self, mock_run, monitor):
+    @patch('subprocess.Popen')
+    def test_load_initial_logs_not_found(self, mock_popen, monitor):
         """Test handling when journalctl is not found."""
-        mock_run.side_effect = FileNotFoundError()
+        mock_popen.side_effect = FileNotFoundError()
         
         error_called = []
         def on_error(msg):
@@ -278,6 +355,68 @@ class TestLogMonitor:
         assert len(filtered) == 1
         assert 'database' in filtered[0].message.lower()
     
+    def test_text_filter_refinement(self, monitor, sample_log_entries):
+        """Test extending the search narrows results and shortening widens them."""
+        for entry in sample_log_entries:
+            monitor.entries.append(entry)
+        monitor._apply_filters()
+        
+        monitor.set_text_filter('err')
+        wide = monitor.get_filtered_entries()
+        
+        monitor.set_text_filter('Error')
+        assert monitor.get_filtered_entries() == [
+            e for e in wide if monitor._matches_filters(e)
+        ]
+        
+        monitor.set_text_filter('e')
+        assert monitor.get_filtered_entries() == [
+            e for e in monitor.entries if monitor._matches_filters(e)
+        ]
+    
+    def test_filtered_entries_follow_eviction(self):
+        """Test the filtered view drops entries evicted from entries."""
+        monitor = LogMonitor(max_entries=3)
+        monitor.set_priority_filter([LogPriority.ERR])
+        
+        def feed(priority, message):
+            monitor._process_line(json.dumps({
+                'PRIORITY': priority,
+                'MESSAGE': message
+            }).encode())
+        
+        feed('3', 'err1')
+        feed('3', 'err2')
+        feed('6', 'info1')
+        assert [e.message for e in monitor.get_filtered_entries()] == ['err1', 'err2']
+        
+        for i in range(2, 6):
+            feed('6', f'info{i}')
+            filtered = monitor.get_filtered_entries()
+            assert all(any(e is f for e in monitor.entries) for f in filtered)
+        
+        assert monitor.get_filtered_entries() == []
+    
+    def test_add_entry_waits_for_filter_rebuild(self):
+        """Test an entry arriving during a filter rebuild is not lost."""
+        from threading import Thread
+        monitor = LogMonitor(max_entries=10)
+        
+        with monitor._entries_lock:
+            thread = Thread(target=monitor._process_line, args=(json.dumps({
+                'PRIORITY': '3',
+                'MESSAGE': 'late'
+            }).encode(),))
+            thread.start()
+            thread.join(timeout=0.2)
+            assert thread.is_alive()
+            
+            # Stand-in for a rebuild swapping in a new view
+            monitor.filtered_entries = monitor.filtered_entries.copy()
+        
+        thread.join(timeout=5)
+        assert [e.message for e in monitor.get_filtered_entries()] == ['late']
+    
     def test_time_range_filter(self, monitor):
         """Test time range filtering."""
         now = datetime.now()
@@ -309,6 +448,29 @@ class TestLogMonitor:
         assert len(filtered) == 1
         assert filtered[0].message == 'Recent error'
     
+    def test_combined_filters_match_predicate(self, monitor):
+        """Test _apply_filters agrees with _matches_filters when filters combine."""
+        for i, (prio, unit, msg) in enumerate([
+            ('3', 'a.service', 'disk error'),
+            ('3', 'b.service', 'disk error'),
+            ('4', 'a.service', 'disk warning'),
+            ('3', 'a.service', 'network down'),
+            ('6', 'disk.service', 'started'),
+        ]):
+            monitor.entries.append(LogEntry({
+                '__REALTIME_TIMESTAMP': str(1703520000000000 + i * 1000000),
+                'PRIORITY': prio,
+                'MESSAGE': msg,
+                '_SYSTEMD_UNIT': unit
+            }))
+        
+        monitor.set_priority_filter([LogPriority.ERR, LogPriority.INFO])
+        monitor.set_text_filter('DISK')
+        
+        expected = [e for e in monitor.entries if monitor._matches_filters(e)]
+        assert monitor.get_filtered_entries() == expected
+        assert [e.message for e in expected] == ['disk error', 'disk error', 'started']
+    
     def test_clear_filters(self, monitor):
         """Test clearing all filters."""
         monitor.set_priority_filter([LogPriority.ERR])
@@ -372,8 +534,9 @@ class TestLogMonitor:
             '_SYSTEMD_UNIT': 'test.service'
         })
         
-        monitor.entries.append(recent_entry)
-        monitor.entries.append(old_entry)
+        for entry in (recent_entry, old_entry):
+            monitor.entries.append(entry)
+            monitor._update_error_counts(entry)
         
         summary = monitor.get_error_summary()
         
@@ -382,6 +545,27 @@ class TestLogMonitor:
         assert summary['recent_errors_1h'] == 1
         assert summary['recent_critical_1h'] == 0  # Old critical not in last hour
     
+    def test_error_summary_buckets_expire(self, monitor):
+        """Test recent counts drop entries older than an hour sharing a bucket."""
+        now = datetime.now()
+        
+        def error_at(ts):
+            return LogEntry({
+                '__REALTIME_TIMESTAMP': str(int(ts.timestamp() * 1000000)),
+                'PRIORITY': '3',
+                'MESSAGE': 'Error',
+                '_SYSTEMD_UNIT': 'test.service'
+            })
+        
+        # Same minute-of-hour slot, one hour apart, fed newest first
+        monitor._update_error_counts(error_at(now))
+        monitor._update_error_counts(error_at(now - timedelta(hours=1)))
+        monitor._update_error_counts(error_at(now))
+        
+        summary = monitor.get_error_summary()
+        assert summary['recent_errors_1h'] == 2
+        assert summary['errors'] == 3
+    
     def test_get_available_sources(self, monitor):
         """Test getting available log sources."""
         entries = [
@@ -406,7 +590,7 @@ class TestLogMonitor:
         ]
         
         for entry in entries:
-            monitor.entries.append(entry)
+            monitor._add_entry(entry)
         
         sources = monitor.get_available_sources()
         
@@ -414,6 +598,15 @@ class TestLogMonitor:
         assert 'service2' in sources
         assert len(sources) == 2
     
+    def test_available_sources_follow_eviction(self):
+        """Test sources disappear once their last entry is evicted."""
+        monitor = LogMonitor(max_entries=2)
+        for source in ('b', 'a', 'a', 'c'):
+            monitor._add_entry(LogEntry({'_SYSTEMD_UNIT': source}))
+            assert monitor.get_available_sources() == sorted(
+                {e.source for e in monitor.entries}
+            )
+    
     def test_pause_resume(self, monitor):
         """Test pause and resume functionality."""
         assert monitor.is_paused == False
@@ -424,22 +617,100 @@ class TestLogMonitor:
         monitor.resume()
         assert monitor.is_paused == False
     
-    @patch('subprocess.run')
-    def test_start_stop(self, mock_run, monitor):
+    @patch('subprocess.Popen')
+    def test_start_stop(self, mock_popen, monitor):
         """Test starting and stopping monitor."""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_run.return_value = mock_result
+        read_fd, write_fd = os.pipe()
+        mock_proc = Mock()
+        mock_proc.stdout = os.fdopen(read_fd, 'rb', buffering=0)
+        # The initial load finishes straight away; the follow stream stays open
+        mock_popen.side_effect = [Mock(stdout=iter([])), mock_proc]
         
         monitor.start()
+        assert monitor.thread.is_alive()
         assert monitor.is_running == True
+        assert '--follow' in mock_popen.call_args[0][0]
         
         monitor.stop()
-        # Wait a bit for thread to stop
-        import time
-        time.sleep(0.2)
-        # Thread should have stopped or be stopping
+        assert monitor.is_running == False
+        assert not monitor.thread.is_alive()
+        mock_proc.terminate.assert_called_once()
+        assert monitor.proc is None
+        
+        mock_proc.stdout.close()
+        os.close(write_fd)
+    
+    def test_monitor_loop_streams_entries(self, monitor):
+        """Test entries read from the follow stream are recorded and reported."""
+        entry = json.dumps({
+            '__REALTIME_TIMESTAMP': '1703520005000000',
+            'PRIORITY': '3',
+            'MESSAGE': 'New error',
+            '_SYSTEMD_UNIT': 'test.service',
+            '__CURSOR': 's=abc;i=2'
+        }).encode()
+        read_fd, write_fd = os.pipe()
+        # A line split across reads is reassembled before parsing
+        os.write(write_fd, b'not json\n' + entry[:20])
+        os.write(write_fd, entry[20:] + b'\n')
+        os.close(write_fd)
+        
+        with os.fdopen(read_fd, 'rb', buffering=0) as stdout:
+            monitor.proc = Mock(stdout=stdout)
+            monitor._monitor_loop()
+        
+        assert [e.message for e in monitor.entries] == ['New error']
+        assert monitor.entry_queue.get_nowait().message == 'New error'
+        assert monitor.error_counts['errors'] == 1
+        assert monitor.last_cursor == 's=abc;i=2'
+    
+    def test_dispatch_batches_entries(self, monitor):
+        """Test queued entries are delivered together in one callback."""
+        for i in range(3):
+            monitor.entry_queue.put(LogEntry({'MESSAGE': f'msg {i}'}))
+        
+        monitor.entry_queue.put(None)
+        
+        batches = []
+        monitor.on_new_entries = batches.append
+        monitor._dispatch_loop()
+        
+        assert len(batches) == 1
+        assert [e.message for e in batches[0]] == ['msg 0', 'msg 1', 'msg 2']
+    
+    def test_drain_batch_respects_batch_size(self, monitor):
+        """Test a batch never exceeds BATCH_SIZE entries."""
+        for i in range(monitor.BATCH_SIZE + 5):
+            monitor.entry_queue.put(LogEntry({'MESSAGE': f'msg {i}'}))
+        
+        assert len(monitor._drain_batch(0.1)) == monitor.BATCH_SIZE
+        assert len(monitor._drain_batch(0.1)) == 5
+        assert monitor._drain_batch(0.01) == []
+    
+    @patch('subprocess.Popen')
+    def test_follow_resumes_after_cursor(self, mock_popen, monitor):
+        """Test the follow stream starts after the last loaded entry's cursor."""
+        monitor._start_follow()
+        assert '--since' in mock_popen.call_args[0][0]
+        
+        monitor.last_cursor = 's=abc;i=1'
+        monitor._start_follow()
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[cmd.index('--after-cursor') + 1] == 's=abc;i=1'
+        assert '--since' not in cmd
+    
+    @patch('subprocess.Popen')
+    def test_journalctl_limits_output_fields(self, mock_popen, monitor):
+        """Test both journalctl commands request only the fields LogEntry reads."""
+        mock_popen.return_value = Mock(stdout=iter([]))
+        monitor._load_initial_logs()
+        monitor._start_follow()
+        
+        for call in mock_popen.call_args_list:
+            fields = [a for a in call[0][0] if a.startswith('--output-fields=')]
+            assert len(fields) == 1
+            requested = fields[0].split('=', 1)[1].split(',')
+            assert {'MESSAGE', 'PRIORITY', '__CURSOR'} <= set(requested)
 
 
 @pytest.mark.integration
@@ -458,7 +729,7 @@ class TestLogMonitorIntegration:
             
             if result.returncode == 0:
                 # journalctl is available, test basic functionality
-                monitor = LogMonitor(update_interval=1.0, max_entries=10)
+                monitor = LogMonitor(max_entries=10)
                 monitor.start()
                 
                 # Wait briefly
@@ -3,6 +3,7 @@
 Tests for log viewer tab UI component.
 """
 
+import os
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from PyQt6.QtWidgets import QApplication
@@ -26,7 +27,7 @@ class TestLogViewerTab:
         viewer = LogViewerTab()
         
         assert viewer.log_monitor == mock_monitor
-        assert mock_monitor.on_new_entry is not None
+        assert mock_monitor.on_new_entries is not None
         assert mock_monitor.on_error is not None
         mock_monitor.start.assert_called_once()
     
@@ -69,8 +70,8 @@ class TestLogViewerTab:
         assert hasattr(viewer, 'clear_logs_btn')
     
     @patch('src.ui.log_viewer_tab.LogMonitor')
-    def test_on_new_entry(self, mock_monitor_class, qapp, qtbot):
-        """Test handling new log entry."""
+    def test_on_new_entries(self, mock_monitor_class, qapp, qtbot):
+        """Test handling a batch of new log entries."""
         mock_monitor = Mock()
         mock_monitor_class.return_value = mock_monitor
         
@@ -85,7 +86,7 @@ class TestLogViewerTab:
         })
         
         # Call handler
-        viewer._on_new_entry(entry)
+        viewer._on_new_entries([entry])
         
         # Check that entry was added to display
         assert viewer.log_display.toPlainText() != ""
@@ -130,6 +131,7 @@ class TestLogViewerTab:
         
         assert viewer.pause_btn.text() == "⏸ Pause"
         mock_monitor.resume.assert_called_once()
+        mock_monitor.get_filtered_entries.assert_called()
     
     @patch('src.ui.log_viewer_tab.LogMonitor')
     def test_clear_logs(self, mock_monitor_class, qapp):
@@ -295,29 +297,24 @@ class TestLogViewerTab:
 class TestLogViewerIntegration:
     """Integration tests for log viewer."""
     
-    @patch('subprocess.run')
-    def test_full_log_viewer_workflow(self, mock_run, qapp, qtbot):
+    @patch('subprocess.Popen')
+    def test_full_log_viewer_workflow(self, mock_popen, qapp, qtbot):
         """Test full workflow of log viewer."""
-        # Mock journalctl responses
-        def mock_journalctl(*args, **kwargs):
-            result = Mock()
-            result.returncode = 0
-            if '--since' in args[0]:
-                # For fetching new logs
-                result.stdout = ""
-            else:
-                # For initial load
-                import json
-                entry = json.dumps({
-                    '__REALTIME_TIMESTAMP': '1703520000000000',
-                    'PRIORITY': '3',
-                    'MESSAGE': 'Test error',
-                    '_SYSTEMD_UNIT': 'test.service'
-                })
-                result.stdout = entry + '\n'
-            return result
-        
-        mock_run.side_effect = mock_journalctl
+        import json
+        
+        # Initial load yields one entry; the follow stream stays empty
+        entry = json.dumps({
+            '__REALTIME_TIMESTAMP': '1703520000000000',
+            'PRIORITY': '3',
+            'MESSAGE': 'Test error',
+            '_SYSTEMD_UNIT': 'test.service'
+        })
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        mock_popen.side_effect = [
+            Mock(stdout=iter([entry.encode() + b'\n'])),
+            Mock(stdout=os.fdopen(read_fd, 'rb', buffering=0))
+        ]
         
         from src.ui.log_viewer_tab import LogViewerTab
         
@@ -329,4 +326,6 @@ class TestLogViewerIntegration:
         # Verify viewer was created
         assert viewer is not None
         assert viewer.log_monitor is not None
+        
+        viewer.log_monitor.stop()
 
@@ -0,0 +1,38 @@
+"""
+Tests for subprocess helpers.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from src.utils.process import run_streaming
+
+
+class TestRunStreaming:
+    """Test run_streaming."""
+    
+    def test_lines_passed_as_read(self):
+        """Test each output line reaches the callback and the exit code is returned."""
+        lines = []
+        
+        returncode = run_streaming(
+            [sys.executable, '-c', 'print("one"); print("two"); raise SystemExit(3)'],
+            10, lines.append, text=True
+        )
+        
+        assert lines == ["one\n", "two\n"]
+        assert returncode == 3
+    
+    def test_stalled_process_killed_at_deadline(self):
+        """Test a process that stops writing is killed once the deadline passes."""
+        lines = []
+        
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_streaming(
+                [sys.executable, '-c', 'import time; print("start", flush=True); time.sleep(30)'],
+                0.5, lines.append, text=True
+            )
+        
+        assert lines == ["start\n"]
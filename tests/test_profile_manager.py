@@ -90,6 +90,25 @@ class TestProfileManager:
         assert manager.profiles_dir == tmp_path
         assert tmp_path.exists()
     
+    def test_manager_creates_directory_once(self, tmp_path):
+        """Test repeated construction does not re-create the profiles directory."""
+        profiles_dir = tmp_path / "a" / "b"
+        ProfileManager(profiles_dir=profiles_dir)
+        assert profiles_dir.is_dir()
+        
+        with patch.object(Path, 'mkdir') as mock_mkdir:
+            ProfileManager(profiles_dir=profiles_dir)
+            mock_mkdir.assert_not_called()
+    
+    def test_manager_recreates_removed_directory(self, tmp_path):
+        """Test a profiles directory removed after first use is created again."""
+        profiles_dir = tmp_path / "profiles"
+        ProfileManager(profiles_dir=profiles_dir)
+        profiles_dir.rmdir()
+        
+        manager = ProfileManager(profiles_dir=profiles_dir)
+        assert manager.save_profile(SavedProfile(name="Test"))
+    
     def test_get_profile_path(self, tmp_path):
         """Test getting profile file path."""
         manager = ProfileManager(profiles_dir=tmp_path)
@@ -165,6 +184,42 @@ class TestProfileManager:
         profiles = manager.list_profiles()
         assert len(profiles) == 3
     
+    def test_load_all_profiles_skips_non_profiles(self, tmp_path):
+        """Test loading ignores directories and non-JSON files."""
+        (tmp_path / "notes.txt").write_text("not a profile")
+        (tmp_path / "backup.json").mkdir()
+        with open(tmp_path / "Real.json", 'w') as f:
+            json.dump({'name': 'Real'}, f)
+        
+        manager = ProfileManager(profiles_dir=tmp_path)
+        
+        assert manager.list_profiles() == ["Real"]
+    
+    def test_load_all_profiles_preserves_curves(self, tmp_path):
+        """Test saved fan curves round-trip through the fast load path."""
+        manager = ProfileManager(profiles_dir=tmp_path)
+        curve = FanCurve([FanCurvePoint(30, 20), FanCurvePoint(70, 80)])
+        manager.save_profile(SavedProfile(name="Curves", cpu_fan_curve=curve))
+        
+        manager.load_all_profiles()
+        loaded = manager.get_profile("Curves").cpu_fan_curve
+        
+        assert loaded.to_dict() == curve.to_dict()
+        assert loaded.get_fan_speed_at_temp(50) == 50
+    
+    def test_reload_if_changed(self, tmp_path):
+        """Test profiles are re-read only when the profile files change."""
+        manager = ProfileManager(profiles_dir=tmp_path)
+        
+        assert manager.reload_if_changed() is False
+        
+        # Saved by another manager instance
+        ProfileManager(profiles_dir=tmp_path).save_profile(SavedProfile(name="Other"))
+        
+        assert manager.reload_if_changed() is True
+        assert manager.list_profiles() == ["Other"]
+        assert manager.reload_if_changed() is False
+    
     def test_delete_profile(self, tmp_path):
         """Test deleting a profile."""
         manager = ProfileManager(profiles_dir=tmp_path)
@@ -195,6 +250,18 @@ class TestProfileManager:
         assert "Profile A" in profiles
         assert "Profile B" in profiles
     
+    def test_list_profiles_invalidated_on_change(self, tmp_path):
+        """Test cached profile list is refreshed after save and delete."""
+        manager = ProfileManager(profiles_dir=tmp_path)
+        manager.save_profile(SavedProfile(name="B"))
+        assert manager.list_profiles() == ["B"]
+        
+        manager.save_profile(SavedProfile(name="A"))
+        assert manager.list_profiles() == ["A", "B"]
+        
+        manager.delete_profile("B")
+        assert manager.list_profiles() == ["A"]
+    
     def test_get_profile(self, tmp_path):
         """Test getting profile by name."""
         manager = ProfileManager(profiles_dir=tmp_path)
@@ -246,3 +313,19 @@ class TestProfileManager:
         assert "Imported Profile" in manager.list_profiles()
 
 
+    
+    def test_export_import_yaml(self, tmp_path):
+        """Test YAML export/import round trip."""
+        pytest.importorskip("yaml")
+        manager = ProfileManager(profiles_dir=tmp_path / "profiles")
+        
+        manager.save_profile(SavedProfile(name="Yaml Profile", description="YAML"))
+        
+        export_path = tmp_path / "export.yaml"
+        assert manager.export_profile("Yaml Profile", export_path, 'yaml') == True
+        
+        manager.delete_profile("Yaml Profile")
+        profile = manager.import_profile(export_path)
+        
+        assert profile is not None
+        assert profile.description == "YAML"
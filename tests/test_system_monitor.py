@@ -2,12 +2,16 @@
 Tests for system monitoring module.
 """
 
+import os
 import pytest
 import time
 from unittest.mock import Mock, patch, MagicMock, mock_open
 from collections import deque
+from threading import Event
 
-from src.monitoring.system_monitor import SystemMonitor
+import numpy as np
+
+from src.monitoring.system_monitor import FanSpeed, SystemMonitor
 
 
 class TestSystemMonitor:
@@ -20,7 +24,7 @@ class TestSystemMonitor:
         assert monitor.update_interval == 1.0
         assert monitor.history_size == 100
         assert isinstance(monitor.metrics, dict)
-        assert isinstance(monitor.history, dict)
+        assert len(monitor.history) == 0
         assert monitor._stop_event.is_set() == False
     
     @patch('src.monitoring.system_monitor.psutil')
@@ -40,6 +44,20 @@ class TestSystemMonitor:
         assert monitor.metrics['cpu_percent'] == 45.5
         assert monitor.metrics['cpu_freq'] == 2400.0
     
+    @patch('src.monitoring.system_monitor.psutil')
+    def test_cpu_sampling_does_not_block(self, mock_psutil):
+        """Test CPU usage is sampled without a blocking interval."""
+        mock_psutil.cpu_percent.return_value = 30.0
+        mock_psutil.virtual_memory.return_value = Mock(percent=40.0, used=0, total=1)
+        
+        monitor = SystemMonitor()
+        monitor.update_metrics()
+        
+        for call in mock_psutil.cpu_percent.call_args_list:
+            assert call.kwargs.get('interval') is None
+        # Two priming calls in __init__, two samples per update
+        assert mock_psutil.cpu_percent.call_count == 4
+    
     @patch('src.monitoring.system_monitor.psutil')
     def test_update_memory_metrics(self, mock_psutil):
         """Test memory metrics update."""
@@ -52,6 +70,7 @@ class TestSystemMonitor:
         mock_swap = Mock()
         mock_swap.percent = 10.0
         mock_psutil.swap_memory.return_value = mock_swap
+        mock_psutil.cpu_percent.return_value = 25.0
         
         monitor = SystemMonitor()
         monitor.update_metrics()
@@ -94,6 +113,31 @@ class TestSystemMonitor:
                 temp = monitor._get_cpu_temperature()
                 assert temp is None
     
+    def test_get_cpu_temperature_from_psutil(self):
+        """Test CPU temperature falls back to psutil's sensor readings."""
+        monitor = SystemMonitor()
+        monitor._cpu_temp_paths = []
+        
+        reading = Mock(current=48.0)
+        with patch('psutil.sensors_temperatures',
+                   return_value={'coretemp': [reading, Mock(current=52.0)]}), \
+             patch('subprocess.run') as mock_run:
+            assert monitor._get_cpu_temperature() == 50.0
+            mock_run.assert_not_called()
+    
+    def test_cpu_temperature_source_chosen_once(self):
+        """Test sysfs is used without touching psutil once it has worked."""
+        monitor = SystemMonitor()
+        monitor._cpu_temp_paths = ['/sys/fake/temp1_input']
+        monitor._read_sysfs_temperature = Mock(return_value=47.0)
+        
+        with patch('psutil.sensors_temperatures') as mock_sensors:
+            for _ in range(3):
+                assert monitor._get_cpu_temperature() == 47.0
+            mock_sensors.assert_not_called()
+        
+        assert monitor._temp_source is monitor._read_sysfs_temperature
+    
     @patch('subprocess.run')
     def test_get_gpu_metrics_with_nvidia_smi(self, mock_run):
         """Test GPU metrics via nvidia-smi fallback."""
@@ -119,6 +163,105 @@ class TestSystemMonitor:
         assert metrics['memory_percent'] == 50.0  # 4.0 / 8.0 * 100
         assert metrics['power'] == 120.5
     
+    @patch('subprocess.run')
+    def test_get_gpu_metrics_from_nvidia_smi_stream(self, mock_run):
+        """Test the latest streamed nvidia-smi sample is used without a new process."""
+        monitor = SystemMonitor()
+        monitor._nvidia_available = True
+        monitor._use_nvml = False
+        monitor._smi_proc = Mock(poll=Mock(return_value=None))
+        monitor._latest_gpu_csv = "70, 50, 2.0, 8.0, 90.0"
+        mock_run.reset_mock()
+        
+        metrics = monitor._get_gpu_metrics()
+        
+        mock_run.assert_not_called()
+        assert metrics['temperature'] == 70.0
+        assert metrics['memory_percent'] == 25.0
+        assert metrics['power'] == 90.0
+    
+    @patch('subprocess.Popen')
+    def test_nvidia_smi_stream_lifecycle(self, mock_popen):
+        """Test the stream is started once, read by a thread, and ended by stop()."""
+        proc = Mock(stdout=iter(["60, 10, 1.0, 4.0, 30.0\n"]))
+        proc.poll.return_value = None
+        mock_popen.return_value = proc
+        
+        monitor = SystemMonitor(gpu_poll_interval=0.5)
+        monitor._start_nvidia_smi_stream()
+        
+        cmd = mock_popen.call_args[0][0]
+        assert '--loop-ms=500' in cmd
+        for _ in range(100):
+            if monitor._latest_gpu_csv:
+                break
+            time.sleep(0.01)
+        assert monitor._latest_gpu_csv == "60, 10, 1.0, 4.0, 30.0"
+        
+        monitor.stop()
+        proc.terminate.assert_called_once()
+        assert monitor._smi_proc is None
+    
+    def test_nvml_handle_is_cached(self):
+        """Test the NVML device handle is looked up once per session."""
+        nvml = MagicMock()
+        nvml.nvmlDeviceGetUtilizationRates.return_value = Mock(gpu=40)
+        nvml.nvmlDeviceGetTemperature.return_value = 55
+        nvml.nvmlDeviceGetMemoryInfo.return_value = Mock(used=2, total=8)
+        nvml.nvmlDeviceGetPowerUsage.return_value = 30000
+        
+        monitor = SystemMonitor()
+        monitor._nvidia_available = True
+        monitor._use_nvml = True
+        monitor._nvml_module = nvml
+        
+        for _ in range(3):
+            metrics = monitor._get_gpu_metrics()
+        assert metrics['utilization'] == 40.0
+        assert nvml.nvmlDeviceGetHandleByIndex.call_count == 1
+        
+        monitor.stop()
+        nvml.nvmlShutdown.assert_called_once()
+        monitor.stop()
+        nvml.nvmlShutdown.assert_called_once()
+    
+    def test_nvml_power_and_utilization_rate_limited(self):
+        """Test NVML power/utilization are not polled faster than NVML updates."""
+        nvml = MagicMock()
+        nvml.nvmlDeviceGetUtilizationRates.return_value = Mock(gpu=40)
+        nvml.nvmlDeviceGetTemperature.return_value = 55
+        nvml.nvmlDeviceGetMemoryInfo.return_value = Mock(used=2, total=8)
+        nvml.nvmlDeviceGetPowerUsage.return_value = 30000
+        
+        monitor = SystemMonitor()
+        monitor._nvidia_available = True
+        monitor._use_nvml = True
+        monitor._nvml_module = nvml
+        
+        with patch('src.monitoring.system_monitor.time.monotonic') as mock_time:
+            for now in (10.0, 10.05, 10.12, 10.2):
+                mock_time.return_value = now
+                metrics = monitor._get_gpu_metrics()
+        
+        assert metrics['power'] == 30.0
+        assert metrics['utilization'] == 40.0
+        assert nvml.nvmlDeviceGetPowerUsage.call_count == 2  # 10.0, 10.12
+        assert nvml.nvmlDeviceGetUtilizationRates.call_count == 2  # 10.0, 10.2
+        assert nvml.nvmlDeviceGetTemperature.call_count == 4
+        monitor.stop()
+    
+    def test_nvidia_detected_from_driver_files(self):
+        """Test the nvidia-smi fallback is detected without spawning it."""
+        with patch.dict('sys.modules', {'py3nvml': None}), \
+             patch('src.monitoring.system_monitor.os.path.exists',
+                   side_effect=lambda path: path == '/dev/nvidia0'), \
+             patch('subprocess.run') as mock_run:
+            monitor = SystemMonitor()
+        
+        assert monitor._nvidia_available is True
+        assert monitor._use_nvml is False
+        mock_run.assert_not_called()
+    
     def test_get_gpu_metrics_not_available(self):
         """Test GPU metrics when GPU not available."""
         monitor = SystemMonitor()
@@ -132,6 +275,89 @@ class TestSystemMonitor:
         assert metrics['temperature'] is None
         assert metrics['memory_percent'] is None
     
+    def test_sensor_files_opened_once(self, tmp_path):
+        """Test sysfs sensor files are opened once and re-read in place."""
+        temp_path = tmp_path / "temp1_input"
+        fan_path = tmp_path / "fan1_input"
+        temp_path.write_text("45000\n")
+        fan_path.write_text("2100\n")
+        
+        def fake_glob(pattern):
+            return [str(temp_path)] if 'temp' in pattern else [str(fan_path)]
+        
+        monitor = SystemMonitor()
+        with patch('glob.glob', side_effect=fake_glob) as mock_glob:
+            assert monitor._get_cpu_temperature() == 45.0
+            assert monitor._get_fan_speeds() == [FanSpeed('fan1', 2100)]
+            
+            temp_path.write_text("55000\n")
+            assert monitor._get_cpu_temperature() == 55.0
+            assert mock_glob.call_count == 3  # thermal zones, hwmon temps, fans
+        
+        fds = [fd for _, fd in monitor._temp_files + monitor._fan_files]
+        with patch('os.close', wraps=os.close) as mock_close:
+            monitor.stop()
+        assert sorted(c.args[0] for c in mock_close.call_args_list) == sorted(fds)
+        assert monitor._temp_files is None
+    
+    def test_cpu_temp_probe_prefers_cpu_sensors(self, tmp_path):
+        """Test probing keeps plausible, CPU-labelled sensors only."""
+        def make_hwmon(name, label, millidegrees):
+            hwmon = tmp_path / name
+            hwmon.mkdir()
+            (hwmon / "name").write_text(label + "\n")
+            (hwmon / "temp1_input").write_text(f"{millidegrees}\n")
+            return str(hwmon / "temp1_input")
+        
+        cpu = make_hwmon("hwmon0", "coretemp", 50000)
+        nvme = make_hwmon("hwmon1", "nvme", 40000)
+        bogus = make_hwmon("hwmon2", "k10temp", 0)
+        
+        def fake_glob(pattern):
+            return [cpu, nvme, bogus] if 'hwmon' in pattern else []
+        
+        monitor = SystemMonitor()
+        with patch('glob.glob', side_effect=fake_glob):
+            assert monitor._probe_cpu_temp_sources() == [cpu]
+            assert monitor._get_cpu_temperature() == 50.0
+        monitor.stop()
+    
+    def test_slow_sources_polled_on_own_schedule(self):
+        """Test GPU and temperature reads run at their own, slower cadence."""
+        monitor = SystemMonitor(gpu_poll_interval=5.0, temp_poll_interval=2.0)
+        monitor._get_cpu_temperature = Mock(return_value=50.0)
+        monitor._get_gpu_metrics = Mock(return_value={'utilization': 20.0})
+        
+        with patch('src.monitoring.system_monitor.time.monotonic') as clock:
+            for now in (100.0, 101.0, 102.5, 104.0, 105.5):
+                clock.return_value = now
+                monitor.update_metrics()
+        
+        assert monitor._get_cpu_temperature.call_count == 3  # 100, 102.5, 105.5
+        assert monitor._get_gpu_metrics.call_count == 2      # 100, 105.5
+        assert monitor.metrics['cpu_temp'] == 50.0
+        assert monitor.metrics['gpu_utilization'] == 20.0
+    
+    def test_gpu_poll_backs_off_on_failure(self):
+        """Test a detected GPU that returns nothing is polled less and less often."""
+        monitor = SystemMonitor(gpu_poll_interval=5.0)
+        monitor._nvidia_available = True
+        monitor._get_gpu_metrics = Mock(return_value={'utilization': None})
+        
+        intervals = []
+        for _ in range(10):
+            monitor._next_gpu_poll = 0.0
+            monitor.update_metrics()
+            intervals.append(monitor._gpu_interval)
+        
+        assert intervals[:3] == [10.0, 20.0, 40.0]
+        assert intervals[-1] == monitor.GPU_MAX_POLL_INTERVAL
+        
+        monitor._get_gpu_metrics.return_value = {'utilization': 30.0}
+        monitor._next_gpu_poll = 0.0
+        monitor.update_metrics()
+        assert monitor._gpu_interval == 5.0
+    
     def test_get_fan_speeds(self):
         """Test fan speed detection."""
         monitor = SystemMonitor()
@@ -149,8 +375,9 @@ class TestSystemMonitor:
         
         monitor.update_metrics()
         
-        assert len(monitor.history['cpu_percent']) > 0
-        assert len(monitor.history['timestamp']) > 0
+        history = monitor.get_history()
+        assert len(monitor.history) > 0
+        assert len(history['cpu_percent']) == len(history['timestamp']) > 0
     
     def test_start_stop_monitoring(self):
         """Test monitoring thread start and stop."""
@@ -170,6 +397,27 @@ class TestSystemMonitor:
         monitor._monitoring_thread.join(timeout=1.0)
         assert not monitor._monitoring_thread.is_alive()
     
+    def test_on_update_receives_snapshots(self):
+        """Test the monitoring thread pushes a snapshot after each update."""
+        monitor = SystemMonitor(update_interval=0.05)
+        received = Event()
+        updates = []
+        
+        def on_update(metrics, history):
+            updates.append((metrics, history))
+            received.set()
+        
+        monitor.on_update = on_update
+        monitor.start()
+        try:
+            assert received.wait(timeout=5.0)
+        finally:
+            monitor.stop()
+        
+        metrics, history = updates[0]
+        assert metrics is not monitor.metrics
+        assert len(history['timestamp']) >= 1
+    
     def test_get_metrics(self):
         """Test getting metrics snapshot."""
         monitor = SystemMonitor()
@@ -189,5 +437,20 @@ class TestSystemMonitor:
         
         assert isinstance(history, dict)
         assert 'cpu_percent' in history
-        assert isinstance(history['cpu_percent'], list)
+        assert isinstance(history['cpu_percent'], np.ndarray)
+    
+    def test_history_wraps_oldest_first(self):
+        """Test history keeps the newest values in order once full."""
+        monitor = SystemMonitor(history_size=3)
+        
+        for value in [1.0, 2.0, 3.0, 4.0, 5.0]:
+            monitor.history.append(value * 10, (value, None, 20.0, None, None))
+        
+        history = monitor.get_history()
+        
+        assert len(monitor.history) == 3
+        assert history['timestamp'].tolist() == [30.0, 40.0, 50.0]
+        assert history['cpu_percent'].tolist() == [3.0, 4.0, 5.0]
+        assert np.isnan(history['gpu_temp']).all()
+        assert history['_rev'] == 5
 
@@ -7,6 +7,8 @@ from unittest.mock import Mock, patch
 from PyQt6.QtWidgets import QApplication
 
 from src.ui.dashboard_widgets import MetricCard, GraphWidget
+from src.ui.fan_curve_editor import FanCurveEditor
+from src.control.asusctl_interface import FanCurve, FanCurvePoint
 
 
 @pytest.mark.ui
@@ -57,6 +59,8 @@ class TestGraphWidget:
         
         assert widget is not None
         assert widget.graph is not None
+        assert widget.cpu_plot.opts['autoDownsample'] is True
+        assert widget.cpu_plot.opts['clipToView'] is True
     
     def test_graph_widget_update_data(self, qapp):
         """Test updating graph with data."""
@@ -74,3 +78,149 @@ class TestGraphWidget:
         assert True
 
 
+    
+    def test_graph_widget_skips_unchanged_history(self, qapp):
+        """Test that an unchanged history revision does not redraw."""
+        widget = GraphWidget()
+        
+        history = {
+            'timestamp': [1.0, 2.0, 3.0],
+            'cpu_percent': [50.0, 60.0, 55.0],
+            '_rev': 3
+        }
+        
+        with patch.object(widget.cpu_plot, 'setData') as mock_set_data, \
+             patch.object(widget.graph, 'setYRange') as mock_set_y_range:
+            widget.update_data(history)
+            widget.update_data(history)
+        
+        assert mock_set_data.call_count == 1
+        assert mock_set_y_range.call_count == 1
+
+
+def _wait_for_redraw(qtbot, editor):
+    """Wait until the editor's pending graph redraw has run."""
+    qtbot.waitUntil(lambda: not editor._redraw_timer.isActive(), timeout=1000)
+
+
+@pytest.mark.ui
+class TestFanCurveEditor:
+    """Test FanCurveEditor widget."""
+    
+    def test_curve_plot_interpolates_points(self, qapp, qtbot):
+        """Test the drawn curve passes through every control point."""
+        editor = FanCurveEditor()
+        curve = FanCurve([
+            FanCurvePoint(30, 10),
+            FanCurvePoint(60, 40),
+            FanCurvePoint(90, 100),
+        ])
+        
+        editor.load_curve(curve)
+        _wait_for_redraw(qtbot, editor)
+        xs, ys = editor.curve_plot.getData()
+        
+        assert xs[0] == 30 and xs[-1] == 90
+        assert ys[list(xs).index(60)] == 40
+        for x, y in zip(xs, ys):
+            assert abs(y - curve.get_fan_speed_at_temp(x)) <= 0.5
+    
+    def test_control_points_share_one_scatter(self, qapp, qtbot):
+        """Test redraws reuse one scatter item and clicks select by index."""
+        editor = FanCurveEditor()
+        editor.load_preset('balanced')
+        editor.load_preset('quiet')
+        _wait_for_redraw(qtbot, editor)
+        
+        scatters = [item for item in editor.plot_item.items
+                    if isinstance(item, type(editor.points_scatter))]
+        assert scatters == [editor.points_scatter]
+        
+        spots = editor.points_scatter.points()
+        editor._on_scatter_clicked(editor.points_scatter, spots[2:3])
+        
+        temps = editor.current_curve.temperatures
+        assert len(spots) == len(temps)
+        assert editor.selected_point_temp == temps[2]
+        assert editor.temp_input.value() == temps[2]
+        assert editor.speed_input.value() == editor.current_curve.speeds[2]
+    
+    def test_curve_items_cached(self, qapp):
+        """Test the curve and points are cached between data changes."""
+        from PyQt6.QtWidgets import QGraphicsItem
+        editor = FanCurveEditor()
+        
+        cache_mode = QGraphicsItem.CacheMode.DeviceCoordinateCache
+        assert editor.curve_plot.curve.cacheMode() == cache_mode
+        assert editor.points_scatter.cacheMode() == cache_mode
+    
+    def test_load_curve_copies_curve(self, qapp):
+        """Test edits in the editor don't change the loaded curve."""
+        editor = FanCurveEditor()
+        curve = FanCurve([FanCurvePoint(30, 20), FanCurvePoint(80, 90)])
+        
+        editor.load_curve(curve)
+        editor.current_curve.add_point(50, 40)
+        
+        assert curve.temperatures == (30, 80)
+        assert editor.current_curve.temperatures == (30, 50, 80)
+    
+    def test_redraws_coalesced(self, qapp, qtbot):
+        """Test a burst of edits redraws the graph once."""
+        editor = FanCurveEditor()
+        _wait_for_redraw(qtbot, editor)
+        
+        with patch.object(editor.curve_plot, 'setData') as mock_set_data:
+            for temp in (40, 45, 55):
+                curve = editor.current_curve
+                curve.add_point(temp, curve.get_fan_speed_at_temp(temp))
+                editor.update_display()
+            _wait_for_redraw(qtbot, editor)
+        
+        assert mock_set_data.call_count == 1
+    
+    def test_fan_test_countdown_restores_at_end(self, qapp):
+        """Test the countdown timer restores the curve once time is up."""
+        editor = FanCurveEditor()
+        editor.test_fan_name = "CPU"
+        editor._test_profile = "profile"
+        editor._test_start = 100.0
+        
+        with patch('src.ui.fan_curve_editor.time.monotonic', return_value=101.02), \
+             patch.object(editor, 'restore_after_test') as mock_restore:
+            editor.update_test_countdown()
+            assert editor.test_seconds_remaining == 4
+            assert "4s remaining" in editor.test_fan_btn.text()
+            mock_restore.assert_not_called()
+        
+        with patch('src.ui.fan_curve_editor.time.monotonic', return_value=104.99), \
+             patch.object(editor, 'restore_after_test') as mock_restore:
+            editor.update_test_countdown()
+            mock_restore.assert_called_once_with("CPU", "profile")
+    
+    def test_fan_test_reuses_countdown_timer(self, qapp):
+        """Test repeated fan tests restart one timer instead of adding more."""
+        from PyQt6.QtCore import QTimer
+        editor = FanCurveEditor()
+        timer = editor.test_countdown_timer
+        timers_before = len(editor.findChildren(QTimer))
+        
+        editor.asusctl = Mock()
+        editor.asusctl.set_fan_curve.return_value = (True, "")
+        with patch('src.ui.fan_curve_editor.QMessageBox') as mock_box:
+            mock_box.question.return_value = mock_box.StandardButton.Yes
+            for _ in range(2):
+                editor.test_fan()
+                assert timer.isActive()
+                editor.restore_after_test("CPU", None)
+                assert not timer.isActive()
+        
+        assert editor.test_countdown_timer is timer
+        assert len(editor.findChildren(QTimer)) == timers_before
+    
+    def test_fan_test_label_follows_duration(self, qapp):
+        """Test the Test Fan button text is built from TEST_FAN_SECONDS."""
+        with patch.object(FanCurveEditor, 'TEST_FAN_SECONDS', 8):
+            editor = FanCurveEditor()
+            
+            assert editor.test_fan_btn.text() == "Test Fan (100% for 8s)"